@@ -0,0 +1,26 @@
+"""Order listing indexes
+
+Revision ID: 3f9c2b7d41e8
+Revises: a0cd044b5386
+Create Date: 2026-10-17 10:12:41.508113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2b7d41e8'
+down_revision = 'a0cd044b5386'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_orders_supplier_status_created', 'orders', ['supplier_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_orders_consumer_created', 'orders', ['consumer_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_consumer_created', table_name='orders')
+    op.drop_index('ix_orders_supplier_status_created', table_name='orders')
@@ -0,0 +1,24 @@
+"""Add supplier catalog version
+
+Revision ID: 5a9f3e1b7c42
+Revises: e2d7b5a1c630
+Create Date: 2026-10-17 17:05:12.640187
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a9f3e1b7c42'
+down_revision = 'e2d7b5a1c630'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('suppliers', sa.Column('catalog_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('suppliers', 'catalog_version')
@@ -0,0 +1,36 @@
+"""Persist order totals and item counts
+
+Revision ID: 8b1e6d0c9a27
+Revises: 3f9c2b7d41e8
+Create Date: 2026-10-17 11:03:18.224509
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1e6d0c9a27'
+down_revision = '3f9c2b7d41e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('orders', sa.Column('total_amount', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False))
+    op.add_column('orders', sa.Column('item_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill existing orders from their items
+    op.execute(
+        """
+        UPDATE orders SET
+            total_amount = COALESCE(
+                (SELECT SUM(order_items.subtotal) FROM order_items WHERE order_items.order_id = orders.id), 0
+            ),
+            item_count = (SELECT COUNT(*) FROM order_items WHERE order_items.order_id = orders.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('orders', 'item_count')
+    op.drop_column('orders', 'total_amount')
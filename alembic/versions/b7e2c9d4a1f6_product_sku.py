@@ -0,0 +1,26 @@
+"""Add supplier-scoped product SKU
+
+Revision ID: b7e2c9d4a1f6
+Revises: 9d3c6a2f8e15
+Create Date: 2026-10-17 19:26:48.105372
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c9d4a1f6'
+down_revision = '9d3c6a2f8e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('products', sa.Column('sku', sa.String(), nullable=True))
+    op.create_index('uq_products_supplier_sku', 'products', ['supplier_id', 'sku'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_products_supplier_sku', table_name='products')
+    op.drop_column('products', 'sku')
@@ -0,0 +1,91 @@
+"""Add revenue rollup tables
+
+Revision ID: c4e1a7f2d9b3
+Revises: 8b1e6d0c9a27
+Create Date: 2026-10-17 15:42:07.318842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e1a7f2d9b3'
+down_revision = '8b1e6d0c9a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('revenue_rollups',
+    sa.Column('supplier_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('consumer_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['consumer_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ),
+    sa.PrimaryKeyConstraint('supplier_id', 'day', 'product_id', 'consumer_id')
+    )
+    op.create_table('product_rollups',
+    sa.Column('supplier_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ),
+    sa.PrimaryKeyConstraint('supplier_id', 'day', 'product_id')
+    )
+    op.create_table('order_rollups',
+    sa.Column('supplier_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('consumer_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['consumer_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ),
+    sa.PrimaryKeyConstraint('supplier_id', 'day', 'consumer_id')
+    )
+    # Backfill from existing accepted/completed orders
+    op.execute(
+        """
+        INSERT INTO revenue_rollups (supplier_id, day, product_id, consumer_id, quantity, revenue, order_count)
+        SELECT orders.supplier_id, DATE(orders.created_at), order_items.product_id, orders.consumer_id,
+               SUM(order_items.quantity), SUM(order_items.subtotal), COUNT(DISTINCT orders.id)
+        FROM orders JOIN order_items ON order_items.order_id = orders.id
+        WHERE orders.status IN ('ACCEPTED', 'COMPLETED')
+        GROUP BY orders.supplier_id, DATE(orders.created_at), order_items.product_id, orders.consumer_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO product_rollups (supplier_id, day, product_id, quantity, revenue, order_count)
+        SELECT orders.supplier_id, DATE(orders.created_at), order_items.product_id,
+               SUM(order_items.quantity), SUM(order_items.subtotal), COUNT(DISTINCT orders.id)
+        FROM orders JOIN order_items ON order_items.order_id = orders.id
+        WHERE orders.status IN ('ACCEPTED', 'COMPLETED')
+        GROUP BY orders.supplier_id, DATE(orders.created_at), order_items.product_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO order_rollups (supplier_id, day, consumer_id, quantity, revenue, order_count)
+        SELECT orders.supplier_id, DATE(orders.created_at), orders.consumer_id,
+               SUM(order_items.quantity), SUM(order_items.subtotal), COUNT(DISTINCT orders.id)
+        FROM orders JOIN order_items ON order_items.order_id = orders.id
+        WHERE orders.status IN ('ACCEPTED', 'COMPLETED')
+        GROUP BY orders.supplier_id, DATE(orders.created_at), orders.consumer_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('order_rollups')
+    op.drop_table('product_rollups')
+    op.drop_table('revenue_rollups')
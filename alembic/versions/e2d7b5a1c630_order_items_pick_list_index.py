@@ -0,0 +1,24 @@
+"""Order items covering index for pick lists
+
+Revision ID: e2d7b5a1c630
+Revises: c4e1a7f2d9b3
+Create Date: 2026-10-17 16:20:33.902415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2d7b5a1c630'
+down_revision = 'c4e1a7f2d9b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_order_items_order_product_quantity', 'order_items', ['order_id', 'product_id', 'quantity'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_order_items_order_product_quantity', table_name='order_items')
@@ -0,0 +1,32 @@
+"""Add supplier product listing indexes
+
+Revision ID: f1a8d3c5e972
+Revises: b7e2c9d4a1f6
+Create Date: 2026-10-17 20:11:35.902714
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a8d3c5e972'
+down_revision = 'b7e2c9d4a1f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_products_supplier_id_id', 'products', ['supplier_id', 'id'], unique=False)
+    op.create_index('ix_products_supplier_name', 'products', ['supplier_id', 'name', 'id'], unique=False)
+    op.create_index('ix_products_supplier_price', 'products', ['supplier_id', 'price', 'id'], unique=False)
+    op.create_index('ix_products_supplier_stock', 'products', ['supplier_id', 'stock_quantity', 'id'], unique=False)
+    op.create_index('ix_products_supplier_updated', 'products', ['supplier_id', 'updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_supplier_updated', table_name='products')
+    op.drop_index('ix_products_supplier_stock', table_name='products')
+    op.drop_index('ix_products_supplier_price', table_name='products')
+    op.drop_index('ix_products_supplier_name', table_name='products')
+    op.drop_index('ix_products_supplier_id_id', table_name='products')
@@ -0,0 +1,42 @@
+import os
+from fastapi import APIRouter, Depends
+from app.core import hashing
+from app.core.catalog import catalog_cache
+from app.core.config import settings
+from app.core.dependencies import require_admin_token
+from app.core.principals import principal_cache
+from app.core.security import token_cache
+from app.db.pool import pool_stats
+from app.db.replicas import replicas
+from app.db.session import engine, async_engine
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """Get connection pool, cache and hashing metrics for this worker process."""
+    pools = {"primary": pool_stats(engine.pool)}
+    if async_engine is not None:
+        pools["primary-async"] = pool_stats(async_engine.sync_engine.pool)
+    for replica in replicas:
+        pools[replica.name] = dict(pool_stats(replica.pool), healthy=replica.healthy)
+    
+    return {
+        "pid": os.getpid(),
+        "pool_config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pre_ping": settings.DB_POOL_PRE_PING,
+        },
+        "pools": pools,
+        "caches": {
+            "principals": principal_cache.stats(),
+            "tokens": token_cache.stats(),
+            "catalogs": catalog_cache.stats(),
+        },
+        "password_hashing": hashing.stats(),
+    }
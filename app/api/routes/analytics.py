@@ -0,0 +1,69 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.replicas import get_read_db
+from app.core.dependencies import get_current_supplier_owner_or_manager
+from app.core.principals import Principal
+from app.models.models import OrderRollup, ProductRollup, RevenueRollup
+from app.schemas.schemas import RevenueBucket
+
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+
+
+@router.get("/revenue", response_model=List[RevenueBucket], response_model_exclude_none=True)
+async def get_revenue(
+    group_by: str = Query("day", pattern="^(day|product|consumer)$"),
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    product_id: Optional[int] = None,
+    consumer_id: Optional[int] = None,
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Revenue of accepted and completed orders by day, product or consumer (OWNER/MANAGER only).
+
+    Reads only the rollup tables, so a year of history is a range scan over
+    at most one row per day and product (or consumer). Days are order creation
+    dates (UTC) and both bounds are inclusive. ``order_count`` is the number
+    of orders; when grouping by or filtering on product it counts the orders
+    containing that product.
+    """
+    by_product = group_by == "product" or product_id is not None
+    by_consumer = group_by == "consumer" or consumer_id is not None
+    # Use the coarsest table that has the needed keys; order counts only add
+    # up across products in OrderRollup.
+    if by_product and by_consumer:
+        rollup = RevenueRollup
+    elif by_product:
+        rollup = ProductRollup
+    else:
+        rollup = OrderRollup
+    label = "day" if group_by == "day" else f"{group_by}_id"
+    key = getattr(rollup, label)
+
+    query = (
+        select(
+            key.label(label),
+            func.sum(rollup.quantity).label("quantity"),
+            func.sum(rollup.revenue).label("revenue"),
+            func.sum(rollup.order_count).label("order_count"),
+        )
+        .where(rollup.supplier_id == current_user.supplier_id)
+        .group_by(key)
+        .having(func.sum(rollup.order_count) > 0)
+        .order_by(key)
+    )
+    if date_from:
+        query = query.where(rollup.day >= date_from)
+    if date_to:
+        query = query.where(rollup.day <= date_to)
+    if product_id is not None:
+        query = query.where(rollup.product_id == product_id)
+    if consumer_id is not None:
+        query = query.where(rollup.consumer_id == consumer_id)
+
+    rows = (await db.execute(query)).mappings().all()
+    return [RevenueBucket(**row) for row in rows]
@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.db.replicas import get_read_db
+from app.core.security import create_access_token
+from app.core.hashing import hash_password, check_password
 from app.core.dependencies import get_current_user
+from app.core.principals import Principal
 from app.models.models import User, Supplier, UserRole, AuditLog
 from app.schemas.schemas import (
     SupplierRegister, ConsumerRegister, UserLogin, Token, 
@@ -14,106 +18,111 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
 @router.post("/register/supplier", response_model=Token, status_code=status.HTTP_201_CREATED)
-def register_supplier(
+async def register_supplier(
     data: SupplierRegister,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register a new supplier with an OWNER user."""
-    existing_user = db.query(User).filter(User.email == data.owner_email).first()
+    existing_user = await db.scalar(select(User).where(User.email == data.owner_email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
+    password_hash = await hash_password(data.password)
+    
     supplier = Supplier(
         company_name=data.company_name,
         is_active=True
     )
     db.add(supplier)
-    db.flush()
+    await db.flush()
+    supplier_id = supplier.id
     
     owner = User(
         email=data.owner_email,
-        password_hash=get_password_hash(data.password),
+        password_hash=password_hash,
         full_name=data.owner_full_name,
         role=UserRole.OWNER,
-        supplier_id=supplier.id
+        supplier_id=supplier_id
     )
     db.add(owner)
-    db.commit()
-    db.refresh(owner)
+    await db.commit()
+    owner_id = owner.id
     
     audit = AuditLog(
-        user_id=owner.id,
+        user_id=owner_id,
         action="SUPPLIER_REGISTERED",
         entity_type="SUPPLIER",
-        entity_id=supplier.id
+        entity_id=supplier_id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     access_token = create_access_token(
-        data={"sub": str(owner.id), "role": owner.role.value, "supplier_id": owner.supplier_id}
+        data={"sub": str(owner_id), "role": UserRole.OWNER.value, "supplier_id": supplier_id}
     )
     
     return Token(access_token=access_token)
 
 
 @router.post("/register/consumer", response_model=Token, status_code=status.HTTP_201_CREATED)
-def register_consumer(
+async def register_consumer(
     data: ConsumerRegister,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register a new consumer user."""
-    existing_user = db.query(User).filter(User.email == data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
+    password_hash = await hash_password(data.password)
+    
     consumer = User(
         email=data.email,
-        password_hash=get_password_hash(data.password),
+        password_hash=password_hash,
         full_name=data.full_name,
         role=UserRole.CONSUMER,
         restaurant_name=data.restaurant_name
     )
     db.add(consumer)
-    db.commit()
-    db.refresh(consumer)
+    await db.commit()
+    consumer_id = consumer.id
     
     audit = AuditLog(
-        user_id=consumer.id,
+        user_id=consumer_id,
         action="CONSUMER_REGISTERED",
         entity_type="USER",
-        entity_id=consumer.id
+        entity_id=consumer_id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     access_token = create_access_token(
-        data={"sub": str(consumer.id), "role": consumer.role.value}
+        data={"sub": str(consumer_id), "role": UserRole.CONSUMER.value}
     )
     
     return Token(access_token=access_token)
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     data: UserLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Login and get access token."""
-    user = db.query(User).filter(User.email == data.email).first()
+    user = await db.scalar(select(User).where(User.email == data.email))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
-    if not verify_password(data.password, user.password_hash):
+    if not await check_password(data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -129,9 +138,9 @@ def login(
 
 
 @router.get("/me", response_model=UserMeResponse)
-def get_me(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_me(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get current user's information."""
     response = UserMeResponse(
@@ -145,7 +154,7 @@ def get_me(
     )
     
     if current_user.supplier_id:
-        supplier = db.query(Supplier).filter(Supplier.id == current_user.supplier_id).first()
+        supplier = await db.scalar(select(Supplier).where(Supplier.id == current_user.supplier_id))
         if supplier:
             response.supplier_info = SupplierResponse.model_validate(supplier)
     
@@ -1,9 +1,13 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from datetime import datetime
 from app.db.session import get_db
+from app.db.replicas import get_read_db
 from app.core.dependencies import get_current_user
+from app.core.principals import Principal
 from app.models.models import (
     User, Order, Complaint, ComplaintStatus, UserRole, AuditLog
 )
@@ -17,11 +21,11 @@ router = APIRouter(prefix="/api", tags=["complaints"])
 
 
 @router.post("/orders/{order_id}/complaint", response_model=ComplaintResponse, status_code=status.HTTP_201_CREATED)
-def create_complaint(
+async def create_complaint(
     order_id: int,
     data: ComplaintCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a complaint for an order (CONSUMER only)."""
     if current_user.role != UserRole.CONSUMER:
@@ -30,7 +34,7 @@ def create_complaint(
             detail="Only consumers can create complaints"
         )
     
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.scalar(select(Order).where(Order.id == order_id))
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -43,10 +47,10 @@ def create_complaint(
             detail="You can only create complaints for your own orders"
         )
     
-    existing_complaint = db.query(Complaint).filter(
+    existing_complaint = await db.scalar(select(Complaint).where(
         Complaint.order_id == order_id,
         Complaint.status != ComplaintStatus.RESOLVED
-    ).first()
+    ))
     
     if existing_complaint:
         raise HTTPException(
@@ -61,8 +65,7 @@ def create_complaint(
         status=ComplaintStatus.OPEN
     )
     db.add(complaint)
-    db.commit()
-    db.refresh(complaint)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -71,22 +74,25 @@ def create_complaint(
         entity_id=complaint.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return complaint
 
 
 @router.get("/complaints", response_model=List[ComplaintWithDetailsResponse])
-def get_complaints(
+async def get_complaints(
     status_filter: Optional[ComplaintStatus] = Query(None, alias="status"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get complaints for current user."""
-    query = db.query(Complaint)
+    query = select(Complaint).options(
+        selectinload(Complaint.raised_by_user),
+        selectinload(Complaint.assigned_to_user)
+    )
     
     if current_user.role == UserRole.CONSUMER:
-        query = query.filter(Complaint.raised_by_user_id == current_user.id)
+        query = query.where(Complaint.raised_by_user_id == current_user.id)
     else:
         if not current_user.supplier_id:
             raise HTTPException(
@@ -94,24 +100,24 @@ def get_complaints(
                 detail="User is not associated with a supplier"
             )
         
-        query = query.join(Order).filter(Order.supplier_id == current_user.supplier_id)
+        query = query.join(Order).where(Order.supplier_id == current_user.supplier_id)
     
     if status_filter:
-        query = query.filter(Complaint.status == status_filter)
+        query = query.where(Complaint.status == status_filter)
     
-    complaints = query.all()
+    complaints = (await db.scalars(query)).all()
     return complaints
 
 
 @router.put("/complaints/{complaint_id}", response_model=ComplaintResponse)
-def update_complaint(
+async def update_complaint(
     complaint_id: int,
     data: ComplaintUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Update complaint status."""
-    complaint = db.query(Complaint).filter(Complaint.id == complaint_id).first()
+    complaint = await db.scalar(select(Complaint).where(Complaint.id == complaint_id))
     if not complaint:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -139,7 +145,7 @@ def update_complaint(
             
     else:
         # Supplier staff logic
-        order = db.query(Order).filter(Order.id == complaint.order_id).first()
+        order = await db.scalar(select(Order).where(Order.id == complaint.order_id))
         if not order or order.supplier_id != current_user.supplier_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -181,7 +187,7 @@ def update_complaint(
             complaint.resolved_at = datetime.utcnow()
     
     if data.assigned_to_user_id is not None:
-        assigned_user = db.query(User).filter(User.id == data.assigned_to_user_id).first()
+        assigned_user = await db.scalar(select(User).where(User.id == data.assigned_to_user_id))
         if not assigned_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -196,8 +202,7 @@ def update_complaint(
         
         complaint.assigned_to_user_id = data.assigned_to_user_id
     
-    db.commit()
-    db.refresh(complaint)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -206,6 +211,6 @@ def update_complaint(
         entity_id=complaint.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return complaint
\ No newline at end of file
@@ -1,10 +1,14 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from app.db.session import get_db
+from app.db.replicas import get_read_db
 from app.core.dependencies import get_current_user
+from app.core.principals import Principal
 from app.models.models import (
-    User, Link, Message, UserRole
+    Link, Message, UserRole
 )
 from app.schemas.schemas import (
     MessageCreate, MessageResponse
@@ -14,9 +18,9 @@ from app.schemas.schemas import (
 router = APIRouter(prefix="/api/messages", tags=["messages"])
 
 
-def check_link_access(link_id: int, current_user: User, db: Session) -> Link:
+async def check_link_access(link_id: int, current_user: Principal, db: AsyncSession) -> Link:
     """Check if user has access to this link."""
-    link = db.query(Link).filter(Link.id == link_id).first()
+    link = await db.scalar(select(Link).where(Link.id == link_id))
     if not link:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -40,30 +44,33 @@ def check_link_access(link_id: int, current_user: User, db: Session) -> Link:
 
 
 @router.get("/{link_id}", response_model=List[MessageResponse])
-def get_messages(
+async def get_messages(
     link_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all messages for a link."""
-    check_link_access(link_id, current_user, db)
+    await check_link_access(link_id, current_user, db)
     
-    messages = db.query(Message).filter(
-        Message.link_id == link_id
-    ).order_by(Message.created_at).all()
+    messages = (await db.scalars(
+        select(Message)
+        .options(selectinload(Message.sender))
+        .where(Message.link_id == link_id)
+        .order_by(Message.created_at)
+    )).all()
     
     return messages
 
 
 @router.post("/{link_id}", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def send_message(
+async def send_message(
     link_id: int,
     data: MessageCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Send a message in a link chat."""
-    check_link_access(link_id, current_user, db)
+    await check_link_access(link_id, current_user, db)
     
     message = Message(
         link_id=link_id,
@@ -71,8 +78,8 @@ def send_message(
         content=data.content
     )
     db.add(message)
-    db.commit()
-    db.refresh(message)
+    await db.commit()
+    await db.refresh(message, attribute_names=["sender"])
     
     return message
 
@@ -1,44 +1,168 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import csv
+import json
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+import io
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import distinct, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from decimal import Decimal
 from app.db.session import get_db
+from app.db.replicas import get_read_db
+from app.db.rollups import record_status_changes
+from app.core.catalog import bump_catalog_version
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.uploads import body_lines
 from app.core.dependencies import (
     get_current_user,
     get_current_consumer,
-    get_current_supplier_owner_or_manager
+    get_current_supplier_owner_or_manager,
+    get_current_supplier_staff
 )
+from app.core.principals import Principal
 from app.models.models import (
     User, Order, OrderItem, Product, Link, LinkStatus, 
-    OrderStatus, UserRole, AuditLog
+    OrderStatus, UserRole, AuditLog, Complaint
 )
 from app.schemas.schemas import (
-    OrderCreate, OrderResponse, OrderWithDetailsResponse, 
-    OrderStatusUpdate, ProductResponse
+    OrderCreate, OrderResponse, OrderWithDetailsResponse, OrderSummaryResponse,
+    OrderStatusUpdate, ProductResponse, OrderBulkStatusUpdate, OrderBulkStatusResponse,
+    OrderImportResponse, OrderCountsResponse, PickListItem
 )
 
 
 router = APIRouter(prefix="/api/orders", tags=["orders"])
 
 
-@router.post("", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
-def create_order(
-    data: OrderCreate,
-    current_user: User = Depends(get_current_consumer),
-    db: Session = Depends(get_db)
-):
-    """Create a new order (CONSUMER only)."""
-    link = db.query(Link).filter(
-        Link.supplier_id == data.supplier_id,
-        Link.consumer_id == current_user.id,
+def _order_query(with_items: bool):
+    """Select orders with the relations the order responses read.
+    
+    Orders are joined to supplier and consumer, with ``has_complaint`` as a
+    correlated EXISTS; ``with_items`` adds one select-in statement for the
+    items and their products. The statement count never depends on result size.
+    """
+    has_complaint = select(Complaint.id).where(Complaint.order_id == Order.id).exists()
+    query = select(Order, has_complaint.label("has_complaint")).options(
+        joinedload(Order.supplier),
+        joinedload(Order.consumer)
+    )
+    if with_items:
+        query = query.options(selectinload(Order.items).joinedload(OrderItem.product))
+    return query
+
+
+def _filter_orders(query, current_user: Principal, status_filter, date_from, date_to):
+    """Restrict an order query to the user's own orders and the given filters."""
+    if current_user.role == UserRole.CONSUMER:
+        query = query.where(Order.consumer_id == current_user.id)
+    else:
+        if not current_user.supplier_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User is not associated with a supplier"
+            )
+        query = query.where(Order.supplier_id == current_user.supplier_id)
+    
+    if status_filter:
+        query = query.where(Order.status == status_filter)
+    if date_from:
+        query = query.where(Order.created_at >= date_from)
+    if date_to:
+        query = query.where(Order.created_at < date_to)
+    return query
+
+
+async def _require_approved_link(db: AsyncSession, supplier_id: int, consumer_id: int) -> None:
+    link = await db.scalar(select(Link).where(
+        Link.supplier_id == supplier_id,
+        Link.consumer_id == consumer_id,
         Link.status == LinkStatus.APPROVED
-    ).first()
+    ))
     
     if not link:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You must have an approved link with this supplier to place an order"
         )
+
+
+def _line_error(product: Optional[Product], product_id: int, quantity: int) -> Optional[str]:
+    """Return why an order line for ``product`` cannot be placed, or None."""
+    if not product:
+        return f"Product {product_id} not found"
+    if not product.is_active:
+        return f"Product {product.name} is not available"
+    if quantity < product.min_order_quantity:
+        return f"Product {product.name} requires minimum order quantity of {product.min_order_quantity}"
+    if quantity > product.stock_quantity:
+        return f"Product {product.name} has insufficient stock (available: {product.stock_quantity})"
+    return None
+
+
+ALLOWED_STATUS_UPDATES = [OrderStatus.ACCEPTED, OrderStatus.REJECTED, OrderStatus.COMPLETED]
+
+
+async def _reserve_stock(db: AsyncSession, supplier_id: int, order_ids: List[int]) -> list:
+    """Take the stock for every line of ``order_ids`` in one conditional UPDATE.
+    
+    Quantities are summed per product and each product is decremented only
+    where ``stock_quantity >= quantity``. If any product falls short, the
+    session is rolled back and the short lines are returned (name, available,
+    requested); an empty list means all stock was taken and the supplier's
+    catalog version was bumped.
+    """
+    lines = (
+        select(OrderItem.product_id, func.sum(OrderItem.quantity).label("quantity"))
+        .where(OrderItem.order_id.in_(order_ids))
+        .group_by(OrderItem.product_id)
+        .subquery()
+    )
+    demand = (
+        select(Product.id, Product.name, Product.stock_quantity, lines.c.quantity)
+        .join(lines, Product.id == lines.c.product_id)
+        .order_by(Product.id)
+    )
+    # Lock the rows in id order first so concurrent acceptances sharing
+    # products queue up instead of deadlocking (no-op on SQLite).
+    locked = (await db.execute(demand.with_for_update(of=Product))).all()
+    
+    result = await db.execute(
+        update(Product)
+        .where(Product.id == lines.c.product_id, Product.stock_quantity >= lines.c.quantity)
+        .values(stock_quantity=Product.stock_quantity - lines.c.quantity)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == len(locked):
+        await bump_catalog_version(db, supplier_id)
+        return []
+    
+    await db.rollback()
+    rows = (await db.execute(demand)).all()
+    return [
+        (row.name, row.stock_quantity, row.quantity)
+        for row in rows if row.stock_quantity < row.quantity
+    ]
+
+
+def _order_response(schema, order: Order, has_complaint: bool):
+    response = schema.model_validate(order)
+    response.has_complaint = has_complaint
+    return response
+
+
+@router.post("", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
+async def create_order(
+    data: OrderCreate,
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a new order (CONSUMER only)."""
+    await _require_approved_link(db, data.supplier_id, current_user.id)
     
     if not data.items:
         raise HTTPException(
@@ -47,10 +171,10 @@ def create_order(
         )
     
     product_ids = [item.product_id for item in data.items]
-    products = db.query(Product).filter(
+    products = (await db.scalars(select(Product).where(
         Product.id.in_(product_ids),
         Product.supplier_id == data.supplier_id
-    ).all()
+    ))).all()
     
     if len(products) != len(product_ids):
         raise HTTPException(
@@ -61,55 +185,47 @@ def create_order(
     product_map = {p.id: p for p in products}
     
     for item in data.items:
-        product = product_map.get(item.product_id)
-        if not product:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Product {item.product_id} not found"
-            )
-        
-        if not product.is_active:
+        error = _line_error(product_map.get(item.product_id), item.product_id, item.quantity)
+        if error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Product {product.name} is not available"
-            )
-        
-        if item.quantity < product.min_order_quantity:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Product {product.name} requires minimum order quantity of {product.min_order_quantity}"
-            )
-        
-        if item.quantity > product.stock_quantity:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Product {product.name} has insufficient stock (available: {product.stock_quantity})"
+                detail=error
             )
     
+    item_rows = []
+    for item in data.items:
+        product = product_map[item.product_id]
+        item_rows.append({
+            "product_id": product.id,
+            "quantity": item.quantity,
+            "unit_price": product.price,
+            "subtotal": Decimal(str(item.quantity)) * product.price
+        })
+    
+    # One transaction: the order row, all lines in a single multi-row INSERT
+    # ... RETURNING, and the audit row.
     order = Order(
         supplier_id=data.supplier_id,
         consumer_id=current_user.id,
         created_by_user_id=current_user.id,
-        status=OrderStatus.PENDING
+        status=OrderStatus.PENDING,
+        total_amount=sum((row["subtotal"] for row in item_rows), Decimal("0")),
+        item_count=len(item_rows)
     )
     db.add(order)
-    db.flush()
-    
-    for item in data.items:
-        product = product_map[item.product_id]
-        subtotal = Decimal(str(item.quantity)) * product.price
-        
-        order_item = OrderItem(
-            order_id=order.id,
-            product_id=item.product_id,
-            quantity=item.quantity,
-            unit_price=product.price,
-            subtotal=subtotal
-        )
-        db.add(order_item)
+    await db.flush()
     
-    db.commit()
-    db.refresh(order)
+    for row in item_rows:
+        row["order_id"] = order.id
+    # Product ids are unique per order (checked above), so RETURNING rows are
+    # matched back by product id rather than paying for sort_by_parameter_order,
+    # which SQLite can only honour with one INSERT per row.
+    items = (await db.scalars(insert(OrderItem).returning(OrderItem), item_rows)).all()
+    position = {product_id: index for index, product_id in enumerate(product_ids)}
+    items = sorted(items, key=lambda order_item: position[order_item.product_id])
+    for order_item in items:
+        set_committed_value(order_item, "product", product_map[order_item.product_id])
+    set_committed_value(order, "items", items)
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -118,77 +234,395 @@ def create_order(
         entity_id=order.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return order
 
 
-@router.get("", response_model=List[OrderWithDetailsResponse])
-def get_orders(
+async def _import_lines(request: Request, file_format: str) -> AsyncIterator[Tuple[int, object]]:
+    """Parse import lines into ``(line_no, (order_ref, product_id, quantity))``.
+    
+    Unparseable lines yield ``(line_no, error_message)`` instead.
+    """
+    columns = None
+    line_no = 0
+    async for line in body_lines(request):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            if file_format == "csv":
+                values = next(csv.reader([line]))
+                if columns is None:
+                    columns = [value.strip() for value in values]
+                    if not {"product_id", "quantity"} <= set(columns):
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="CSV header must include product_id and quantity columns"
+                        )
+                    continue
+                record = dict(zip(columns, values))
+            else:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("not an object")
+            order_ref = record.get("order_ref")
+            yield line_no, (
+                str(order_ref) if order_ref not in (None, "") else None,
+                int(record["product_id"]),
+                int(record["quantity"])
+            )
+        except (KeyError, ValueError, TypeError):
+            yield line_no, "Line must provide integer product_id and quantity"
+
+
+async def _write_import_batch(
+    db: AsyncSession,
+    batch: list,
+    supplier_id: int,
+    consumer_id: int,
+    report: dict
+) -> None:
+    """Validate a batch of complete orders against the catalog and write them in one transaction."""
+    product_ids = {product_id for _, lines in batch for _, product_id, _ in lines}
+    products = {
+        product.id: product for product in (await db.scalars(select(Product).where(
+            Product.id.in_(product_ids),
+            Product.supplier_id == supplier_id
+        ))).all()
+    }
+    
+    orders = []
+    for order_ref, lines in batch:
+        item_rows = []
+        seen = set()
+        for line_no, product_id, quantity in lines:
+            error = _line_error(products.get(product_id), product_id, quantity)
+            if not error and product_id in seen:
+                error = f"Product {product_id} appears more than once in this order"
+            if error:
+                _import_error(report, line_no, order_ref, error)
+                continue
+            seen.add(product_id)
+            product = products[product_id]
+            item_rows.append({
+                "product_id": product_id,
+                "quantity": quantity,
+                "unit_price": product.price,
+                "subtotal": Decimal(str(quantity)) * product.price
+            })
+        if item_rows:
+            order = Order(
+                supplier_id=supplier_id,
+                consumer_id=consumer_id,
+                created_by_user_id=consumer_id,
+                status=OrderStatus.PENDING,
+                total_amount=sum((row["subtotal"] for row in item_rows), Decimal("0")),
+                item_count=len(item_rows)
+            )
+            orders.append((order, item_rows))
+    if not orders:
+        return
+    
+    db.add_all([order for order, _ in orders])
+    await db.flush()
+    all_rows = []
+    for order, item_rows in orders:
+        for row in item_rows:
+            row["order_id"] = order.id
+        all_rows.extend(item_rows)
+    await db.execute(insert(OrderItem), all_rows)
+    await db.execute(insert(AuditLog), [
+        {"user_id": consumer_id, "action": "ORDER_CREATED", "entity_type": "ORDER", "entity_id": order.id}
+        for order, _ in orders
+    ])
+    await db.commit()
+    
+    report["order_ids"].extend(order.id for order, _ in orders)
+    report["lines_imported"] += len(all_rows)
+
+
+def _import_error(report: dict, line_no: int, order_ref: Optional[str], detail: str) -> None:
+    report["lines_rejected"] += 1
+    if len(report["errors"]) < settings.ORDER_IMPORT_MAX_ERRORS:
+        report["errors"].append({"line": line_no, "order_ref": order_ref, "detail": detail})
+    else:
+        report["errors_truncated"] = True
+
+
+@router.post("/import", response_model=OrderImportResponse, status_code=status.HTTP_201_CREATED)
+async def import_orders(
+    request: Request,
+    supplier_id: int = Query(...),
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_db)
+):
+    """Import orders from a CSV or NDJSON request body (CONSUMER only).
+    
+    Each line is ``product_id, quantity`` with an optional ``order_ref``;
+    consecutive lines sharing an ``order_ref`` form one order (no ref: one
+    order). The body is parsed as it streams in and written every
+    ORDER_IMPORT_BATCH_LINES lines in its own transaction, so memory stays
+    bounded: an order longer than ORDER_IMPORT_MAX_ORDER_LINES is rejected
+    whole, and a ref is only recognised as repeated within the last
+    ORDER_IMPORT_REF_WINDOW orders. Invalid lines are skipped and listed in
+    the error report.
+    """
+    await _require_approved_link(db, supplier_id, current_user.id)
+    if file_format is None:
+        content_type = request.headers.get("content-type", "")
+        file_format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+    
+    max_lines = settings.ORDER_IMPORT_MAX_ORDER_LINES
+    report = {"order_ids": [], "lines_imported": 0, "lines_rejected": 0, "errors": [], "errors_truncated": False}
+    batch, batch_lines = [], 0
+    current_ref, current_lines, current_rejected = None, [], False
+    recent_refs = OrderedDict()
+    
+    async for line_no, parsed in _import_lines(request, file_format):
+        if isinstance(parsed, str):
+            _import_error(report, line_no, None, parsed)
+            continue
+        order_ref, product_id, quantity = parsed
+        if order_ref != current_ref or not (current_lines or current_rejected):
+            if order_ref in recent_refs:
+                _import_error(report, line_no, order_ref, "Lines of one order_ref must be consecutive")
+                continue
+            if current_lines:
+                batch.append((current_ref, current_lines))
+                batch_lines += len(current_lines)
+            if current_lines or current_rejected:
+                recent_refs[current_ref] = None
+                if len(recent_refs) > settings.ORDER_IMPORT_REF_WINDOW:
+                    recent_refs.popitem(last=False)
+            current_ref, current_lines, current_rejected = order_ref, [], False
+            if batch_lines >= settings.ORDER_IMPORT_BATCH_LINES:
+                await _write_import_batch(db, batch, supplier_id, current_user.id, report)
+                batch, batch_lines = [], 0
+        if current_rejected:
+            report["lines_rejected"] += 1
+            continue
+        if len(current_lines) >= max_lines:
+            # Reported once; the order's buffered and remaining lines only count.
+            _import_error(report, line_no, order_ref, f"Order has more than {max_lines} lines")
+            report["lines_rejected"] += len(current_lines)
+            current_lines, current_rejected = [], True
+            continue
+        current_lines.append((line_no, product_id, quantity))
+    
+    if current_lines:
+        batch.append((current_ref, current_lines))
+    if batch:
+        await _write_import_batch(db, batch, supplier_id, current_user.id, report)
+    
+    report["errors"].sort(key=lambda error: error["line"])
+    return OrderImportResponse(orders_created=len(report["order_ids"]), **report)
+
+
+@router.get("", response_model=List[OrderSummaryResponse])
+async def get_orders(
+    response: Response,
     status_filter: Optional[OrderStatus] = Query(None, alias="status"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[str] = Query(None, description="Cursor: orders older than this one"),
+    after: Optional[str] = Query(None, description="Cursor: orders newer than this one"),
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get orders for current user (consumer or supplier staff)."""
-    query = db.query(Order)
+    """Get orders for current user (consumer or supplier staff), newest first.
     
-    if current_user.role == UserRole.CONSUMER:
-        query = query.filter(Order.consumer_id == current_user.id)
+    Keyset-paginated on (created_at, id). When more orders follow, the
+    ``X-Next-Cursor`` header holds the cursor to pass as ``before`` (or as
+    ``after`` when paging with ``after``) for the next page.
+    """
+    if before and after:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either before or after, not both"
+        )
+    
+    query = _filter_orders(
+        _order_query(with_items=False), current_user, status_filter, date_from, date_to
+    )
+    
+    sort_key = tuple_(Order.created_at, Order.id)
+    if after:
+        query = query.where(sort_key > decode_cursor(after, datetime, int))
+        query = query.order_by(Order.created_at.asc(), Order.id.asc())
     else:
-        if not current_user.supplier_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User is not associated with a supplier"
-            )
-        query = query.filter(Order.supplier_id == current_user.supplier_id)
+        if before:
+            query = query.where(sort_key < decode_cursor(before, datetime, int))
+        query = query.order_by(Order.created_at.desc(), Order.id.desc())
     
-    if status_filter:
-        query = query.filter(Order.status == status_filter)
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    if after:
+        rows.reverse()
+    
+    return [_order_response(OrderSummaryResponse, order, has_complaint) for order, has_complaint in rows]
+
+
+EXPORT_COLUMNS = [
+    "order_id", "created_at", "status", "supplier_id", "consumer_id", "order_total",
+    "product_id", "product_name", "unit", "quantity", "unit_price", "subtotal"
+]
+EXPORT_BATCH_ROWS = 1000
+
+
+async def _export_rows(db: AsyncSession, query, file_format: str) -> AsyncIterator[bytes]:
+    """Stream ``query`` as CSV/NDJSON, one server-side cursor batch per chunk."""
+    result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_ROWS))
+    try:
+        if file_format == "csv":
+            yield (",".join(EXPORT_COLUMNS) + "\r\n").encode()
+        async for rows in result.partitions(EXPORT_BATCH_ROWS):
+            buffer = io.StringIO()
+            if file_format == "csv":
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow(
+                        value.isoformat() if isinstance(value, datetime) else
+                        value.value if isinstance(value, OrderStatus) else value
+                        for value in row
+                    )
+            else:
+                for row in rows:
+                    record = dict(zip(EXPORT_COLUMNS, row))
+                    record["created_at"] = record["created_at"].isoformat()
+                    buffer.write(json.dumps(record, default=str))
+                    buffer.write("\n")
+            yield buffer.getvalue().encode()
+    finally:
+        await result.close()
+
+
+@router.get("/export")
+async def export_orders(
+    file_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    status_filter: Optional[OrderStatus] = Query(None, alias="status"),
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Export orders with their line items as CSV or NDJSON, one row per line item.
     
-    orders = query.all()
+    Rows are streamed from a server-side cursor in batches, so memory stays
+    flat however long the history is. The session stays open while the
+    response streams (dependencies with yield exit after the response on
+    this FastAPI version).
+    """
+    query = _filter_orders(
+        select(
+            Order.id, Order.created_at, Order.status, Order.supplier_id, Order.consumer_id,
+            Order.total_amount, OrderItem.product_id, Product.name, Product.unit,
+            OrderItem.quantity, OrderItem.unit_price, OrderItem.subtotal
+        )
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .order_by(Order.created_at, Order.id, OrderItem.id),
+        current_user, status_filter, date_from, date_to
+    )
+    media_type = "text/csv" if file_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_rows(db, query, file_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="orders.{file_format}"'}
+    )
+
+
+@router.get("/summary", response_model=OrderCountsResponse)
+async def get_order_counts(
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Count the current user's orders per status, for dashboards.
     
-    # Enrich with has_complaint flag manually if needed, or rely on model property if it exists
-    # The schema expects has_complaint. The model relationship is 'complaints'.
-    # We can map it in the response.
+    GET /api/orders is paginated, so its length is not the order count.
+    One GROUP BY over the same orders and filters.
+    """
+    rows = (await db.execute(_filter_orders(
+        select(Order.status, func.count()).group_by(Order.status),
+        current_user, None, date_from, date_to
+    ))).all()
+    by_status = {order_status: 0 for order_status in OrderStatus}
+    by_status.update(rows)
+    return OrderCountsResponse(total=sum(by_status.values()), by_status=by_status)
+
+
+@router.get("/pick-list", response_model=List[PickListItem])
+async def get_pick_list(
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    current_user: Principal = Depends(get_current_supplier_staff),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Total quantity per product, split by consumer, across ACCEPTED orders (supplier staff).
     
-    results = []
-    for o in orders:
-        has_complaint = len(o.complaints) > 0
-        # We need to construct the response object because has_complaint is not on the SQLAlchemy model directly as a boolean
-        # But Pydantic's from_attributes might fail if the attribute doesn't exist.
-        # Let's check OrderWithDetailsResponse definition.
-        
-        results.append(OrderWithDetailsResponse(
-            id=o.id,
-            supplier_id=o.supplier_id,
-            consumer_id=o.consumer_id,
-            status=o.status,
-            created_by_user_id=o.created_by_user_id,
-            created_at=o.created_at,
-            updated_at=o.updated_at,
-            items=o.items,
-            supplier=o.supplier,
-            consumer=o.consumer,
-            has_complaint=has_complaint,
-            total_amount=o.total_amount
-        ))
-        
-    return results
+    Accepted orders are the ones waiting for dispatch; ``from``/``to`` narrow
+    them by order creation time. One GROUP BY over the supplier/status order
+    index and the covering order_items index.
+    """
+    demand = _filter_orders(
+        select(
+            OrderItem.product_id,
+            Order.consumer_id,
+            func.sum(OrderItem.quantity).label("quantity"),
+            func.count(distinct(Order.id)).label("order_count")
+        )
+        .select_from(Order)
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .group_by(OrderItem.product_id, Order.consumer_id),
+        current_user, OrderStatus.ACCEPTED, date_from, date_to
+    ).subquery()
+    rows = (await db.execute(
+        select(demand, Product.name, Product.unit, Product.stock_quantity, User.restaurant_name)
+        .join(Product, Product.id == demand.c.product_id)
+        .join(User, User.id == demand.c.consumer_id)
+        .order_by(Product.name, Product.id, demand.c.quantity.desc(), demand.c.consumer_id)
+    )).all()
+    
+    # An order has one consumer, so per-consumer order counts add up per
+    # product. Plain dicts: the response model validates them once.
+    items = {}
+    for row in rows:
+        item = items.get(row.product_id)
+        if item is None:
+            item = items[row.product_id] = {
+                "product_id": row.product_id, "product_name": row.name, "unit": row.unit,
+                "stock_quantity": row.stock_quantity, "quantity": 0, "order_count": 0, "consumers": []
+            }
+        item["quantity"] += row.quantity
+        item["order_count"] += row.order_count
+        item["consumers"].append({
+            "consumer_id": row.consumer_id, "restaurant_name": row.restaurant_name,
+            "quantity": row.quantity, "order_count": row.order_count
+        })
+    return list(items.values())
 
 
 @router.get("/{order_id}", response_model=OrderWithDetailsResponse)
-def get_order(
+async def get_order(
     order_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get order details."""
-    order = db.query(Order).filter(Order.id == order_id).first()
-    if not order:
+    row = (await db.execute(_order_query(with_items=True).where(Order.id == order_id))).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found"
         )
+    order, has_complaint = row
     
     if current_user.role == UserRole.CONSUMER:
         if order.consumer_id != current_user.id:
@@ -203,35 +637,149 @@ def get_order(
                 detail="You can only view orders for your supplier"
             )
     
-    has_complaint = len(order.complaints) > 0
-    
-    response = OrderWithDetailsResponse(
-        id=order.id,
-        supplier_id=order.supplier_id,
-        consumer_id=order.consumer_id,
-        status=order.status,
-        created_by_user_id=order.created_by_user_id,
-        created_at=order.created_at,
-        updated_at=order.updated_at,
-        items=order.items,
-        supplier=order.supplier,
-        consumer=order.consumer,
-        has_complaint=has_complaint,
-        total_amount=order.total_amount
-    )
+    return _order_response(OrderWithDetailsResponse, order, has_complaint)
+
+
+@router.post("/bulk-status", response_model=OrderBulkStatusResponse)
+async def bulk_update_order_status(
+    data: OrderBulkStatusUpdate,
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
+):
+    """Move many orders to one status (OWNER/MANAGER only).
     
-    return response
+    Orders that cannot transition are reported individually and skipped;
+    the rest are updated in one transaction. Acceptances are granted in
+    request order while stock lasts, and the stock is taken per product in
+    aggregate.
+    """
+    if data.status not in ALLOWED_STATUS_UPDATES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status. Allowed: {[s.value for s in ALLOWED_STATUS_UPDATES]}"
+        )
+    
+    order_ids = list(dict.fromkeys(data.order_ids))
+    current = dict((await db.execute(
+        select(Order.id, Order.status).where(
+            Order.id.in_(order_ids),
+            Order.supplier_id == current_user.supplier_id
+        )
+    )).all())
+    
+    failures = {}
+    for order_id in order_ids:
+        if order_id not in current:
+            failures[order_id] = "Order not found"
+        elif current[order_id] == OrderStatus.COMPLETED:
+            failures[order_id] = "Cannot change status of completed order"
+    
+    accepting = [
+        order_id for order_id in order_ids
+        if order_id not in failures
+        and data.status == OrderStatus.ACCEPTED and current[order_id] != OrderStatus.ACCEPTED
+    ]
+    if accepting:
+        lines = (await db.execute(
+            select(OrderItem.order_id, OrderItem.product_id, OrderItem.quantity)
+            .where(OrderItem.order_id.in_(accepting))
+        )).all()
+        products = {
+            row.id: row for row in (await db.execute(
+                select(Product.id, Product.name, Product.stock_quantity)
+                .where(Product.id.in_({line.product_id for line in lines}))
+                .order_by(Product.id)
+                .with_for_update()
+            )).all()
+        }
+        demand = defaultdict(Counter)
+        for line in lines:
+            demand[line.order_id][line.product_id] += line.quantity
+        
+        available = {product_id: row.stock_quantity for product_id, row in products.items()}
+        for order_id in accepting:
+            short = next(
+                (product_id for product_id, quantity in demand[order_id].items()
+                 if available[product_id] < quantity),
+                None
+            )
+            if short is not None:
+                failures[order_id] = (
+                    f"Insufficient stock for product {products[short].name}. "
+                    f"Available: {available[short]}, Requested: {demand[order_id][short]}"
+                )
+                continue
+            for product_id, quantity in demand[order_id].items():
+                available[product_id] -= quantity
+    
+    # One conditional UPDATE per current status, so orders changed since
+    # they were read are left alone.
+    by_status = defaultdict(list)
+    for order_id in order_ids:
+        if order_id not in failures:
+            by_status[current[order_id]].append(order_id)
+    updated = set()
+    for old_status, ids in by_status.items():
+        result = await db.execute(
+            update(Order)
+            .where(Order.id.in_(ids), Order.status == old_status)
+            .values(status=data.status)
+            .returning(Order.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated.update(result.scalars().all())
+    for order_id in order_ids:
+        if order_id not in failures and order_id not in updated:
+            failures[order_id] = "Order status was changed by another request, please retry"
+    
+    accepted = [order_id for order_id in accepting if order_id in updated]
+    if accepted and await _reserve_stock(db, current_user.supplier_id, accepted):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Stock changed while the orders were being accepted, please retry"
+        )
+    
+    if updated:
+        await record_status_changes(
+            db, [(order_id, current[order_id]) for order_id in order_ids if order_id in updated], data.status
+        )
+        await db.execute(insert(AuditLog), [
+            {
+                "user_id": current_user.id,
+                "action": f"ORDER_STATUS_CHANGED_{current[order_id].value}_TO_{data.status.value}",
+                "entity_type": "ORDER",
+                "entity_id": order_id
+            }
+            for order_id in order_ids if order_id in updated
+        ])
+    await db.commit()
+    
+    return OrderBulkStatusResponse(
+        updated=len(updated),
+        failed=len(failures),
+        results=[
+            {"order_id": order_id, "success": False, "status": current.get(order_id), "detail": failures[order_id]}
+            if order_id in failures else
+            {"order_id": order_id, "success": True, "status": data.status}
+            for order_id in order_ids
+        ]
+    )
 
 
 @router.put("/{order_id}", response_model=OrderResponse)
-def update_order_status(
+async def update_order_status(
     order_id: int,
     data: OrderStatusUpdate,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
-    """Update order status (OWNER/MANAGER only)."""
-    order = db.query(Order).filter(Order.id == order_id).first()
+    """Update order status (OWNER/MANAGER only).
+    
+    The transition is a conditional UPDATE on the status read, so concurrent
+    updates of the same order cannot both apply; accepting reserves stock
+    atomically for all lines.
+    """
+    order = await db.scalar(select(Order).where(Order.id == order_id))
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -244,11 +792,10 @@ def update_order_status(
             detail="You can only update orders for your supplier"
         )
     
-    allowed_statuses = [OrderStatus.ACCEPTED, OrderStatus.REJECTED, OrderStatus.COMPLETED]
-    if data.status not in allowed_statuses:
+    if data.status not in ALLOWED_STATUS_UPDATES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Allowed: {[s.value for s in allowed_statuses]}"
+            detail=f"Invalid status. Allowed: {[s.value for s in ALLOWED_STATUS_UPDATES]}"
         )
     
     if order.status == OrderStatus.COMPLETED:
@@ -258,32 +805,43 @@ def update_order_status(
         )
     
     old_status = order.status
-    order.status = data.status
+    transition = await db.execute(
+        update(Order)
+        .where(Order.id == order_id, Order.status == old_status)
+        .values(status=data.status)
+        .execution_options(synchronize_session=False)
+    )
+    if transition.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Order status was changed by another request, please retry"
+        )
     
-    # Adjust stock if order is accepted
+    # Reserve stock if order is accepted
     if data.status == OrderStatus.ACCEPTED and old_status != OrderStatus.ACCEPTED:
-        for item in order.items:
-            product = item.product
-            if product.stock_quantity < item.quantity:
-                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Insufficient stock for product {product.name}. Available: {product.stock_quantity}, Requested: {item.quantity}"
-                )
-            product.stock_quantity -= item.quantity
-            if product.stock_quantity == 0:
-                db.delete(product)
+        shortfalls = await _reserve_stock(db, current_user.supplier_id, [order_id])
+        if shortfalls:
+            name, available, requested = shortfalls[0]
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Insufficient stock for product {name}. Available: {available}, Requested: {requested}"
+            )
     
-    db.commit()
-    db.refresh(order)
+    await record_status_changes(db, [(order_id, old_status)], data.status)
     
     audit = AuditLog(
         user_id=current_user.id,
         action=f"ORDER_STATUS_CHANGED_{old_status.value}_TO_{data.status.value}",
         entity_type="ORDER",
-        entity_id=order.id
+        entity_id=order_id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
-    return order
-
+    return await db.scalar(
+        select(Order)
+        .options(selectinload(Order.items).joinedload(OrderItem.product))
+        .where(Order.id == order_id)
+        .execution_options(populate_existing=True)
+    )
@@ -1,45 +1,158 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+import csv
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import engine, get_db
+from app.db.replicas import get_read_db
+from app.db.search import match_products, search_terms
+from app.core.catalog import (
+    bump_catalog_version, catalog_cache, catalog_etag, etag_matches, product_list
+)
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.uploads import body_lines
 from app.core.dependencies import (
     get_current_user,
     get_current_consumer,
     get_current_supplier_staff,
     get_current_supplier_owner_or_manager
 )
+from app.core.principals import Principal
 from app.models.models import (
-    User, Product, Link, LinkStatus, AuditLog
+    Supplier, Product, Link, LinkStatus, AuditLog
 )
 from app.schemas.schemas import (
-    ProductCreate, ProductUpdate, ProductResponse
+    ProductCreate, ProductUpdate, ProductResponse, ProductListItem, ProductSearchResponse,
+    CatalogSupplierGroup,
+    ProductUpsert, ProductUpsertResponse, ProductCountsResponse
 )
 
 
 router = APIRouter(prefix="/api", tags=["products"])
 
 
-@router.get("/supplier/products", response_model=List[ProductResponse])
-def get_supplier_products(
-    current_user: User = Depends(get_current_supplier_staff),
-    db: Session = Depends(get_db)
+def _sku_conflict(sku: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Another product already uses SKU {sku}"
+    )
+
+
+async def _require_unique_sku(
+    db: AsyncSession, supplier_id: int, sku: Optional[str], product_id: Optional[int] = None
+) -> None:
+    if sku is None:
+        return
+    query = select(Product.id).where(Product.supplier_id == supplier_id, Product.sku == sku)
+    if product_id is not None:
+        query = query.where(Product.id != product_id)
+    if await db.scalar(query) is not None:
+        raise _sku_conflict(sku)
+
+
+async def _commit_product(db: AsyncSession, supplier_id: int, sku: Optional[str]) -> None:
+    """Bump the catalog version and commit a product write.
+    
+    A concurrent write that took the SKU after ``_require_unique_sku``
+    checked it fails the unique index; that is the same 409.
+    """
+    try:
+        await bump_catalog_version(db, supplier_id)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise _sku_conflict(sku)
+
+
+PRODUCT_FIELDS = list(ProductListItem.model_fields)
+
+
+@router.get("/supplier/products", response_model=List[ProductListItem], response_model_exclude_unset=True)
+async def get_supplier_products(
+    response: Response,
+    sort: str = Query("id", pattern="^-?(id|name|price|stock_quantity|updated_at)$"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (id is always included)"),
+    current_user: Principal = Depends(get_current_supplier_staff),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get products for current user's supplier, one page at a time.
+    
+    Sorted by ``sort`` (prefix ``-`` for descending), ties broken by id, and
+    keyset-paginated on (sort key, id) over a matching index: when more
+    products follow, ``X-Next-Cursor`` holds the cursor for the next page.
+    ``fields`` limits the columns loaded and returned, e.g.
+    ``fields=name,price,stock_quantity`` skips ``description``.
+    """
+    selected = PRODUCT_FIELDS
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(PRODUCT_FIELDS))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+        selected = ["id"] + [name for name in PRODUCT_FIELDS if name in requested and name != "id"]
+    
+    descending = sort.startswith("-")
+    sort_column = getattr(Product, sort.lstrip("-"))
+    query = select(
+        *(getattr(Product, name) for name in selected), sort_column.label("sort_key")
+    ).where(Product.supplier_id == current_user.supplier_id)
+    if cursor:
+        sort_key = tuple_(sort_column, Product.id)
+        after = decode_cursor(cursor, sort_column.type.python_type, int)
+        query = query.where(sort_key < after if descending else sort_key > after)
+    if descending:
+        query = query.order_by(sort_column.desc(), Product.id.desc())
+    else:
+        query = query.order_by(sort_column, Product.id)
+    
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].sort_key, rows[-1].id)
+    
+    return [dict(zip(selected, row)) for row in rows]
+
+
+@router.get("/supplier/products/summary", response_model=ProductCountsResponse)
+async def get_supplier_product_counts(
+    current_user: Principal = Depends(get_current_supplier_staff),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all products for current user's supplier."""
-    products = db.query(Product).filter(
-        Product.supplier_id == current_user.supplier_id
-    ).all()
-    return products
+    """Count the current user's supplier's products, for dashboards.
+    
+    GET /supplier/products is paginated, so its length is not the product
+    count. One aggregate over the supplier's products.
+    """
+    total, active = (await db.execute(
+        select(func.count(), func.count().filter(Product.is_active))
+        .where(Product.supplier_id == current_user.supplier_id)
+    )).one()
+    return ProductCountsResponse(total=total, active=active)
 
 
 @router.post("/supplier/products", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
-def create_product(
+async def create_product(
     data: ProductCreate,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new product (OWNER/MANAGER only)."""
+    await _require_unique_sku(db, current_user.supplier_id, data.sku)
     product = Product(
         supplier_id=current_user.supplier_id,
+        sku=data.sku,
         name=data.name,
         description=data.description,
         unit=data.unit,
@@ -49,8 +162,7 @@ def create_product(
         is_active=True
     )
     db.add(product)
-    db.commit()
-    db.refresh(product)
+    await _commit_product(db, current_user.supplier_id, data.sku)
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -59,20 +171,221 @@ def create_product(
         entity_id=product.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return product
 
 
+UPSERT_FIELDS = ["name", "description", "unit", "price", "stock_quantity", "min_order_quantity", "is_active"]
+NEW_SKU_FIELDS = ["name", "unit", "price", "stock_quantity"]
+
+
+def _upsert_statement():
+    """INSERT ... ON CONFLICT (supplier_id, sku) that overwrites the product fields."""
+    dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(Product)
+    return stmt.on_conflict_do_update(
+        index_elements=["supplier_id", "sku"],
+        set_={name: stmt.excluded[name] for name in UPSERT_FIELDS + ["updated_at"]},
+    ).returning(Product.id, Product.sku)
+
+
+async def _csv_records(request: Request) -> AsyncIterator[Tuple[int, dict]]:
+    """Parse CSV rows as the body streams in; empty cells count as omitted."""
+    columns = None
+    line_no = 0
+    async for line in body_lines(request):
+        line_no += 1
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if columns is None:
+            columns = [value.strip() for value in values]
+            if "sku" not in columns:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="CSV header must include a sku column"
+                )
+            continue
+        yield line_no, {column: value.strip() for column, value in zip(columns, values) if value.strip()}
+
+
+async def _json_records(request: Request) -> AsyncIterator[Tuple[int, object]]:
+    """Parse a JSON array body; rows are numbered by position.
+    
+    The array is parsed in one piece, so the body is capped at
+    PRODUCT_UPSERT_MAX_JSON_BYTES; larger price lists go through CSV, which
+    is parsed as it streams in.
+    """
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.PRODUCT_UPSERT_MAX_JSON_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"JSON uploads are limited to {settings.PRODUCT_UPSERT_MAX_JSON_BYTES} bytes; use CSV for larger price lists"
+            )
+    try:
+        records = json.loads(body)
+    except ValueError:
+        records = None
+    if not isinstance(records, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="JSON body must be an array of products"
+        )
+    for line_no, record in enumerate(records, start=1):
+        yield line_no, record
+
+
+async def _upsert_rows(request: Request, file_format: str) -> AsyncIterator[Tuple[int, object]]:
+    """Parse the upload into ``(line_no, ProductUpsert)``.
+    
+    Invalid rows yield ``(line_no, (sku, error_message))`` instead.
+    """
+    records = _json_records(request) if file_format == "json" else _csv_records(request)
+    async for line_no, record in records:
+        if not isinstance(record, dict):
+            yield line_no, (None, "Row must be an object")
+            continue
+        try:
+            yield line_no, ProductUpsert.model_validate(record)
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            sku = record.get("sku")
+            yield line_no, (
+                str(sku) if sku not in (None, "") else None,
+                f"{field}: {error['msg']}" if field else error["msg"]
+            )
+
+
+async def _write_upsert_batch(
+    db: AsyncSession, batch: list, supplier_id: int, report: dict, changes: list
+) -> None:
+    """Classify a batch against the stored rows and upsert the new and changed ones in one transaction."""
+    existing = {
+        product.sku: product for product in (await db.scalars(select(Product).where(
+            Product.supplier_id == supplier_id,
+            Product.sku.in_([row.sku for _, row in batch])
+        ))).all()
+    }
+    now = datetime.utcnow()
+    values, actions, lines = [], {}, []
+    for line_no, row in batch:
+        fields = row.model_dump(exclude_unset=True, exclude={"sku"})
+        product = existing.get(row.sku)
+        if product is None:
+            missing = [name for name in NEW_SKU_FIELDS if fields.get(name) is None]
+            if missing:
+                _upsert_error(report, line_no, row.sku, f"New SKU requires {', '.join(missing)}")
+                continue
+            fields = {"description": None, "min_order_quantity": 1, "is_active": True, **fields}
+            actions[row.sku] = "PRODUCT_CREATED"
+        else:
+            if any(value is None and name != "description" for name, value in fields.items()):
+                _upsert_error(report, line_no, row.sku, "Only description can be cleared")
+                continue
+            if all(getattr(product, name) == value for name, value in fields.items()):
+                report["unchanged"] += 1
+                continue
+            fields = {**{name: getattr(product, name) for name in UPSERT_FIELDS}, **fields}
+            actions[row.sku] = "PRODUCT_UPDATED"
+        values.append({
+            "supplier_id": supplier_id, "sku": row.sku, "created_at": now, "updated_at": now, **fields
+        })
+        lines.append((line_no, row.sku))
+    if not values:
+        return
+    
+    try:
+        rows = (await db.execute(_upsert_statement(), values)).all()
+        await db.commit()
+    except IntegrityError:
+        # ON CONFLICT covers the SKU index; anything else rejects the batch, not the upload.
+        await db.rollback()
+        for line_no, sku in lines:
+            _upsert_error(report, line_no, sku, "Row conflicts with a concurrent change; retry it")
+        return
+    for product_id, sku in rows:
+        action = actions[sku]
+        report["created" if action == "PRODUCT_CREATED" else "updated"] += 1
+        changes.append((action, product_id))
+
+
+def _upsert_error(report: dict, line_no: int, sku: Optional[str], detail: str) -> None:
+    report["rows_rejected"] += 1
+    if len(report["errors"]) < settings.PRODUCT_UPSERT_MAX_ERRORS:
+        report["errors"].append({"line": line_no, "sku": sku, "detail": detail})
+    else:
+        report["errors_truncated"] = True
+
+
+@router.post("/supplier/products/bulk", response_model=ProductUpsertResponse)
+async def upsert_products(
+    request: Request,
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|json)$"),
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create or update products by SKU from a price list (OWNER/MANAGER only).
+    
+    The body is a JSON array of rows or a CSV file with a ``sku`` header
+    column plus any of the product fields; fields a row omits keep their
+    current value. Rows are written every PRODUCT_UPSERT_BATCH_ROWS rows with
+    one INSERT ... ON CONFLICT per batch, each batch in its own transaction;
+    rows identical to the stored product are skipped. The catalog version is
+    bumped once and the audit entries written in one batch at the end.
+    Invalid rows and repeated SKUs (after the first) are listed in the
+    error report. JSON bodies are limited to PRODUCT_UPSERT_MAX_JSON_BYTES;
+    CSV bodies are streamed and have no size limit.
+    """
+    supplier_id = current_user.supplier_id
+    if file_format is None:
+        file_format = "json" if "json" in request.headers.get("content-type", "") else "csv"
+    
+    report = {"created": 0, "updated": 0, "unchanged": 0, "rows_rejected": 0, "errors": [], "errors_truncated": False}
+    changes = []
+    batch, seen = [], set()
+    try:
+        async for line_no, row in _upsert_rows(request, file_format):
+            if isinstance(row, tuple):
+                _upsert_error(report, line_no, *row)
+                continue
+            if row.sku in seen:
+                _upsert_error(report, line_no, row.sku, "SKU appears more than once in this upload")
+                continue
+            seen.add(row.sku)
+            batch.append((line_no, row))
+            if len(batch) >= settings.PRODUCT_UPSERT_BATCH_ROWS:
+                await _write_upsert_batch(db, batch, supplier_id, report, changes)
+                batch = []
+        if batch:
+            await _write_upsert_batch(db, batch, supplier_id, report, changes)
+    finally:
+        # Batches already committed must reach the catalog even if the upload fails midway.
+        if changes:
+            await db.rollback()
+            await db.execute(insert(AuditLog), [
+                {"user_id": current_user.id, "action": action, "entity_type": "PRODUCT", "entity_id": product_id}
+                for action, product_id in changes
+            ])
+            await bump_catalog_version(db, supplier_id)
+            await db.commit()
+    
+    report["errors"].sort(key=lambda error: error["line"])
+    return ProductUpsertResponse(**report)
+
+
 @router.put("/supplier/products/{product_id}", response_model=ProductResponse)
-def update_product(
+async def update_product(
     product_id: int,
     data: ProductUpdate,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a product (OWNER/MANAGER only)."""
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = await db.scalar(select(Product).where(Product.id == product_id))
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,11 +399,11 @@ def update_product(
         )
     
     update_data = data.model_dump(exclude_unset=True)
+    await _require_unique_sku(db, current_user.supplier_id, update_data.get("sku"), product.id)
     for field, value in update_data.items():
         setattr(product, field, value)
     
-    db.commit()
-    db.refresh(product)
+    await _commit_product(db, current_user.supplier_id, product.sku)
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -99,19 +412,19 @@ def update_product(
         entity_id=product.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return product
 
 
 @router.delete("/supplier/products/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_product(
+async def delete_product(
     product_id: int,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
     """Soft delete a product by setting is_active to False (OWNER/MANAGER only)."""
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = await db.scalar(select(Product).where(Product.id == product_id))
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -124,8 +437,10 @@ def delete_product(
             detail="You can only delete products for your supplier"
         )
     
-    db.delete(product)
-    db.commit()
+    # Order lines and rollups keep referring to the product, so it stays.
+    product.is_active = False
+    await bump_catalog_version(db, current_user.supplier_id)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -134,34 +449,182 @@ def delete_product(
         entity_id=product.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return None
 
 
 @router.get("/suppliers/{supplier_id}/products", response_model=List[ProductResponse])
-def get_supplier_products_for_consumer(
+async def get_supplier_products_for_consumer(
     supplier_id: int,
-    current_user: User = Depends(get_current_consumer),
-    db: Session = Depends(get_db)
+    request: Request,
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get products from a supplier (CONSUMER only, must have APPROVED link)."""
-    link = db.query(Link).filter(
-        Link.supplier_id == supplier_id,
-        Link.consumer_id == current_user.id,
-        Link.status == LinkStatus.APPROVED
-    ).first()
-    
-    if not link:
+    """Get products from a supplier (CONSUMER only, must have APPROVED link).
+    
+    One query checks the link and reads the supplier's catalog version, which
+    is the ETag. A matching ``If-None-Match`` gets a 304 without loading
+    products; otherwise the serialized catalog is served from a per-version
+    cache.
+    """
+    version = await db.scalar(
+        select(Supplier.catalog_version)
+        .join(Link, Link.supplier_id == Supplier.id)
+        .where(
+            Link.supplier_id == supplier_id,
+            Link.consumer_id == current_user.id,
+            Link.status == LinkStatus.APPROVED
+        )
+    )
+    
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You must have an approved link with this supplier to view their products"
         )
     
-    products = db.query(Product).filter(
-        Product.supplier_id == supplier_id,
-        Product.is_active == True
-    ).all()
+    etag = catalog_etag(supplier_id, version)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    body = catalog_cache.get((supplier_id, version))
+    if body is None:
+        products = (await db.scalars(select(Product).where(
+            Product.supplier_id == supplier_id,
+            Product.is_active == True
+        ).order_by(Product.id))).all()
+        body = product_list.dump_json(product_list.validate_python(products, from_attributes=True))
+        catalog_cache.set((supplier_id, version), body)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/catalog", response_model=List[CatalogSupplierGroup])
+async def get_catalog(
+    request: Request,
+    response: Response,
+    limit: int = Query(200, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Active products of every supplier the consumer has an APPROVED link with, grouped by supplier (CONSUMER only).
+    
+    Two queries whatever the number of suppliers: the approved links joined
+    to their suppliers' catalog versions, then one page of products. Each
+    group carries the supplier's catalog ETag (the one
+    ``/api/suppliers/{id}/products`` returns); send the ETags you hold in
+    ``If-None-Match`` and those suppliers come back with ``not_modified``
+    and no products. Products are keyset-paginated on (supplier_id, id), so
+    a supplier can continue on the next page: the first page lists every
+    linked supplier, later pages only those with products on them. When
+    more products follow, ``X-Next-Cursor`` holds the cursor for the next page.
+    """
+    suppliers = (await db.execute(
+        select(Supplier.id, Supplier.company_name, Supplier.catalog_version)
+        .join(Link, Link.supplier_id == Supplier.id)
+        .where(
+            Link.consumer_id == current_user.id,
+            Link.status == LinkStatus.APPROVED
+        )
+        .order_by(Supplier.id)
+    )).all()
+    
+    if_none_match = request.headers.get("if-none-match")
+    groups = {}
+    for supplier_id, supplier_name, version in suppliers:
+        etag = catalog_etag(supplier_id, version)
+        groups[supplier_id] = {
+            "supplier_id": supplier_id,
+            "supplier_name": supplier_name,
+            "etag": etag,
+            "not_modified": etag_matches(if_none_match, etag),
+            "products": []
+        }
     
-    return products
+    changed = [supplier_id for supplier_id, group in groups.items() if not group["not_modified"]]
+    if changed:
+        query = select(Product).where(
+            Product.supplier_id.in_(changed),
+            Product.is_active == True
+        )
+        if cursor:
+            query = query.where(tuple_(Product.supplier_id, Product.id) > decode_cursor(cursor, int, int))
+        products = (await db.scalars(
+            query.order_by(Product.supplier_id, Product.id).limit(limit + 1)
+        )).all()
+        if len(products) > limit:
+            products = products[:limit]
+            response.headers["X-Next-Cursor"] = encode_cursor(products[-1].supplier_id, products[-1].id)
+        for product in products:
+            groups[product.supplier_id]["products"].append(product)
+    
+    if cursor:
+        return [group for group in groups.values() if group["products"]]
+    return list(groups.values())
 
+
+@router.get("/products/search", response_model=List[ProductSearchResponse])
+async def search_products(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    min_price: Optional[Decimal] = Query(None, ge=0),
+    max_price: Optional[Decimal] = Query(None, ge=0),
+    unit: Optional[str] = None,
+    in_stock: bool = False,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Search active products of every supplier the consumer has an APPROVED link with (CONSUMER only).
+    
+    Every word must match the start of a word in the name or description;
+    name hits rank higher. Backed by the full-text index (FTS5 on SQLite,
+    tsvector/trigram on PostgreSQL). Keyset-paginated on (score, id): when
+    more results follow, ``X-Next-Cursor`` holds the cursor for the next page.
+    """
+    terms = search_terms(q)
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must contain letters or digits"
+        )
+    
+    query, score = match_products(
+        select(Product, Supplier.company_name).join(Supplier, Supplier.id == Product.supplier_id),
+        terms
+    )
+    query = query.where(
+        Product.is_active == True,
+        Product.supplier_id.in_(select(Link.supplier_id).where(
+            Link.consumer_id == current_user.id,
+            Link.status == LinkStatus.APPROVED
+        ))
+    )
+    if min_price is not None:
+        query = query.where(Product.price >= min_price)
+    if max_price is not None:
+        query = query.where(Product.price <= max_price)
+    if unit:
+        query = query.where(Product.unit == unit)
+    if in_stock:
+        query = query.where(Product.stock_quantity > 0)
+    if cursor:
+        query = query.where(tuple_(score, Product.id) > decode_cursor(cursor, float, int))
+    
+    rows = (await db.execute(
+        query.add_columns(score.label("score")).order_by(score, Product.id).limit(limit + 1)
+    )).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].score, rows[-1][0].id)
+    
+    results = []
+    for product, supplier_name, _ in rows:
+        result = ProductSearchResponse.model_validate(product)
+        result.supplier_name = supplier_name
+        results.append(result)
+    return results
@@ -1,14 +1,18 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from app.db.session import get_db
+from app.db.replicas import get_read_db
 from app.core.dependencies import (
     get_current_user,
     get_current_consumer,
     get_current_supplier_owner_or_manager
 )
+from app.core.principals import Principal
 from app.models.models import (
-    User, Supplier, Link, LinkStatus, UserRole, AuditLog, Message
+    Supplier, Link, LinkStatus, UserRole, AuditLog, Message
 )
 from app.schemas.schemas import (
     SupplierResponse, LinkCreate, LinkResponse, 
@@ -20,23 +24,23 @@ router = APIRouter(prefix="/api", tags=["suppliers", "links"])
 
 
 @router.get("/suppliers", response_model=List[SupplierResponse])
-def list_suppliers(
-    current_user: User = Depends(get_current_consumer),
-    db: Session = Depends(get_db)
+async def list_suppliers(
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List all active suppliers (for consumers to search and link)."""
-    suppliers = db.query(Supplier).filter(Supplier.is_active == True).all()
+    suppliers = (await db.scalars(select(Supplier).where(Supplier.is_active == True))).all()
     return suppliers
 
 
 @router.post("/links", response_model=LinkResponse, status_code=status.HTTP_201_CREATED)
-def create_link(
+async def create_link(
     data: LinkCreate,
-    current_user: User = Depends(get_current_consumer),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_consumer),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a link request from consumer to supplier."""
-    supplier = db.query(Supplier).filter(Supplier.id == data.supplier_id).first()
+    supplier = await db.scalar(select(Supplier).where(Supplier.id == data.supplier_id))
     if not supplier:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -49,10 +53,10 @@ def create_link(
             detail="Supplier is not active"
         )
     
-    existing_link = db.query(Link).filter(
+    existing_link = await db.scalar(select(Link).where(
         Link.supplier_id == data.supplier_id,
         Link.consumer_id == current_user.id
-    ).first()
+    ))
     
     if existing_link:
         raise HTTPException(
@@ -66,8 +70,7 @@ def create_link(
         status=LinkStatus.PENDING
     )
     db.add(link)
-    db.commit()
-    db.refresh(link)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -76,19 +79,23 @@ def create_link(
         entity_id=link.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return link
 
 
 @router.get("/links/me", response_model=List[LinkWithSupplierResponse] | List[LinkWithConsumerResponse])
-def get_my_links(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_my_links(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get links for current user (consumer or supplier staff)."""
     if current_user.role == UserRole.CONSUMER:
-        links = db.query(Link).filter(Link.consumer_id == current_user.id).all()
+        links = (await db.scalars(
+            select(Link)
+            .options(selectinload(Link.supplier))
+            .where(Link.consumer_id == current_user.id)
+        )).all()
         return [LinkWithSupplierResponse.model_validate(link) for link in links]
     else:
         if not current_user.supplier_id:
@@ -96,32 +103,40 @@ def get_my_links(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User is not associated with a supplier"
             )
-        links = db.query(Link).filter(Link.supplier_id == current_user.supplier_id).all()
+        links = (await db.scalars(
+            select(Link)
+            .options(selectinload(Link.consumer))
+            .where(Link.supplier_id == current_user.supplier_id)
+        )).all()
         return [LinkWithConsumerResponse.model_validate(link) for link in links]
 
 
 @router.get("/links/pending", response_model=List[LinkWithConsumerResponse])
-def get_pending_links(
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+async def get_pending_links(
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get pending link requests for supplier (OWNER/MANAGER only)."""
-    links = db.query(Link).filter(
-        Link.supplier_id == current_user.supplier_id,
-        Link.status == LinkStatus.PENDING
-    ).all()
+    links = (await db.scalars(
+        select(Link)
+        .options(selectinload(Link.consumer))
+        .where(
+            Link.supplier_id == current_user.supplier_id,
+            Link.status == LinkStatus.PENDING
+        )
+    )).all()
     
     return [LinkWithConsumerResponse.model_validate(link) for link in links]
 
 
 @router.post("/links/{link_id}/approve", response_model=LinkResponse)
-def approve_link(
+async def approve_link(
     link_id: int,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
     """Approve a pending link request."""
-    link = db.query(Link).filter(Link.id == link_id).first()
+    link = await db.scalar(select(Link).where(Link.id == link_id))
     if not link:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -141,8 +156,7 @@ def approve_link(
         )
     
     link.status = LinkStatus.APPROVED
-    db.commit()
-    db.refresh(link)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -151,19 +165,19 @@ def approve_link(
         entity_id=link.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return link
 
 
 @router.post("/links/{link_id}/reject", response_model=LinkResponse)
-def reject_link(
+async def reject_link(
     link_id: int,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
     """Reject a pending link request."""
-    link = db.query(Link).filter(Link.id == link_id).first()
+    link = await db.scalar(select(Link).where(Link.id == link_id))
     if not link:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -183,8 +197,7 @@ def reject_link(
         )
     
     link.status = LinkStatus.DECLINED
-    db.commit()
-    db.refresh(link)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -193,19 +206,19 @@ def reject_link(
         entity_id=link.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return link
 
 
 @router.post("/links/{link_id}/block", response_model=LinkResponse)
-def block_link(
+async def block_link(
     link_id: int,
-    current_user: User = Depends(get_current_supplier_owner_or_manager),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_supplier_owner_or_manager),
+    db: AsyncSession = Depends(get_db)
 ):
     """Block a link (optional feature)."""
-    link = db.query(Link).filter(Link.id == link_id).first()
+    link = await db.scalar(select(Link).where(Link.id == link_id))
     if not link:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -219,8 +232,7 @@ def block_link(
         )
     
     link.status = LinkStatus.BLOCKED
-    db.commit()
-    db.refresh(link)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -229,19 +241,19 @@ def block_link(
         entity_id=link.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return link
 
 
 @router.delete("/links/{link_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_link(
+async def delete_link(
     link_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a link (Unlink)."""
-    link = db.query(Link).filter(Link.id == link_id).first()
+    link = await db.scalar(select(Link).where(Link.id == link_id))
     if not link:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -271,10 +283,10 @@ def delete_link(
             )
 
     # Delete associated messages first
-    db.query(Message).filter(Message.link_id == link.id).delete()
+    await db.execute(delete(Message).where(Message.link_id == link.id))
 
-    db.delete(link)
-    db.commit()
+    await db.delete(link)
+    await db.commit()
     
     audit = AuditLog(
         user_id=current_user.id,
@@ -283,7 +295,7 @@ def delete_link(
         entity_id=link.id
     )
     db.add(audit)
-    db.commit()
+    await db.commit()
     
     return None
 
@@ -0,0 +1,44 @@
+from typing import List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.models import Supplier
+from app.schemas.schemas import ProductResponse
+
+
+# Serialized consumer catalogs keyed by (supplier_id, catalog_version). A bump
+# makes the old key unreachable, so entries never need invalidating.
+catalog_cache = TTLCache(
+    maxsize=settings.CATALOG_CACHE_MAX_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL_SECONDS,
+)
+
+product_list = TypeAdapter(List[ProductResponse])
+
+
+async def bump_catalog_version(db: AsyncSession, supplier_id: int) -> None:
+    """Mark the supplier's catalog as changed, in the caller's transaction.
+
+    Call it from every write that changes what the consumer catalog returns
+    (product fields, active flag, stock).
+    """
+    await db.execute(
+        update(Supplier)
+        .where(Supplier.id == supplier_id)
+        .values(catalog_version=Supplier.catalog_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def catalog_etag(supplier_id: int, version: int) -> str:
+    return f'"catalog-{supplier_id}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an ``If-None-Match`` header against ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag.removeprefix("W/") for tag in candidates)
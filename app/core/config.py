@@ -1,13 +1,44 @@
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):    
     DATABASE_URL: str
+    DB_ASYNC: bool = True
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP_CONNECTIONS: int = 2
+    DB_READ_REPLICA_URLS: List[str] = []
+    DB_REPLICA_RETRY_SECONDS: int = 30
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+    ORDER_IMPORT_BATCH_LINES: int = 500
+    ORDER_IMPORT_MAX_ERRORS: int = 1000
+    ORDER_IMPORT_MAX_ORDER_LINES: int = 1000
+    ORDER_IMPORT_REF_WINDOW: int = 10000
+    PRODUCT_UPSERT_BATCH_ROWS: int = 1000
+    PRODUCT_UPSERT_MAX_ERRORS: int = 1000
+    PRODUCT_UPSERT_MAX_JSON_BYTES: int = 10 * 1024 * 1024
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+    SQL_STRICT_MODE: bool = False
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    TOKEN_CACHE_MAX_SIZE: int = 10000
     APP_NAME: str = "Supplier Consumer Platform"
     DEBUG: bool = False
+    ADMIN_API_TOKEN: Optional[str] = None
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    CATALOG_CACHE_TTL_SECONDS: int = 3600
+    CATALOG_CACHE_MAX_SIZE: int = 256
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 2
     
     class Config:
         env_file = ".env"
@@ -1,20 +1,28 @@
+import hmac
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
+from app.core.config import settings
 from app.core.security import decode_access_token
+from app.core.principals import Principal, principal_cache
 from app.models.models import User, UserRole
 
 
 security = HTTPBearer()
 
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user from JWT token."""
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """Get the current authenticated user from JWT token.
+
+    The user row is cached per process (see ``app.core.principals``), so most
+    requests resolve the principal without a database round trip.
+    """
     token = credentials.credentials
     payload = decode_access_token(token)
     
@@ -42,7 +50,14 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # Lets the replica router pin this user to the primary after a commit.
+    db.info["user_id"] = user_id
+    
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    
+    user = await db.scalar(select(User).where(User.id == user_id))
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -50,12 +65,14 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.set(user_id, principal)
+    return principal
 
 
-def get_current_supplier_owner_or_manager(
-    current_user: User = Depends(get_current_user)
-) -> User:
+async def get_current_supplier_owner_or_manager(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """Ensure the current user is a supplier OWNER or MANAGER."""
     if current_user.role not in [UserRole.OWNER, UserRole.MANAGER]:
         raise HTTPException(
@@ -70,9 +87,9 @@ def get_current_supplier_owner_or_manager(
     return current_user
 
 
-def get_current_supplier_staff(
-    current_user: User = Depends(get_current_user)
-) -> User:
+async def get_current_supplier_staff(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """Ensure the current user is supplier staff (OWNER, MANAGER, or SALES)."""
     if current_user.role not in [UserRole.OWNER, UserRole.MANAGER, UserRole.SALES]:
         raise HTTPException(
@@ -87,9 +104,9 @@ def get_current_supplier_staff(
     return current_user
 
 
-def get_current_consumer(
-    current_user: User = Depends(get_current_user)
-) -> User:
+async def get_current_consumer(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """Ensure the current user is a CONSUMER."""
     if current_user.role != UserRole.CONSUMER:
         raise HTTPException(
@@ -98,3 +115,18 @@ def get_current_consumer(
         )
     return current_user
 
+
+async def require_admin_token(
+    x_admin_token: Optional[str] = Header(None)
+) -> None:
+    """Ensure the request carries the configured ADMIN_API_TOKEN."""
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled"
+        )
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, settings.ADMIN_API_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin token"
+        )
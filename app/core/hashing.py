@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.core.security import verify_password, get_password_hash
+
+
+# bcrypt is deliberately slow (~250ms per call). Running it on a dedicated,
+# bounded pool keeps login storms from starving the AnyIO request threadpool.
+_executor: Executor
+if settings.PASSWORD_HASH_USE_PROCESSES:
+    _executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+else:
+    _executor = ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        thread_name_prefix="password-hash",
+    )
+
+_capacity = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_LIMIT
+_lock = threading.Lock()
+_in_flight = 0
+_rejected = 0
+_completed = 0
+_total_seconds = 0.0
+_max_seconds = 0.0
+
+
+def _acquire_slot() -> None:
+    global _in_flight, _rejected
+    with _lock:
+        if _in_flight >= _capacity:
+            _rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry shortly",
+                headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+            )
+        _in_flight += 1
+
+
+def _release_slot(elapsed: float) -> None:
+    global _in_flight, _completed, _total_seconds, _max_seconds
+    with _lock:
+        _in_flight -= 1
+        _completed += 1
+        _total_seconds += elapsed
+        _max_seconds = max(_max_seconds, elapsed)
+
+
+async def _run(func, *args):
+    _acquire_slot()
+    started = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, func, *args)
+    finally:
+        _release_slot(time.perf_counter() - started)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password on the dedicated hashing pool."""
+    return await _run(get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the dedicated hashing pool."""
+    return await _run(verify_password, plain_password, hashed_password)
+
+
+def stats() -> dict:
+    """Return queue depth and latency counters for the hashing pool."""
+    with _lock:
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "capacity": _capacity,
+            "in_flight": _in_flight,
+            "queue_depth": max(_in_flight - settings.PASSWORD_HASH_WORKERS, 0),
+            "rejected": _rejected,
+            "completed": _completed,
+            "latency_seconds_total": _total_seconds,
+            "latency_seconds_max": _max_seconds,
+        }
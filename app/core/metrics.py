@@ -0,0 +1,145 @@
+import os
+import time
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, generate_latest
+)
+from prometheus_client import multiprocess
+
+
+# Under multi-worker uvicorn set PROMETHEUS_MULTIPROC_DIR (an empty directory)
+# before start-up: every worker then writes its samples there and /metrics
+# aggregates them, whichever worker serves the scrape.
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+GAUGE_REFRESH_SECONDS = 5
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    multiprocess_mode="livesum",
+)
+CACHE_ENTRIES = Gauge(
+    "cache_entries",
+    "Entries currently held by an in-process cache",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+CACHE_HITS = Gauge(
+    "cache_hits",
+    "Cache hits since process start",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+CACHE_MISSES = Gauge(
+    "cache_misses",
+    "Cache misses since process start",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+CACHE_EVICTIONS = Gauge(
+    "cache_evictions",
+    "Cache evictions since process start",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Connection checkouts that hit pool_timeout",
+    ["pool"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections currently open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+
+def histogram_snapshot(histogram: Histogram, **labels) -> dict:
+    """Return count, sum and cumulative bucket counts for one labelled series."""
+    snapshot = {"count": 0, "sum": 0.0, "buckets": {}}
+    for metric in histogram.collect():
+        for sample in metric.samples:
+            if any(sample.labels.get(key) != value for key, value in labels.items()):
+                continue
+            if sample.name.endswith("_bucket"):
+                snapshot["buckets"][sample.labels["le"]] = int(sample.value)
+            elif sample.name.endswith("_count"):
+                snapshot["count"] = int(sample.value)
+            elif sample.name.endswith("_sum"):
+                snapshot["sum"] = sample.value
+    return snapshot
+
+
+def sample_value(metric, **labels) -> float:
+    """Return the current value of one labelled counter/gauge series."""
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name.endswith("_created"):
+                continue
+            if all(sample.labels.get(key) == value for key, value in labels.items()):
+                return sample.value
+    return 0.0
+
+
+_gauges_refreshed_at = 0.0
+
+
+def refresh_cache_gauges(force: bool = False) -> None:
+    """Copy cache stats into the cache gauges, at most every GAUGE_REFRESH_SECONDS."""
+    global _gauges_refreshed_at
+    now = time.monotonic()
+    if not force and now - _gauges_refreshed_at < GAUGE_REFRESH_SECONDS:
+        return
+    _gauges_refreshed_at = now
+
+    from app.core.catalog import catalog_cache
+    from app.core.principals import principal_cache
+    from app.core.security import token_cache
+
+    for name, cache in (("principals", principal_cache), ("tokens", token_cache), ("catalogs", catalog_cache)):
+        stats = cache.stats()
+        CACHE_ENTRIES.labels(name).set(stats["size"])
+        CACHE_HITS.labels(name).set(stats["hits"])
+        CACHE_MISSES.labels(name).set(stats["misses"])
+        CACHE_EVICTIONS.labels(name).set(stats["evictions"])
+
+
+def render_latest() -> tuple:
+    """Return the text exposition payload and its content type."""
+    refresh_cache_gauges(force=True)
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess directory."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,105 @@
+import logging
+import time
+from app.core import metrics
+from app.db.query_stats import count_queries
+
+
+logger = logging.getLogger("app.requests")
+
+
+class QueryStatsMiddleware:
+    """Counts SQL statements and DB time per request.
+
+    Adds ``X-DB-Queries``/``X-DB-Time`` (milliseconds) response headers and
+    logs them as structured fields; requests with a repeated statement
+    (likely N+1) are logged at WARNING.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        with count_queries() as stats:
+            async def send_with_stats(message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(stats.count).encode()))
+                    headers.append((b"x-db-time", str(stats.milliseconds).encode()))
+                    message = dict(message, headers=headers)
+                await send(message)
+            
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                fields = {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "db_queries": stats.count,
+                    "db_time_ms": stats.milliseconds,
+                }
+                if stats.repeated:
+                    fields["n_plus_one"] = sorted(stats.repeated)
+                    logger.warning("Repeated SQL statement detected", extra=fields)
+                else:
+                    logger.info("Request completed", extra=fields)
+
+
+class MetricsMiddleware:
+    """Records Prometheus request count, latency and in-flight metrics.
+
+    Requests are labelled by route template (``/api/orders/{order_id}``), not
+    the raw path, so label cardinality stays bounded; unmatched paths share
+    the ``unmatched`` label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.route_templates = {}
+
+    def route_template(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        template = self.route_templates.get(endpoint)
+        if template is None:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    template = route.path
+                    break
+            else:
+                template = "unmatched"
+            self.route_templates[endpoint] = template
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = self.route_template(scope)
+            metrics.HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(elapsed)
+            metrics.HTTP_REQUESTS.labels(scope["method"], route, str(status_code)).inc()
+            metrics.refresh_cache_gauges()
@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values) -> str:
+    """Encode the sort-key values of a row into an opaque, URL-safe cursor."""
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else
+         str(value) if isinstance(value, Decimal) else value for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """Decode a cursor from ``encode_cursor`` back into values of ``types``."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(
+            value if value is None else
+            datetime.fromisoformat(value) if type_ is datetime else type_(value)
+            for value, type_ in zip(values, types)
+        )
+    except (ValueError, TypeError, ArithmeticError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
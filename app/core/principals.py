@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.models import User, Supplier, UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of the user fields that routes read."""
+    id: int
+    email: str
+    full_name: str
+    role: UserRole
+    supplier_id: Optional[int]
+    restaurant_name: Optional[str]
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            supplier_id=user.supplier_id,
+            restaurant_name=user.restaurant_name,
+            created_at=user.created_at,
+        )
+
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop the cached principal for a user."""
+    principal_cache.pop(user_id)
+
+
+def invalidate_supplier(supplier_id: int) -> None:
+    """Drop the cached principals of every staff member of a supplier."""
+    principal_cache.discard_where(lambda _, principal: principal.supplier_id == supplier_id)
+
+
+# ORM-level writes invalidate automatically, once the transaction commits: the
+# flush-time hooks only note the ids on the session, so a request racing the
+# commit cannot re-cache the old row and a rollback evicts nothing. Bulk
+# ``query.update()``/``delete()`` calls bypass these hooks and must call
+# ``invalidate_user``/``invalidate_supplier``.
+def _pending(target, key: str) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(key, set()).add(target.id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_on_write(mapper, connection, target):
+    _pending(target, "principal_user_ids")
+
+
+@event.listens_for(Supplier, "after_update")
+@event.listens_for(Supplier, "after_delete")
+def _invalidate_supplier_on_write(mapper, connection, target):
+    _pending(target, "principal_supplier_ids")
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for user_id in session.info.pop("principal_user_ids", ()):
+        invalidate_user(user_id)
+    for supplier_id in session.info.pop("principal_supplier_ids", ()):
+        invalidate_supplier(supplier_id)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_uncommitted(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("principal_user_ids", None)
+        session.info.pop("principal_supplier_ids", None)
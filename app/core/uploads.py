@@ -0,0 +1,31 @@
+import codecs
+from typing import AsyncIterator
+from fastapi import HTTPException, Request, status
+
+
+MAX_UPLOAD_LINE_BYTES = 64 * 1024
+
+
+async def body_lines(request: Request) -> AsyncIterator[str]:
+    """Yield the request body line by line as it arrives."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in request.stream():
+        try:
+            pending += decoder.decode(chunk)
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Upload must be UTF-8 encoded"
+            )
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(pending) > MAX_UPLOAD_LINE_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Upload lines must be shorter than {MAX_UPLOAD_LINE_BYTES} bytes"
+            )
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield pending.rstrip("\r")
@@ -0,0 +1,72 @@
+import inspect
+import logging
+import time
+from fastapi import FastAPI
+from jose import jwt
+from sqlalchemy.orm import configure_mappers
+from app.core import hashing
+from app.core.config import settings
+from app.db.pool import pool_stats
+from app.db.replicas import replicas
+from app.db.session import ping, primary_engine, warm_up_engine
+
+
+logger = logging.getLogger("app.warmup")
+
+
+async def warm_up(app: FastAPI) -> dict:
+    """Pay the lazy first-request costs before the worker takes traffic.
+
+    Opens DB_POOL_WARMUP_CONNECTIONS connections per engine, configures the ORM
+    mappers, builds the OpenAPI schema (which touches every request/response
+    model), starts the password-hashing pool with bcrypt loaded and runs one JWT
+    round trip. A failing step is logged and skipped; ``/ready`` reports the
+    database state.
+    """
+    timings = {}
+
+    async def step(name, func, *args):
+        started = time.perf_counter()
+        try:
+            result = func(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.warning("Warm-up step %s failed", name, exc_info=True)
+        timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    await step("db_pool", warm_up_engine, primary_engine(), settings.DB_POOL_WARMUP_CONNECTIONS)
+    for replica in replicas:
+        await step(replica.name, warm_up_engine, replica.engine, settings.DB_POOL_WARMUP_CONNECTIONS)
+    await step("orm_mappers", configure_mappers)
+    await step("openapi", app.openapi)
+    await step("bcrypt", hashing.hash_password, "warm-up")
+    await step("jwt", _jwt_round_trip)
+
+    logger.info("Warm-up complete", extra={"warmup_ms": timings})
+    return timings
+
+
+def _jwt_round_trip() -> None:
+    token = jwt.encode({"sub": "warm-up"}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+
+
+async def readiness() -> dict:
+    """Check the primary (and replicas) with a round trip and report pool state.
+
+    Only the primary decides readiness; reads fall back to it when a replica
+    is down.
+    """
+    report = {"status": "ready", "database": {}, "pools": {}}
+    databases = [("primary", primary_engine())] + [(replica.name, replica.engine) for replica in replicas]
+    for name, db_engine in databases:
+        try:
+            report["database"][name] = {"latency_ms": await ping(db_engine)}
+        except Exception as exc:
+            report["database"][name] = {"error": type(exc).__name__}
+            if name == "primary":
+                report["status"] = "unavailable"
+        sync_engine = getattr(db_engine, "sync_engine", db_engine)
+        report["pools"][name] = pool_stats(sync_engine.pool)
+    return report
@@ -0,0 +1,87 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_WAIT, DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW, histogram_snapshot, sample_value
+)
+
+
+class InstrumentedPoolMixin:
+    """Records checkout wait time, timeouts and occupancy for a queue pool.
+
+    The metrics label is the engine's ``pool_logging_name``, which survives
+    ``Pool.recreate()`` on ``engine.dispose()``.
+    """
+
+    @property
+    def metrics_label(self) -> str:
+        return self.logging_name or "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(self.metrics_label).inc()
+            raise
+        DB_POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(time.perf_counter() - started)
+        self._update_gauges()
+        return connection
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        DB_POOL_CHECKED_OUT.labels(self.metrics_label).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(self.metrics_label).set(max(self.overflow(), 0))
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url, name: str, is_async: bool, settings) -> dict:
+    """Build ``create_engine`` pool keyword arguments from ``Settings``."""
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_logging_name": name,
+    }
+    # In-memory SQLite needs its dialect's single-connection pool.
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+def pool_stats(pool) -> dict:
+    """Return occupancy, timeout and checkout-wait figures for a pool."""
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool.timeout(),
+        )
+    if isinstance(pool, InstrumentedPoolMixin):
+        stats["checkout_timeouts"] = int(
+            sample_value(DB_POOL_CHECKOUT_TIMEOUTS, pool=pool.metrics_label)
+        )
+        stats["checkout_wait_seconds"] = histogram_snapshot(
+            DB_POOL_CHECKOUT_WAIT, pool=pool.metrics_label
+        )
+    return stats
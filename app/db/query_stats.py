@@ -0,0 +1,97 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+
+
+class NPlusOneQueryError(Exception):
+    """Raised in SQL_STRICT_MODE when a statement repeats past the threshold."""
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by ``query_budget`` when a block runs more statements than allowed."""
+
+
+class QueryStats:
+    """Statement count, DB time and repeated statements for one request or block."""
+
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+        self.repeated: set = set()
+
+    @property
+    def milliseconds(self) -> float:
+        return round(self.seconds * 1000, 2)
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace and IN-list placeholders so equivalent queries match."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", statement)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        context.query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    started = getattr(context, "query_started", None)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    # Enclosing blocks see the statement too, e.g. a test's query_budget
+    # around a request that the middleware counts on its own.
+    block = stats
+    while block is not None:
+        block.count += 1
+        block.seconds += elapsed
+        block = block.parent
+    
+    normalized = normalize_statement(statement)
+    stats.statements[normalized] += 1
+    if stats.statements[normalized] > settings.SQL_N_PLUS_ONE_THRESHOLD and normalized not in stats.repeated:
+        stats.repeated.add(normalized)
+        if settings.SQL_STRICT_MODE:
+            raise NPlusOneQueryError(
+                f"Statement executed more than {settings.SQL_N_PLUS_ONE_THRESHOLD} times: {normalized}"
+            )
+
+
+@contextmanager
+def count_queries():
+    """Collect ``QueryStats`` for the statements run inside the block, nested blocks included."""
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """Fail if the block runs more than ``max_queries`` statements."""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(f"Expected at most {max_queries} queries, ran {stats.count}")
@@ -0,0 +1,112 @@
+import itertools
+import time
+from typing import List, Optional
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import decode_access_token
+from app.db.pool import pool_options
+from app.db.session import get_db, open_session, session_slots, to_async_url
+
+
+class Replica:
+    """A read replica with its own engine, session factory and health state."""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.slots = None
+        self.unhealthy_until = 0.0
+        if settings.DB_ASYNC:
+            async_url = to_async_url(url)
+            self.engine = create_async_engine(
+                async_url, **pool_options(make_url(async_url), name, True, settings)
+            )
+            self.session_factory = async_sessionmaker(
+                self.engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+            )
+        else:
+            self.engine = create_engine(url, **pool_options(make_url(url), name, False, settings))
+            self.session_factory = sessionmaker(
+                autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+            )
+            self.slots = session_slots()
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    @property
+    def pool(self):
+        return self.engine.sync_engine.pool if settings.DB_ASYNC else self.engine.pool
+
+    def mark_unhealthy(self) -> None:
+        self.unhealthy_until = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+
+    def session(self):
+        return open_session(self.session_factory, self.slots)
+
+
+replicas: List[Replica] = [
+    Replica(f"replica-{index}", url)
+    for index, url in enumerate(settings.DB_READ_REPLICA_URLS)
+]
+_round_robin = itertools.count()
+
+# Users who committed a write recently keep reading from the primary so they
+# see their own changes despite replication lag.
+recent_writers = TTLCache(maxsize=100000, ttl=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_writer(session):
+    user_id = session.info.get("user_id")
+    if user_id is not None and replicas:
+        recent_writers.set(user_id, True)
+
+
+def _request_user_id(request: Request) -> Optional[int]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_access_token(token)
+    try:
+        return int(payload["sub"]) if payload else None
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _candidates() -> List[Replica]:
+    healthy = [replica for replica in replicas if replica.healthy]
+    if not healthy:
+        return []
+    start = next(_round_robin) % len(healthy)
+    return healthy[start:] + healthy[:start]
+
+
+async def get_read_db(request: Request, primary=Depends(get_db)):
+    """Dependency for read-only routes: a healthy replica session, else the primary.
+
+    Replicas are tried round-robin; one that fails to connect is skipped for
+    DB_REPLICA_RETRY_SECONDS. Users who wrote within the last
+    DB_READ_YOUR_WRITES_SECONDS are pinned to the primary. The primary
+    fallback is the request's ``get_db`` session, so a request never holds
+    two primary connections at once.
+    """
+    user_id = _request_user_id(request) if replicas else None
+    if replicas and not (user_id is not None and recent_writers.get(user_id)):
+        for replica in _candidates():
+            async with replica.session() as db:
+                try:
+                    await db.connection()
+                except (DBAPIError, OSError):
+                    replica.mark_unhealthy()
+                    continue
+                yield db
+                return
+
+    yield primary
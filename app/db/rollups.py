@@ -0,0 +1,135 @@
+"""Incrementally maintained revenue rollups.
+
+An order counts towards revenue while it is ACCEPTED or COMPLETED. Status
+changes that enter or leave that set add or subtract the order's lines from
+every rollup table in the same transaction, so the analytics endpoints never
+touch ``orders``/``order_items``. ``rebuild`` recomputes the rollups from
+scratch:
+
+    python -m app.db.rollups [--supplier-id 3]
+"""
+import argparse
+import json
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import delete, distinct, func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal, engine
+from app.models.models import (
+    Order, OrderItem, OrderRollup, OrderStatus, ProductRollup, RevenueRollup
+)
+
+REVENUE_STATUSES = frozenset({OrderStatus.ACCEPTED, OrderStatus.COMPLETED})
+MEASURES = ("quantity", "revenue", "order_count")
+# Every table is keyed by (supplier_id, day, *dimensions).
+ROLLUPS = {
+    RevenueRollup: ("product_id", "consumer_id"),
+    ProductRollup: ("product_id",),
+    OrderRollup: ("consumer_id",),
+}
+
+
+def _upsert(model):
+    """INSERT ... ON CONFLICT (primary key) that adds the measures to the existing row."""
+    dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=[column.name for column in model.__table__.primary_key],
+        set_={name: model.__table__.c[name] + stmt.excluded[name] for name in MEASURES},
+    )
+
+
+async def record_status_changes(
+    db: AsyncSession, changes: Iterable[Tuple[int, OrderStatus]], new_status: OrderStatus
+) -> None:
+    """Apply orders moving to ``new_status`` to the rollups.
+
+    ``changes`` holds the (order_id, old_status) pairs of transitions made in
+    the current transaction; the caller commits.
+    """
+    signs = {
+        order_id: (new_status in REVENUE_STATUSES) - (old_status in REVENUE_STATUSES)
+        for order_id, old_status in changes
+    }
+    signs = {order_id: sign for order_id, sign in signs.items() if sign}
+    if not signs:
+        return
+
+    lines = (await db.execute(
+        select(
+            Order.id, Order.supplier_id, Order.consumer_id, Order.created_at,
+            OrderItem.product_id, OrderItem.quantity, OrderItem.subtotal
+        )
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .where(Order.id.in_(signs))
+    )).all()
+
+    for model, dimensions in ROLLUPS.items():
+        buckets = defaultdict(lambda: [0, Decimal("0"), set()])
+        for line in lines:
+            key = (line.supplier_id, line.created_at.date()) + tuple(getattr(line, name) for name in dimensions)
+            bucket = buckets[key]
+            bucket[0] += signs[line.id] * line.quantity
+            bucket[1] += signs[line.id] * line.subtotal
+            bucket[2].add(line.id)
+
+        keys = [column.name for column in model.__table__.primary_key]
+        await db.execute(_upsert(model), [
+            dict(zip(keys, key), quantity=quantity, revenue=revenue,
+                 order_count=sum(signs[order_id] for order_id in order_ids))
+            for key, (quantity, revenue, order_ids) in buckets.items()
+        ])
+
+
+def rebuild(db: Session, supplier_id: Optional[int] = None) -> dict:
+    """Recompute the rollups from the orders, for one supplier or all of them.
+
+    Runs in the caller's transaction. On PostgreSQL the rollup tables are
+    locked first, so status changes made meanwhile wait and apply on top of
+    the rebuilt rows instead of being lost.
+    """
+    if engine.dialect.name == "postgresql":
+        tables = ", ".join(model.__tablename__ for model in ROLLUPS)
+        db.execute(text(f"LOCK TABLE {tables} IN EXCLUSIVE MODE"))
+
+    scope = [Order.status.in_(REVENUE_STATUSES)]
+    if supplier_id is not None:
+        scope.append(Order.supplier_id == supplier_id)
+    columns = {"product_id": OrderItem.product_id, "consumer_id": Order.consumer_id}
+    measures = (func.sum(OrderItem.quantity), func.sum(OrderItem.subtotal), func.count(distinct(Order.id)))
+
+    counts = {}
+    for model, dimensions in ROLLUPS.items():
+        clear = delete(model)
+        if supplier_id is not None:
+            clear = clear.where(model.supplier_id == supplier_id)
+        db.execute(clear)
+
+        keys = (Order.supplier_id, func.date(Order.created_at)) + tuple(columns[name] for name in dimensions)
+        result = db.execute(insert(model).from_select(
+            [column.name for column in model.__table__.primary_key] + list(MEASURES),
+            select(*keys, *measures)
+            .join(OrderItem, OrderItem.order_id == Order.id)
+            .where(*scope)
+            .group_by(*keys)
+        ))
+        counts[model.__tablename__] = result.rowcount
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the revenue rollups from the orders table.")
+    parser.add_argument("--supplier-id", type=int, help="only rebuild this supplier's rows")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        counts = rebuild(db, args.supplier_id)
+        db.commit()
+    print(json.dumps(counts))
+
+
+if __name__ == "__main__":
+    main()
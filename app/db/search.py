@@ -0,0 +1,44 @@
+import re
+from typing import List, Tuple
+from sqlalchemy import column, func, literal_column, or_, table
+from sqlalchemy.sql import Select
+from app.db.session import engine
+from app.models.models import PRODUCT_SEARCH_DOCUMENT, Product
+
+MAX_SEARCH_TERMS = 8
+# bm25 weights for (name, description): a hit in the name counts ten times.
+FTS_WEIGHTS = (10.0, 1.0)
+
+products_fts = table("products_fts", column("rowid"))
+
+
+def search_terms(text: str) -> List[str]:
+    """Split a search box string into lower-case word tokens.
+
+    Only word characters survive, so the tokens are safe to splice into
+    FTS5 / tsquery syntax.
+    """
+    return re.findall(r"\w+", text.lower())[:MAX_SEARCH_TERMS]
+
+
+def match_products(query: Select, terms: List[str]) -> Tuple[Select, object]:
+    """Restrict a select over ``products`` to rows matching every term (as a prefix).
+
+    Returns the filtered query and a score expression, lower is better, to
+    order by. Uses the FTS5 table on SQLite, and the tsvector and trigram
+    indexes on PostgreSQL (where a close trigram match on the name also
+    counts, which catches typos).
+    """
+    if engine.dialect.name == "postgresql":
+        document = literal_column(PRODUCT_SEARCH_DOCUMENT)
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        phrase = " ".join(terms)
+        query = query.where(or_(document.op("@@")(tsquery), Product.name.op("%")(phrase)))
+        return query, -(func.ts_rank(document, tsquery) + func.similarity(Product.name, phrase))
+
+    match = " ".join(f'"{term}"*' for term in terms)
+    query = (
+        query.join(products_fts, products_fts.c.rowid == Product.id)
+        .where(literal_column("products_fts").match(match))
+    )
+    return query, func.bm25(literal_column("products_fts"), *FTS_WEIGHTS)
@@ -1,18 +1,220 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.db.pool import pool_options
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync database URL onto its async driver (asyncpg / aiosqlite)."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+# The sync engine is always available: Alembic, scripts and the
+# ``DB_ASYNC=False`` fallback use it.
+engine = create_engine(
+    settings.DATABASE_URL,
+    **pool_options(make_url(settings.DATABASE_URL), "primary", False, settings)
+)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC:
+    async_url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    async_engine = create_async_engine(
+        async_url,
+        **pool_options(make_url(async_url), "primary-async", True, settings)
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
 
 Base = declarative_base()
 
 
-def get_db():
+class ThreadedSession:
+    """Async facade over a sync ``Session`` that runs each call on the threadpool.
+
+    Implements the subset of the ``AsyncSession`` API used by the routes so the
+    async handlers work unchanged when ``DB_ASYNC`` is off.
+    """
+
+    def __init__(self, sync_session: Session):
+        self.sync_session = sync_session
+
+    @property
+    def info(self) -> dict:
+        return self.sync_session.info
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement, params=None, execution_options=None, **kw):
+        # Buffer rows (and run eager loaders) on the worker thread, like AsyncSession.
+        options = dict(execution_options or {}, prebuffer_rows=True)
+        return await run_in_threadpool(
+            self.sync_session.execute, statement, params, execution_options=options, **kw
+        )
+
+    async def stream(self, statement, params=None, execution_options=None, **kw):
+        """Execute with a server-side cursor; fetch rows with ``partitions()``."""
+        options = dict(execution_options or {}, stream_results=True)
+        result = await run_in_threadpool(
+            self.sync_session.execute, statement, params, execution_options=options, **kw
+        )
+        return ThreadedStreamResult(result)
+
+    async def scalar(self, statement, params=None, **kw):
+        result = await self.execute(statement, params, **kw)
+        return result.scalar()
+
+    async def scalars(self, statement, params=None, **kw):
+        result = await self.execute(statement, params, **kw)
+        return result.scalars()
+
+    async def get(self, entity, ident, **kw):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kw)
+
+    async def refresh(self, instance, attribute_names=None) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+
+    async def delete(self, instance) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def connection(self):
+        return await run_in_threadpool(self.sync_session.connection)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadedStreamResult:
+    """Async view of a streaming sync ``Result``, fetched on the threadpool."""
+
+    def __init__(self, result):
+        self.result = result
+
+    async def partitions(self, size=None):
+        while True:
+            rows = await run_in_threadpool(self.result.fetchmany, size)
+            if not rows:
+                break
+            yield rows
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.result.close)
+
+
+# A threaded session holds its connection across several threadpool hops, so
+# sessions must never outnumber pool connections: otherwise every worker thread
+# can end up blocked on pool checkout while the sessions holding connections
+# wait for a free thread. Waiting for a slot happens on the event loop instead.
+def session_slots() -> asyncio.Semaphore:
+    """Return a semaphore sized to one engine's pool capacity."""
+    return asyncio.Semaphore(settings.DB_POOL_SIZE + max(settings.DB_MAX_OVERFLOW, 0))
+
+
+_sync_session_slots = session_slots()
+
+
+@asynccontextmanager
+async def open_session(session_factory, slots: asyncio.Semaphore = None):
+    """Open an async session, or a ``ThreadedSession`` when ``slots`` is given."""
+    if slots is None:
+        async with session_factory() as db:
+            yield db
+        return
+
+    async with slots:
+        db = ThreadedSession(session_factory())
+        try:
+            yield db
+        finally:
+            await db.close()
+
+
+def primary_session():
+    """Open a session on the primary database."""
+    if AsyncSessionLocal is not None:
+        return open_session(AsyncSessionLocal)
+    return open_session(SessionLocal, _sync_session_slots)
+
+
+async def get_db():
     """Dependency for getting database sessions."""
-    db = SessionLocal()
-    try:
+    async with primary_session() as db:
         yield db
+
+
+def _open_connections(sync_engine, count: int) -> None:
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(sync_engine.connect())
     finally:
-        db.close()
+        for connection in connections:
+            connection.close()
+
+
+async def warm_up_engine(db_engine, count: int) -> None:
+    """Open ``count`` connections at once and return them to the pool."""
+    count = min(count, settings.DB_POOL_SIZE)
+    if count <= 0:
+        return
+    if isinstance(db_engine, AsyncEngine):
+        connections = []
+        try:
+            for _ in range(count):
+                connections.append(await db_engine.connect())
+        finally:
+            for connection in connections:
+                await connection.close()
+    else:
+        await run_in_threadpool(_open_connections, db_engine, count)
+
+
+def _ping(sync_engine) -> None:
+    with sync_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def ping(db_engine) -> float:
+    """Run ``SELECT 1`` and return the round trip in milliseconds."""
+    started = time.perf_counter()
+    if isinstance(db_engine, AsyncEngine):
+        async with db_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    else:
+        await run_in_threadpool(_ping, db_engine)
+    return round((time.perf_counter() - started) * 1000, 2)
+
 
+def primary_engine():
+    """Return the engine request sessions use for the primary database."""
+    return async_engine if async_engine is not None else engine
@@ -1,13 +1,26 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from app.core import metrics
 from app.core.config import settings
-from app.api.routes import auth, suppliers, products, orders, messages, complaints
+from app.core.middleware import MetricsMiddleware, QueryStatsMiddleware
+from app.core.warmup import readiness, warm_up
+from app.api.routes import auth, suppliers, products, orders, messages, complaints, analytics, admin
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.warmup_ms = await warm_up(app)
+    yield
+    metrics.mark_process_dead()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     debug=settings.DEBUG,
     version="1.0.0",
-    description="B2B Food Supply Platform - Connecting suppliers with restaurants"
+    description="B2B Food Supply Platform - Connecting suppliers with restaurants",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -16,7 +29,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Queries", "X-DB-Time", "X-Next-Cursor", "ETag"],
 )
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router)
 app.include_router(suppliers.router)
@@ -24,10 +40,12 @@ app.include_router(products.router)
 app.include_router(orders.router)
 app.include_router(messages.router)
 app.include_router(complaints.router)
+app.include_router(analytics.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint."""
     return {
         "name": settings.APP_NAME,
@@ -38,7 +56,23 @@ def root():
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: database round trip and pool state."""
+    report = await readiness()
+    report["warmup_ms"] = getattr(app.state, "warmup_ms", None)
+    status_code = 200 if report["status"] == "ready" else 503
+    return JSONResponse(content=report, status_code=status_code)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus metrics in text exposition format."""
+    payload, content_type = metrics.render_latest()
+    return Response(content=payload, headers={"Content-Type": content_type})
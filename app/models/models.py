@@ -1,8 +1,9 @@
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, Numeric, DateTime,
-    ForeignKey, Enum, CheckConstraint, UniqueConstraint
+    Column, Integer, String, Text, Boolean, Numeric, DateTime, Date,
+    ForeignKey, Enum, CheckConstraint, UniqueConstraint, Index
 )
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import relationship
 import enum
 from app.db.session import Base
@@ -66,6 +67,7 @@ class Supplier(Base):
     address = Column(String, nullable=True)
     phone = Column(String, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
+    catalog_version = Column(Integer, default=1, server_default="1", nullable=False)  # bumped on product/stock changes
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -102,6 +104,7 @@ class Product(Base):
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+    sku = Column(String, nullable=True)  # supplier's own article number / ERP id
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     unit = Column(String, nullable=False)  # e.g., "kg", "l", "pack"
@@ -112,11 +115,66 @@ class Product(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # Unique index rather than constraint so SQLite can add it in a migration;
+        # also the conflict target of the bulk upsert.
+        Index('uq_products_supplier_sku', 'supplier_id', 'sku', unique=True),
+        # Keyset pagination of a supplier's products, one per sort key.
+        Index('ix_products_supplier_id_id', 'supplier_id', 'id'),
+        Index('ix_products_supplier_name', 'supplier_id', 'name', 'id'),
+        Index('ix_products_supplier_price', 'supplier_id', 'price', 'id'),
+        Index('ix_products_supplier_stock', 'supplier_id', 'stock_quantity', 'id'),
+        Index('ix_products_supplier_updated', 'supplier_id', 'updated_at', 'id'),
+    )
+    
     # Relationships
     supplier = relationship("Supplier", back_populates="products")
     order_items = relationship("OrderItem", back_populates="product", cascade="all, delete")
 
 
+# Full-text search index over products.name/description, maintained by the
+# database in the same transaction as every product write: an FTS5 table kept
+# in sync by triggers on SQLite, expression GIN indexes on PostgreSQL. Created
+# here for ``create_all`` and by the 9d3c6a2f8e15 migration (keep them in sync).
+PRODUCT_SEARCH_DOCUMENT = "to_tsvector('simple', products.name || ' ' || coalesce(products.description, ''))"
+
+PRODUCT_SEARCH_DDL = {
+    "sqlite": [
+        "CREATE VIRTUAL TABLE products_fts USING fts5("
+        "name, description, content='products', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        "CREATE TRIGGER products_fts_insert AFTER INSERT ON products BEGIN "
+        "INSERT INTO products_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+        "CREATE TRIGGER products_fts_delete AFTER DELETE ON products BEGIN "
+        "INSERT INTO products_fts(products_fts, rowid, name, description) "
+        "VALUES ('delete', old.id, old.name, old.description); END",
+        "CREATE TRIGGER products_fts_update AFTER UPDATE OF name, description ON products BEGIN "
+        "INSERT INTO products_fts(products_fts, rowid, name, description) "
+        "VALUES ('delete', old.id, old.name, old.description); "
+        "INSERT INTO products_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    ],
+    "postgresql": [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"CREATE INDEX ix_products_search ON products USING gin (({PRODUCT_SEARCH_DOCUMENT}))",
+        "CREATE INDEX ix_products_name_trgm ON products USING gin (name gin_trgm_ops)",
+    ],
+}
+
+# Objects created by the DDL above. They are not in the metadata, so
+# alembic/env.py uses these names to keep autogenerate from dropping them
+# (the FTS5 table also owns shadow tables named ``products_fts_*``).
+PRODUCT_SEARCH_TABLE = "products_fts"
+PRODUCT_SEARCH_INDEXES = ("ix_products_search", "ix_products_name_trgm")
+
+for _dialect, _statements in PRODUCT_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Product.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(
+    Product.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS products_fts").execute_if(dialect="sqlite")
+)
+
+
 class Order(Base):
     __tablename__ = "orders"
     
@@ -125,9 +183,16 @@ class Order(Base):
     consumer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(Enum(OrderStatus), default=OrderStatus.PENDING, nullable=False)
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    total_amount = Column(Numeric(12, 2), default=0, server_default="0", nullable=False)
+    item_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        Index('ix_orders_supplier_status_created', 'supplier_id', 'status', 'created_at'),
+        Index('ix_orders_consumer_created', 'consumer_id', 'created_at'),
+    )
+    
     # Relationships
     supplier = relationship("Supplier", back_populates="orders")
     consumer = relationship("User", back_populates="consumer_orders", foreign_keys=[consumer_id])
@@ -135,10 +200,6 @@ class Order(Base):
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
     complaints = relationship("Complaint", back_populates="order")
 
-    @property
-    def total_amount(self):
-        return sum((item.subtotal for item in self.items), 0)
-
 
 class OrderItem(Base):
     __tablename__ = "order_items"
@@ -150,11 +211,57 @@ class OrderItem(Base):
     unit_price = Column(Numeric(10, 2), nullable=False)
     subtotal = Column(Numeric(10, 2), nullable=False)
     
+    __table_args__ = (
+        # Covers the per-order line lookups and the pick-list aggregation.
+        Index('ix_order_items_order_product_quantity', 'order_id', 'product_id', 'quantity'),
+    )
+    
     # Relationships
     order = relationship("Order", back_populates="items")
     product = relationship("Product", back_populates="order_items")
 
 
+class RevenueRollup(Base):
+    """Daily sales per supplier, product and consumer (ACCEPTED/COMPLETED orders)."""
+    __tablename__ = "revenue_rollups"
+    
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), primary_key=True)
+    day = Column(Date, primary_key=True)  # order creation date (UTC)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    consumer_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    quantity = Column(Integer, default=0, nullable=False)
+    revenue = Column(Numeric(14, 2), default=0, nullable=False)
+    order_count = Column(Integer, default=0, nullable=False)  # orders containing the product
+
+
+class ProductRollup(Base):
+    """``RevenueRollup`` summed over consumers, for per-product breakdowns."""
+    __tablename__ = "product_rollups"
+    
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    quantity = Column(Integer, default=0, nullable=False)
+    revenue = Column(Numeric(14, 2), default=0, nullable=False)
+    order_count = Column(Integer, default=0, nullable=False)
+
+
+class OrderRollup(Base):
+    """Daily order totals per supplier and consumer (ACCEPTED/COMPLETED orders).
+    
+    Kept separately because distinct order counts do not add up across
+    products.
+    """
+    __tablename__ = "order_rollups"
+    
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    consumer_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    quantity = Column(Integer, default=0, nullable=False)
+    revenue = Column(Numeric(14, 2), default=0, nullable=False)
+    order_count = Column(Integer, default=0, nullable=False)
+
+
 class Message(Base):
     __tablename__ = "messages"
     
@@ -1,6 +1,6 @@
-from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, ConfigDict
+from datetime import date, datetime
+from typing import Dict, Optional, List
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from decimal import Decimal
 from app.models.models import UserRole, LinkStatus, OrderStatus, ComplaintStatus
 
@@ -111,6 +111,7 @@ class LinkWithConsumerResponse(LinkResponse):
 
 # Product Schemas
 class ProductBase(BaseModel):
+    sku: Optional[str] = Field(None, min_length=1, max_length=100)
     name: str
     description: Optional[str] = None
     unit: str
@@ -124,6 +125,7 @@ class ProductCreate(ProductBase):
 
 
 class ProductUpdate(BaseModel):
+    sku: Optional[str] = Field(None, min_length=1, max_length=100)
     name: Optional[str] = None
     description: Optional[str] = None
     unit: Optional[str] = None
@@ -136,6 +138,7 @@ class ProductUpdate(BaseModel):
 class ProductResponse(BaseModel):
     id: int
     supplier_id: int
+    sku: Optional[str] = None
     name: str
     description: Optional[str] = None
     unit: str
@@ -149,6 +152,67 @@ class ProductResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProductListItem(BaseModel):
+    """ProductResponse with every field optional, for sparse fieldsets."""
+    id: int
+    supplier_id: Optional[int] = None
+    sku: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    unit: Optional[str] = None
+    price: Optional[Decimal] = None
+    stock_quantity: Optional[int] = None
+    min_order_quantity: Optional[int] = None
+    is_active: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ProductSearchResponse(ProductResponse):
+    supplier_name: str = ""
+
+
+class CatalogSupplierGroup(BaseModel):
+    supplier_id: int
+    supplier_name: str
+    etag: str
+    not_modified: bool = False
+    products: List[ProductResponse] = []
+
+
+class ProductUpsert(BaseModel):
+    """One price-list row. Only ``sku`` is required; omitted fields keep their
+    current value (a new SKU needs name, unit, price and stock_quantity)."""
+    sku: str = Field(min_length=1, max_length=100)
+    name: Optional[str] = Field(None, min_length=1)
+    description: Optional[str] = None
+    unit: Optional[str] = Field(None, min_length=1)
+    price: Optional[Decimal] = Field(None, ge=0)
+    stock_quantity: Optional[int] = Field(None, ge=0)
+    min_order_quantity: Optional[int] = Field(None, ge=1)
+    is_active: Optional[bool] = None
+
+
+class ProductUpsertError(BaseModel):
+    line: int
+    sku: Optional[str] = None
+    detail: str
+
+
+class ProductUpsertResponse(BaseModel):
+    created: int
+    updated: int
+    unchanged: int
+    rows_rejected: int
+    errors: List[ProductUpsertError]
+    errors_truncated: bool = False
+
+
+class ProductCountsResponse(BaseModel):
+    total: int
+    active: int
+
+
 # Order Schemas
 class OrderItemCreate(BaseModel):
     product_id: int
@@ -176,6 +240,39 @@ class OrderStatusUpdate(BaseModel):
     status: OrderStatus
 
 
+class OrderImportError(BaseModel):
+    line: int
+    order_ref: Optional[str] = None
+    detail: str
+
+
+class OrderImportResponse(BaseModel):
+    orders_created: int
+    lines_imported: int
+    lines_rejected: int
+    order_ids: List[int]
+    errors: List[OrderImportError]
+    errors_truncated: bool = False
+
+
+class OrderBulkStatusUpdate(BaseModel):
+    order_ids: List[int] = Field(min_length=1, max_length=500)
+    status: OrderStatus
+
+
+class OrderBulkStatusResult(BaseModel):
+    order_id: int
+    success: bool
+    status: Optional[OrderStatus] = None
+    detail: Optional[str] = None
+
+
+class OrderBulkStatusResponse(BaseModel):
+    updated: int
+    failed: int
+    results: List[OrderBulkStatusResult]
+
+
 class OrderResponse(BaseModel):
     id: int
     supplier_id: int
@@ -186,6 +283,7 @@ class OrderResponse(BaseModel):
     updated_at: datetime
     items: List[OrderItemResponse] = []
     total_amount: Decimal
+    item_count: int
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -198,6 +296,45 @@ class OrderWithDetailsResponse(OrderResponse):
     model_config = ConfigDict(from_attributes=True)
 
 
+class OrderSummaryResponse(BaseModel):
+    id: int
+    supplier_id: int
+    consumer_id: int
+    status: OrderStatus
+    created_by_user_id: int
+    created_at: datetime
+    updated_at: datetime
+    total_amount: Decimal
+    item_count: int
+    supplier: SupplierResponse
+    consumer: UserResponse
+    has_complaint: bool = False
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderCountsResponse(BaseModel):
+    total: int
+    by_status: Dict[OrderStatus, int]
+
+
+class PickListConsumer(BaseModel):
+    consumer_id: int
+    restaurant_name: Optional[str] = None
+    quantity: int
+    order_count: int
+
+
+class PickListItem(BaseModel):
+    product_id: int
+    product_name: str
+    unit: str
+    stock_quantity: int
+    quantity: int
+    order_count: int
+    consumers: List[PickListConsumer]
+
+
 # Message Schemas
 class MessageCreate(BaseModel):
     content: str
@@ -245,3 +382,14 @@ class ComplaintWithDetailsResponse(ComplaintResponse):
     
     model_config = ConfigDict(from_attributes=True)
 
+
+
+# Analytics Schemas
+class RevenueBucket(BaseModel):
+    """One row of a revenue breakdown; only the grouped-by key is set."""
+    day: Optional[date] = None
+    product_id: Optional[int] = None
+    consumer_id: Optional[int] = None
+    quantity: int
+    revenue: Decimal
+    order_count: int
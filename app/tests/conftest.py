@@ -0,0 +1,61 @@
+import asyncio
+import os
+import tempfile
+
+# Tests recreate every table, so they never run against DATABASE_URL; point
+# TEST_DATABASE_URL at PostgreSQL to run them there.
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='marketplace-tests-')}/test.db"
+)
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.catalog import catalog_cache
+from app.core.principals import principal_cache
+from app.core.security import token_cache
+from app.db.replicas import recent_writers
+from app.main import app
+from benchmarks.seed import DatasetConfig, seed
+
+
+@event.listens_for(Engine, "connect")
+def _enforce_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores foreign keys by default; enforce them as PostgreSQL does.
+    if os.environ["DATABASE_URL"].startswith("sqlite"):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+@pytest.fixture
+def dataset():
+    """Seed a fresh database; call with ``DatasetConfig`` overrides."""
+    def make(**overrides):
+        for cache in (catalog_cache, principal_cache, token_cache, recent_writers):
+            cache.clear()
+        return seed(DatasetConfig(**overrides))
+    return make
+
+
+@pytest.fixture
+def run_api():
+    """Run ``scenario(client)`` against the app in-process, on one event loop.
+
+    Requests run in the caller's context, so ``count_queries`` and
+    ``query_budget`` around them see the statements they execute.
+    """
+    def run(scenario):
+        async def main():
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test", timeout=300
+            ) as client:
+                return await scenario(client)
+        return asyncio.run(main())
+    return run
+
+
+def auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
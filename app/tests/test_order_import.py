@@ -0,0 +1,57 @@
+import pytest
+from app.core.config import settings
+from app.tests.conftest import auth
+
+
+@pytest.fixture
+def importer(dataset, run_api, monkeypatch):
+    """Post CSV lines (ref, product index, quantity) as one import; return the report."""
+    monkeypatch.setattr(settings, "ORDER_IMPORT_MAX_ORDER_LINES", 5)
+    monkeypatch.setattr(settings, "ORDER_IMPORT_REF_WINDOW", 2)
+    monkeypatch.setattr(settings, "ORDER_IMPORT_BATCH_LINES", 4)
+    fx = dataset(suppliers=1, consumers=1, links_per_consumer=1, products_per_supplier=20, orders_per_link=0)
+    link = fx.links[0]
+    products = fx.products[link["supplier_id"]]
+    token = fx.consumers[link["consumer_id"]]["token"]
+
+    def post(lines):
+        body = "order_ref,product_id,quantity\n" + "".join(
+            f"{ref},{products[index]},{quantity}\n" for ref, index, quantity in lines
+        )
+
+        async def scenario(client):
+            return await client.post(
+                "/api/orders/import", params={"supplier_id": link["supplier_id"]},
+                content=body, headers={**auth(token), "Content-Type": "text/csv"},
+            )
+
+        response = run_api(scenario)
+        assert response.status_code == 201, response.text
+        return response.json()
+    return post
+
+
+def test_order_over_the_line_cap_is_rejected_whole(importer):
+    report = importer(
+        [("A", i, 1) for i in range(8)] + [("B", 0, 1), ("B", 1, 1)]
+    )
+    assert report["orders_created"] == 1
+    assert report["lines_imported"] == 2
+    assert report["lines_rejected"] == 8
+    assert [(e["line"], e["order_ref"]) for e in report["errors"]] == [(7, "A")]
+
+
+def test_file_without_refs_is_one_capped_order(importer):
+    report = importer([("", i, 1) for i in range(6)])
+    assert report["orders_created"] == 0
+    assert report["lines_rejected"] == 6
+
+
+def test_repeated_ref_is_only_tracked_within_the_window(importer):
+    report = importer([
+        ("A", 0, 1), ("B", 1, 1), ("A", 2, 1),  # A is still within the last two orders
+        ("C", 3, 1), ("D", 4, 1), ("E", 5, 1), ("B", 6, 1),  # B has left the window: a new order
+    ])
+    assert [(e["line"], e["order_ref"]) for e in report["errors"]] == [(4, "A")]
+    assert report["orders_created"] == 6
+    assert report["lines_imported"] == 6
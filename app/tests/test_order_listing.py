@@ -0,0 +1,36 @@
+from collections import Counter
+from app.tests.conftest import auth
+
+
+def test_summary_counts_every_order_not_just_the_first_page(dataset, run_api):
+    fx = dataset(suppliers=1, consumers=3, links_per_consumer=1, products_per_supplier=10, orders_per_link=40)
+    owner = next(iter(fx.owners.values()))
+    expected = Counter(order["status"] for order in fx.orders)
+
+    async def scenario(client):
+        page = await client.get("/api/orders", headers=auth(owner["token"]))
+        summary = await client.get("/api/orders/summary", headers=auth(owner["token"]))
+        return page, summary
+
+    page, summary = run_api(scenario)
+    assert len(page.json()) == 50 and page.headers["x-next-cursor"]
+    assert summary.json()["total"] == len(fx.orders) == 120
+    assert {s: n for s, n in summary.json()["by_status"].items() if n} == dict(expected)
+
+
+def test_order_pages_cover_every_order_once(dataset, run_api):
+    fx = dataset(suppliers=1, consumers=1, links_per_consumer=1, products_per_supplier=10, orders_per_link=75)
+    consumer = next(iter(fx.consumers.values()))
+
+    async def scenario(client):
+        ids, before = [], None
+        while True:
+            params = {"limit": 20, **({"before": before} if before else {})}
+            response = await client.get("/api/orders", params=params, headers=auth(consumer["token"]))
+            ids += [order["id"] for order in response.json()]
+            before = response.headers.get("x-next-cursor")
+            if not before:
+                return ids
+
+    ids = run_api(scenario)
+    assert sorted(ids) == sorted(order["id"] for order in fx.orders)
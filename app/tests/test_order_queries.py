@@ -0,0 +1,52 @@
+from app.db.query_stats import count_queries, query_budget
+from app.tests.conftest import auth
+
+# Statements per request once the principal is cached.
+ORDER_LIST_BUDGET = 1
+ORDER_DETAIL_BUDGET = 2
+
+
+def order_query_counts(dataset, run_api, orders_per_link: int) -> dict:
+    fx = dataset(
+        suppliers=1, consumers=2, links_per_consumer=1,
+        products_per_supplier=50, orders_per_link=orders_per_link, complaint_rate=0.5,
+    )
+    owner = next(iter(fx.owners.values()))
+    consumer_id, consumer = next(iter(fx.consumers.items()))
+    order = next(o for o in fx.orders if o["consumer_id"] == consumer_id)
+    calls = {
+        "list.supplier": ("/api/orders", owner["token"]),
+        "list.consumer": ("/api/orders", consumer["token"]),
+        "detail": (f"/api/orders/{order['id']}", consumer["token"]),
+    }
+
+    async def scenario(client):
+        counts = {}
+        for name, (path, token) in calls.items():
+            (await client.get(path, headers=auth(token))).raise_for_status()  # prime the principal cache
+            with count_queries() as stats:
+                response = await client.get(path, headers=auth(token))
+            response.raise_for_status()
+            counts[name] = stats.count
+        return counts
+
+    return run_api(scenario)
+
+
+def test_order_endpoints_stay_within_query_budget(dataset, run_api):
+    fx = dataset(suppliers=1, consumers=2, links_per_consumer=1, products_per_supplier=20, orders_per_link=30)
+    owner = next(iter(fx.owners.values()))
+    order = fx.orders[0]
+
+    async def scenario(client):
+        (await client.get("/api/orders", headers=auth(owner["token"]))).raise_for_status()
+        with query_budget(ORDER_LIST_BUDGET):
+            (await client.get("/api/orders", headers=auth(owner["token"]))).raise_for_status()
+        with query_budget(ORDER_DETAIL_BUDGET):
+            (await client.get(f"/api/orders/{order['id']}", headers=auth(owner["token"]))).raise_for_status()
+
+    run_api(scenario)
+
+
+def test_order_query_count_does_not_grow_with_orders(dataset, run_api):
+    assert order_query_counts(dataset, run_api, 20) == order_query_counts(dataset, run_api, 1)
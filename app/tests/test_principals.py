@@ -0,0 +1,29 @@
+from app.core.principals import Principal, principal_cache
+from app.db.session import SessionLocal
+from app.models.models import User
+
+
+def test_cached_principal_is_evicted_on_commit_only(dataset):
+    fx = dataset(suppliers=1, consumers=1, links_per_consumer=1, products_per_supplier=1,
+                 orders_per_link=0, messages_per_link=0)
+    user_id = next(iter(fx.consumers))
+
+    with SessionLocal() as db:
+        user = db.get(User, user_id)
+        principal_cache.set(user_id, Principal.from_user(user))
+
+        user.full_name = "Rolled back"
+        db.flush()
+        # Flushed but not committed: a concurrent request must keep seeing the cached row.
+        assert principal_cache.get(user_id) is not None
+        db.rollback()
+        assert principal_cache.get(user_id) is not None
+        assert not db.info.get("principal_user_ids")
+
+        user = db.get(User, user_id)
+        user.full_name = "Committed"
+        db.flush()
+        assert principal_cache.get(user_id) is not None
+        db.commit()
+        assert principal_cache.get(user_id) is None
+        assert not db.info.get("principal_user_ids")
@@ -0,0 +1,16 @@
+from app.tests.conftest import auth
+
+
+def test_summary_counts_every_product_not_just_the_first_page(dataset, run_api):
+    fx = dataset(suppliers=2, consumers=0, products_per_supplier=120, orders_per_link=0, messages_per_link=0)
+    supplier_id, owner = next(iter(fx.owners.items()))
+
+    async def scenario(client):
+        page = await client.get("/api/supplier/products", headers=auth(owner["token"]))
+        summary = await client.get("/api/supplier/products/summary", headers=auth(owner["token"]))
+        return page, summary
+
+    page, summary = run_api(scenario)
+    assert len(page.json()) == 50 and page.headers["x-next-cursor"]
+    assert summary.json() == {"total": 120, "active": len(fx.products[supplier_id])}
+    assert summary.json()["active"] < 120
@@ -0,0 +1,82 @@
+import json
+from sqlalchemy import insert
+from app.api.routes import products
+from app.core.config import settings
+from app.models.models import Product
+from app.tests.conftest import auth
+
+
+def _product(sku: str) -> dict:
+    return {"sku": sku, "name": f"Product {sku}", "unit": "pcs", "price": "9.90", "stock_quantity": 5}
+
+
+def test_sku_taken_after_the_check_is_a_conflict(dataset, run_api, monkeypatch):
+    fx = dataset(suppliers=1, consumers=0, products_per_supplier=1, orders_per_link=0, messages_per_link=0)
+    owner = next(iter(fx.owners.values()))
+    other_id = next(iter(fx.products.values()))[0]
+
+    async def skip_check(*args, **kwargs):
+        pass
+
+    async def scenario(client):
+        first = await client.post("/api/supplier/products", headers=auth(owner["token"]), json=_product("A-1"))
+        assert first.status_code == 201, first.text
+        # A concurrent request passes the pre-check before the first one commits.
+        monkeypatch.setattr(products, "_require_unique_sku", skip_check)
+        created = await client.post("/api/supplier/products", headers=auth(owner["token"]), json=_product("A-1"))
+        updated = await client.put(
+            f"/api/supplier/products/{other_id}", headers=auth(owner["token"]), json={"sku": "A-1"}
+        )
+        return created, updated
+
+    created, updated = run_api(scenario)
+    assert created.status_code == 409, created.text
+    assert updated.status_code == 409, updated.text
+
+
+def test_bulk_batch_conflict_rejects_its_rows(dataset, run_api, monkeypatch):
+    fx = dataset(suppliers=1, consumers=0, products_per_supplier=0, orders_per_link=0, messages_per_link=0)
+    owner = next(iter(fx.owners.values()))
+
+    async def scenario(client):
+        first = await client.post("/api/supplier/products", headers=auth(owner["token"]), json=_product("B-1"))
+        assert first.status_code == 201, first.text
+        # Without ON CONFLICT the changed row hits the unique index, like a write the batch did not expect.
+        monkeypatch.setattr(products, "_upsert_statement", lambda: insert(Product).returning(Product.id, Product.sku))
+        return await client.post(
+            "/api/supplier/products/bulk", headers=auth(owner["token"]),
+            json=[{"sku": "B-1", "price": "12.00"}]
+        )
+
+    response = run_api(scenario)
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert (report["updated"], report["rows_rejected"]) == (0, 1)
+    assert report["errors"][0]["sku"] == "B-1"
+
+
+def test_bulk_json_body_is_size_limited(dataset, run_api, monkeypatch):
+    fx = dataset(suppliers=1, consumers=0, products_per_supplier=0, orders_per_link=0, messages_per_link=0)
+    owner = next(iter(fx.owners.values()))
+    rows = [_product(f"C-{i}") for i in range(50)]
+    body = json.dumps(rows)
+    csv_body = "sku,name,unit,price,stock_quantity\n" + "".join(
+        f"{row['sku']},{row['name']},{row['unit']},{row['price']},{row['stock_quantity']}\n" for row in rows
+    )
+    monkeypatch.setattr(settings, "PRODUCT_UPSERT_MAX_JSON_BYTES", len(body) - 1)
+
+    async def scenario(client):
+        as_json = await client.post(
+            "/api/supplier/products/bulk", headers={**auth(owner["token"]), "Content-Type": "application/json"},
+            content=body
+        )
+        as_csv = await client.post(
+            "/api/supplier/products/bulk", headers={**auth(owner["token"]), "Content-Type": "text/csv"},
+            content=csv_body
+        )
+        return as_json, as_csv
+
+    as_json, as_csv = run_api(scenario)
+    assert as_json.status_code == 413, as_json.text
+    assert as_csv.status_code == 200, as_csv.text
+    assert as_csv.json()["created"] == 50
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+from types import SimpleNamespace
+import pytest
+from app.core import cache
+from app.core.config import settings
+from app.db import replicas as replica_routing
+from app.db.replicas import Replica, recent_writers
+from app.tests.conftest import auth
+
+pytestmark = pytest.mark.skipif(
+    not os.environ["DATABASE_URL"].startswith("sqlite"), reason="copies the primary SQLite file"
+)
+
+
+@pytest.fixture
+def replica_of(monkeypatch):
+    """Route reads to a snapshot of the primary; ``replica_of(path=None)`` returns the Replica."""
+    created = []
+
+    def make(path=None):
+        if path is None:
+            path = os.path.join(tempfile.mkdtemp(prefix="marketplace-replica-"), "replica.db")
+            with sqlite3.connect(os.environ["DATABASE_URL"].removeprefix("sqlite:///")) as source:
+                with sqlite3.connect(path) as target:
+                    source.backup(target)
+        monkeypatch.setattr(settings, "DB_READ_REPLICA_URLS", [f"sqlite:///{path}"])
+        replica = Replica("replica-0", settings.DB_READ_REPLICA_URLS[0])
+        monkeypatch.setattr(replica_routing, "replicas", [replica])
+        created.append(replica)
+        return replica
+
+    yield make
+    for replica in created:
+        if settings.DB_ASYNC:
+            asyncio.run(replica.engine.dispose())
+        else:
+            replica.engine.dispose()
+
+
+def _rename_on(replica, product_id, name):
+    with sqlite3.connect(replica.engine.url.database) as db:
+        db.execute("UPDATE products SET name = ? WHERE id = ?", (name, product_id))
+
+
+def _product_name(run_api, token, product_id):
+    async def scenario(client):
+        response = await client.get("/api/supplier/products", headers=auth(token), params={"limit": 200})
+        assert response.status_code == 200, response.text
+        return {product["id"]: product["name"] for product in response.json()}[product_id]
+    return run_api(scenario)
+
+
+def test_reads_use_the_replica_until_the_user_writes(dataset, run_api, replica_of, monkeypatch):
+    fx = dataset(suppliers=1, consumers=0, products_per_supplier=5, orders_per_link=0, messages_per_link=0)
+    supplier_id, owner = next(iter(fx.owners.items()))
+    product_id = fx.products[supplier_id][0]
+    replica = replica_of()
+    _rename_on(replica, product_id, "On the replica")
+    assert _product_name(run_api, owner["token"], product_id) == "On the replica"
+
+    async def write(client):
+        response = await client.put(
+            f"/api/supplier/products/{product_id}", headers=auth(owner["token"]), json={"name": "Just written"}
+        )
+        assert response.status_code == 200, response.text
+    run_api(write)
+    # The replica has not caught up, but the writer reads the primary.
+    assert _product_name(run_api, owner["token"], product_id) == "Just written"
+
+    later = time.time() + recent_writers.ttl + 1
+    monkeypatch.setattr(cache, "time", SimpleNamespace(time=lambda: later))
+    assert _product_name(run_api, owner["token"], product_id) == "On the replica"
+
+
+def test_reads_fall_back_to_the_primary_without_a_healthy_replica(dataset, run_api, replica_of):
+    fx = dataset(suppliers=1, consumers=0, products_per_supplier=5, orders_per_link=0, messages_per_link=0)
+    supplier_id, owner = next(iter(fx.owners.items()))
+    product_id = fx.products[supplier_id][0]
+    primary_name = _product_name(run_api, owner["token"], product_id)
+
+    replica = replica_of()
+    _rename_on(replica, product_id, "On the replica")
+    replica.mark_unhealthy()
+    assert _product_name(run_api, owner["token"], product_id) == primary_name
+
+    unreachable = replica_of(os.path.join(tempfile.mkdtemp(), "missing", "replica.db"))
+    assert _product_name(run_api, owner["token"], product_id) == primary_name
+    assert not unreachable.healthy
@@ -0,0 +1,63 @@
+from sqlalchemy import select
+from app.db import rollups
+from app.db.session import SessionLocal
+from app.models.models import Order, Product
+from app.tests.conftest import auth
+
+
+def _snapshot(db):
+    # Rows whose orders all left the revenue statuses stay behind at zero; rebuild omits them.
+    return {
+        model.__tablename__: sorted(
+            tuple(getattr(row, column.name) for column in model.__table__.columns)
+            for row in db.scalars(select(model))
+            if any(getattr(row, name) for name in rollups.MEASURES)
+        )
+        for model in rollups.ROLLUPS
+    }
+
+
+def test_deleting_a_sold_product_keeps_its_orders_and_rollups(dataset, run_api):
+    fx = dataset(
+        suppliers=1, consumers=1, links_per_consumer=1,
+        products_per_supplier=3, orders_per_link=0, messages_per_link=0,
+    )
+    link = fx.links[0]
+    owner = fx.owners[link["supplier_id"]]
+    consumer = fx.consumers[link["consumer_id"]]
+    first_id, second_id = fx.products[link["supplier_id"]][:2]
+
+    async def scenario(client):
+        order_ids = []
+        for items in (
+            [{"product_id": first_id, "quantity": 2}, {"product_id": second_id, "quantity": 1}],
+            [{"product_id": first_id, "quantity": 3}],
+        ):
+            response = await client.post("/api/orders", headers=auth(consumer["token"]), json={
+                "supplier_id": link["supplier_id"], "items": items,
+            })
+            order_ids.append(response.json()["id"])
+            accepted = await client.put(
+                f"/api/orders/{order_ids[-1]}", headers=auth(owner["token"]), json={"status": "ACCEPTED"}
+            )
+            assert accepted.status_code == 200, accepted.text
+        order_id = order_ids[0]
+        deleted = await client.delete(f"/api/supplier/products/{first_id}", headers=auth(owner["token"]))
+        assert deleted.status_code == 204, deleted.text
+        order = await client.get(f"/api/orders/{order_id}", headers=auth(owner["token"]))
+        rejected = await client.put(
+            f"/api/orders/{order_id}", headers=auth(owner["token"]), json={"status": "REJECTED"}
+        )
+        assert rejected.status_code == 200, rejected.text
+        return order.json()
+
+    order = run_api(scenario)
+    assert sorted(item["product_id"] for item in order["items"]) == sorted([first_id, second_id])
+    with SessionLocal() as db:
+        assert db.get(Product, first_id).is_active is False
+        assert db.get(Order, order["id"]).item_count == 2
+        maintained = _snapshot(db)
+        assert maintained["product_rollups"]
+        rollups.rebuild(db)
+        assert _snapshot(db) == maintained
+        db.rollback()
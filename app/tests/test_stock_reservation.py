@@ -0,0 +1,58 @@
+import asyncio
+import random
+from collections import Counter
+from sqlalchemy import select
+from app.db.session import SessionLocal
+from app.models.models import Order, OrderItem, OrderStatus, Product
+from app.tests.conftest import auth
+
+STOCK = 30
+
+
+def test_concurrent_acceptances_never_oversell(dataset, run_api):
+    fx = dataset(
+        suppliers=1, consumers=5, links_per_consumer=1,
+        products_per_supplier=1, orders_per_link=0, messages_per_link=0,
+    )
+    supplier_id, owner = next(iter(fx.owners.items()))
+    rng = random.Random(7)
+
+    async def scenario(client):
+        skus = []
+        for i in range(2):
+            response = await client.post("/api/supplier/products", headers=auth(owner["token"]), json={
+                "name": f"Contended SKU {i}", "unit": "kg", "price": "1.00", "stock_quantity": STOCK,
+            })
+            skus.append(response.json()["id"])
+        order_ids = []
+        for n in range(40):
+            link = fx.links[n % len(fx.links)]
+            response = await client.post(
+                "/api/orders", headers=auth(fx.consumers[link["consumer_id"]]["token"]),
+                json={"supplier_id": supplier_id, "items": [
+                    {"product_id": sku, "quantity": rng.randint(1, 3)} for sku in rng.sample(skus, rng.randint(1, 2))
+                ]},
+            )
+            order_ids.append(response.json()["id"])
+        responses = await asyncio.gather(*(
+            client.put(f"/api/orders/{order_id}", headers=auth(owner["token"]), json={"status": "ACCEPTED"})
+            for order_id in order_ids
+        ))
+        return skus, order_ids, Counter(response.status_code for response in responses)
+
+    skus, order_ids, statuses = run_api(scenario)
+
+    # ~80 units requested against 30 per SKU: some acceptances must be refused.
+    assert set(statuses) == {200, 400} and sum(statuses.values()) == len(order_ids)
+    with SessionLocal() as db:
+        stock = dict(db.execute(select(Product.id, Product.stock_quantity).where(Product.id.in_(skus))).all())
+        accepted = Counter()
+        for product_id, quantity in db.execute(
+            select(OrderItem.product_id, OrderItem.quantity)
+            .join(Order)
+            .where(Order.id.in_(order_ids), Order.status == OrderStatus.ACCEPTED)
+        ):
+            accepted[product_id] += quantity
+    for sku in skus:
+        assert stock[sku] >= 0
+        assert stock[sku] == STOCK - accepted[sku]
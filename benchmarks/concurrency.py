@@ -0,0 +1,117 @@
+"""Benchmark: async vs threadpool-backed sync handlers under many concurrent clients.
+
+Each mode runs in its own subprocess (``DB_ASYNC`` is read at import time)
+against the same seeded SQLite file, driving the app in-process through
+httpx's ASGI transport so no network is involved.
+
+Usage::
+
+    python -m benchmarks.concurrency --clients 500 --requests 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_concurrency.db"
+
+
+def seed_dataset(products: int) -> dict:
+    from benchmarks.seed import DatasetConfig, seed
+
+    fixtures = seed(DatasetConfig(
+        suppliers=1, consumers=1, links_per_consumer=1,
+        products_per_supplier=products, orders_per_link=20,
+    ))
+    link = fixtures.links[0]
+    return {
+        "supplier_id": link["supplier_id"],
+        "token": fixtures.consumers[link["consumer_id"]]["token"],
+    }
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def drive(clients: int, requests: int, supplier_id: int, token: str) -> dict:
+    import httpx
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = [f"/api/suppliers/{supplier_id}/products", "/api/orders", "/api/links/me"]
+    latencies = []
+    errors = 0
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=120
+    ) as client:
+        async def one_client(n: int):
+            nonlocal errors
+            for i in range(requests):
+                started = time.perf_counter()
+                response = await client.get(paths[(n + i) % len(paths)], headers=headers)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_client(n) for n in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def run_mode(args) -> dict:
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    seeded = seed_dataset(args.products)
+    result = asyncio.run(drive(args.clients, args.requests, seeded["supplier_id"], seeded["token"]))
+    result["mode"] = "async" if os.environ.get("DB_ASYNC", "true").lower() == "true" else "sync"
+    result["clients"] = args.clients
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=4, help="requests per client")
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--mode", choices=["both", "async", "sync"], default="both")
+    args = parser.parse_args()
+
+    if args.mode != "both":
+        print(json.dumps(run_mode(args)))
+        return
+
+    results = []
+    for db_async in ("true", "false"):
+        env = dict(os.environ, DB_ASYNC=db_async)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.concurrency",
+             "--mode", "async" if db_async == "true" else "sync",
+             "--clients", str(args.clients),
+             "--requests", str(args.requests),
+             "--products", str(args.products)],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
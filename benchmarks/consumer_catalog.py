@@ -0,0 +1,119 @@
+"""Benchmark: a consumer loading every linked supplier's catalog.
+
+Seeds ``--suppliers`` suppliers with ``--products`` products each, all
+linked to one consumer, and compares one GET /api/suppliers/{id}/products
+per supplier against walking GET /api/catalog, cold and on a refresh where
+the consumer sends the ETags it holds and ``--changed`` suppliers changed
+meanwhile. Reports wall time, requests and SQL statements per load.
+
+Usage::
+
+    python -m benchmarks.consumer_catalog --suppliers 15
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_catalog.db"
+
+
+def per_supplier(client, headers, supplier_ids, etags) -> dict:
+    stats = {"requests": 0, "queries": 0}
+    for supplier_id in supplier_ids:
+        response = client.get(f"/api/suppliers/{supplier_id}/products", headers={
+            **headers, **({"If-None-Match": etags[supplier_id]} if supplier_id in etags else {})
+        })
+        assert response.status_code in (200, 304), response.text
+        stats["requests"] += 1
+        stats["queries"] += int(response.headers["x-db-queries"])
+        etags[supplier_id] = response.headers["etag"]
+    return stats
+
+
+def unified(client, headers, supplier_ids, etags) -> dict:
+    stats = {"requests": 0, "queries": 0}
+    cursor = None
+    while True:
+        params = {"limit": 1000, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/catalog", params=params, headers={
+            **headers, **({"If-None-Match": ", ".join(etags.values())} if etags else {})
+        })
+        response.raise_for_status()
+        stats["requests"] += 1
+        stats["queries"] += int(response.headers["x-db-queries"])
+        for group in response.json():
+            etags[group["supplier_id"]] = group["etag"]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return stats
+
+
+def timed(load, repeat: int, setup) -> dict:
+    latencies = []
+    for _ in range(repeat):
+        args = setup()
+        t0 = time.perf_counter()
+        stats = load(*args)
+        latencies.append(time.perf_counter() - t0)
+    return {"p50_ms": round(statistics.median(latencies) * 1000, 2), **stats}
+
+
+def run(args) -> dict:
+    from fastapi.testclient import TestClient
+    from app.core.catalog import catalog_cache
+    from app.main import app
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=args.suppliers, consumers=1, links_per_consumer=args.suppliers,
+        products_per_supplier=args.products, orders_per_link=0, messages_per_link=0,
+    ))
+    consumer = next(iter(fx.consumers.values()))
+    headers = {"Authorization": f"Bearer {consumer['token']}"}
+    supplier_ids = sorted(fx.owners)
+    results = {"suppliers": args.suppliers, "products_per_supplier": args.products}
+
+    with TestClient(app) as client:
+        def change_suppliers():
+            for supplier_id in supplier_ids[:args.changed]:
+                product_id = fx.products[supplier_id][0]
+                client.put(
+                    f"/api/supplier/products/{product_id}", json={"stock_quantity": 1000},
+                    headers={"Authorization": f"Bearer {fx.owners[supplier_id]['token']}"},
+                ).raise_for_status()
+
+        for name, load in (("per_supplier", per_supplier), ("unified", unified)):
+            def cold():
+                catalog_cache.clear()
+                return client, headers, supplier_ids, {}
+
+            def refresh():
+                etags = {}
+                load(client, headers, supplier_ids, etags)
+                change_suppliers()
+                return client, headers, supplier_ids, etags
+
+            results[name] = {
+                "cold": timed(load, args.repeat, cold),
+                "refresh": timed(load, args.repeat, refresh),
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suppliers", type=int, default=15)
+    parser.add_argument("--products", type=int, default=200, help="products per supplier")
+    parser.add_argument("--changed", type=int, default=2, help="suppliers changed between refreshes")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
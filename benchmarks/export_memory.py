@@ -0,0 +1,167 @@
+"""Check: streaming order export keeps memory flat.
+
+Seeds ``--lines`` order lines (10 per order), then exports them in a fresh
+process by driving the ASGI app directly -- httpx's ASGI transport would
+buffer the whole body -- and checks that every line arrived while resident
+memory grew by less than ``--max-rss-growth-mb``. Exits non-zero otherwise.
+
+Usage::
+
+    python -m benchmarks.export_memory --lines 1000000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_export.db"
+ITEMS_PER_ORDER = 10
+CHUNK_ORDERS = 5000
+
+
+def seed_lines(lines: int) -> dict:
+    from sqlalchemy import insert
+    from app.db.session import engine
+    from app.models.models import Order, OrderItem, OrderStatus
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=1, consumers=1, links_per_consumer=1, products_per_supplier=100,
+        orders_per_link=0, messages_per_link=0,
+    ))
+    link = fx.links[0]
+    products = fx.products[link["supplier_id"]]
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    orders = lines // ITEMS_PER_ORDER
+
+    with engine.begin() as connection:
+        for start in range(1, orders + 1, CHUNK_ORDERS):
+            order_ids = range(start, min(start + CHUNK_ORDERS, orders + 1))
+            order_rows, item_rows = [], []
+            for order_id in order_ids:
+                created_at = now - timedelta(minutes=order_id)
+                total = Decimal("0")
+                for product_id in rng.sample(products, ITEMS_PER_ORDER):
+                    quantity = rng.randint(1, 20)
+                    subtotal = Decimal("1.50") * quantity
+                    total += subtotal
+                    item_rows.append({
+                        "order_id": order_id, "product_id": product_id, "quantity": quantity,
+                        "unit_price": Decimal("1.50"), "subtotal": subtotal,
+                    })
+                order_rows.append({
+                    "id": order_id, "supplier_id": link["supplier_id"], "consumer_id": link["consumer_id"],
+                    "created_by_user_id": link["consumer_id"], "status": OrderStatus.COMPLETED,
+                    "total_amount": total, "item_count": ITEMS_PER_ORDER,
+                    "created_at": created_at, "updated_at": created_at,
+                })
+            connection.execute(insert(Order), order_rows)
+            connection.execute(insert(OrderItem), item_rows)
+    return {"token": fx.owners[link["supplier_id"]]["token"], "lines": orders * ITEMS_PER_ORDER}
+
+
+def current_rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def export(app, token: str, query: str) -> dict:
+    """Run one export request through the ASGI app, discarding the body."""
+    stats = {"status": None, "bytes": 0, "lines": 0, "peak_rss_kb": current_rss_kb()}
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/api/orders/export", "raw_path": b"/api/orders/export",
+        "query_string": query.encode(), "root_path": "", "client": ("127.0.0.1", 1),
+        "server": ("bench", 80), "headers": [(b"authorization", f"Bearer {token}".encode())],
+    }
+
+    requested, finished = False, asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            stats["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            stats["bytes"] += len(body)
+            stats["lines"] += body.count(b"\n")
+            stats["peak_rss_kb"] = max(stats["peak_rss_kb"], current_rss_kb())
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return stats
+
+
+def measure(token: str, file_format: str) -> dict:
+    from app.main import app
+
+    async def run():
+        # Warm up imports, pools and caches on an empty export first.
+        await export(app, token, f"format={file_format}&from=2999-01-01T00:00:00")
+        baseline = current_rss_kb()
+        started = time.perf_counter()
+        stats = await export(app, token, f"format={file_format}")
+        stats["seconds"] = round(time.perf_counter() - started, 2)
+        stats["rss_growth_mb"] = round((stats.pop("peak_rss_kb") - baseline) / 1024, 1)
+        return stats
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], nargs="+", default=["csv", "ndjson"])
+    parser.add_argument("--max-rss-growth-mb", type=float, default=50)
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+
+    if args.measure:
+        token, file_format = args.measure.split(":", 1)
+        print(json.dumps(measure(token, file_format)))
+        return
+
+    seeded = seed_lines(args.lines)
+    results, ok = {}, True
+    for file_format in args.format:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.export_memory", "--measure", f"{seeded['token']}:{file_format}"],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        stats = json.loads(output.strip().splitlines()[-1])
+        expected = seeded["lines"] + (1 if file_format == "csv" else 0)
+        stats["ok"] = (
+            stats["status"] == 200 and stats["lines"] == expected
+            and stats["rss_growth_mb"] < args.max_rss_growth_mb
+        )
+        ok = ok and stats["ok"]
+        results[file_format] = stats
+    print(json.dumps({"lines": seeded["lines"], "results": results}, indent=2))
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
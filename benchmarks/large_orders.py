@@ -0,0 +1,74 @@
+"""Benchmark: POST /api/orders latency for large (50-200 line) orders.
+
+Seeds one supplier with enough active products, then creates ``--orders``
+orders per line count and reports p50/p95 latency and SQL statements per
+request (from ``X-DB-Queries``).
+
+Usage::
+
+    python -m benchmarks.large_orders --lines 50 100 200 --orders 30
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_large_orders.db"
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(lines: list, orders: int) -> dict:
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=1, consumers=1, links_per_consumer=1,
+        products_per_supplier=int(max(lines) * 1.2) + 10, orders_per_link=1,
+    ))
+    link = fx.links[0]
+    products = fx.products[link["supplier_id"]]
+    headers = {"Authorization": f"Bearer {fx.consumers[link['consumer_id']]['token']}"}
+
+    results = {}
+    with TestClient(app) as client:
+        for count in lines:
+            payload = {
+                "supplier_id": link["supplier_id"],
+                "items": [{"product_id": product_id, "quantity": 1} for product_id in products[:count]],
+            }
+            client.post("/api/orders", json=payload, headers=headers).raise_for_status()  # warm-up
+            latencies, queries = [], []
+            for _ in range(orders):
+                started = time.perf_counter()
+                response = client.post("/api/orders", json=payload, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+                queries.append(int(response.headers["x-db-queries"]))
+            results[count] = {
+                "p50_ms": round(statistics.median(latencies) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "db_queries_per_request": statistics.mean(queries),
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--orders", type=int, default=30, help="orders per line count")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    print(json.dumps(run(args.lines, args.orders), indent=2))
+
+
+if __name__ == "__main__":
+    main()
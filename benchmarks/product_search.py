@@ -0,0 +1,118 @@
+"""Benchmark: GET /api/products/search latency over a large catalog.
+
+Seeds ``--products`` products spread over ``--suppliers`` suppliers (names
+and descriptions drawn from a fixed vocabulary, so some words are common
+and some rare), links one consumer to ``--linked`` suppliers, and reports
+p50/p95 latency and result counts for a set of queries.
+
+Usage::
+
+    python -m benchmarks.product_search --products 1000000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+from decimal import Decimal
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_search.db"
+CHUNK = 10000
+FOODS = [
+    "tomato", "potato", "onion", "garlic", "carrot", "cabbage", "cucumber", "pepper", "lettuce", "spinach",
+    "apple", "banana", "cherry", "grape", "lemon", "orange", "peach", "pear", "plum", "strawberry",
+    "beef", "chicken", "lamb", "pork", "turkey", "salmon", "tuna", "shrimp", "cod", "trout",
+    "milk", "butter", "cheese", "cream", "yogurt", "egg", "flour", "rice", "pasta", "bread",
+    "sugar", "salt", "honey", "vinegar", "mustard", "ketchup", "mayonnaise", "olive", "walnut", "almond",
+]
+QUALIFIERS = [
+    "fresh", "frozen", "organic", "dried", "smoked", "sliced", "whole", "premium", "local", "imported",
+    "cherry", "baby", "red", "green", "yellow", "sweet", "spicy", "salted", "unsalted", "roasted",
+]
+QUERIES = ["tomato", "organic tomato", "frozen salmon fillet", "straw", "mayo", "ketchup sauce", "to", "zzzz"]
+
+
+def seed_catalog(products: int, suppliers: int, linked: int) -> dict:
+    from sqlalchemy import insert
+    from app.db.session import engine
+    from app.models.models import Product
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=suppliers, consumers=1, links_per_consumer=linked, products_per_supplier=0,
+        orders_per_link=0, messages_per_link=0,
+    ))
+    rng = random.Random(42)
+    words = FOODS + QUALIFIERS + [f"word{i}" for i in range(2000)]
+    supplier_ids = list(fx.owners)
+    now = datetime.utcnow()
+
+    with engine.begin() as connection:
+        for start in range(0, products, CHUNK):
+            connection.execute(insert(Product), [
+                {
+                    "supplier_id": rng.choice(supplier_ids),
+                    "name": f"{rng.choice(QUALIFIERS)} {rng.choice(FOODS)} {n}",
+                    "description": " ".join(rng.choice(words) for _ in range(12)),
+                    "unit": rng.choice(["kg", "l", "pack", "pcs"]),
+                    "price": Decimal(rng.randint(100, 10000)) / 100,
+                    "stock_quantity": rng.choice([0, rng.randint(1, 1000)]),
+                    "min_order_quantity": 1, "is_active": True, "created_at": now, "updated_at": now,
+                }
+                for n in range(start, min(start + CHUNK, products))
+            ])
+    consumer_id = next(iter(fx.consumers))
+    return {"token": fx.consumers[consumer_id]["token"]}
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(args) -> dict:
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    started = time.perf_counter()
+    fx = seed_catalog(args.products, args.suppliers, args.linked)
+    seeded_s = round(time.perf_counter() - started, 1)
+    headers = {"Authorization": f"Bearer {fx['token']}"}
+
+    results = {}
+    with TestClient(app) as client:
+        for q in QUERIES:
+            params = {"q": q, "limit": 20}
+            client.get("/api/products/search", params=params, headers=headers).raise_for_status()  # warm-up
+            latencies = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                response = client.get("/api/products/search", params=params, headers=headers)
+                latencies.append(time.perf_counter() - t0)
+                response.raise_for_status()
+            results[q] = {
+                "p50_ms": round(statistics.median(latencies) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "results": len(response.json()),
+                "more": "x-next-cursor" in response.headers,
+            }
+    return {"products": args.products, "seed_seconds": seeded_s, "queries": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--suppliers", type=int, default=200)
+    parser.add_argument("--linked", type=int, default=20, help="suppliers the consumer is linked to")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
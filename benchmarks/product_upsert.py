@@ -0,0 +1,135 @@
+"""Benchmark: nightly price-list sync, bulk upsert vs one PUT per SKU.
+
+Seeds one supplier, uploads ``--skus`` new products through
+POST /api/supplier/products/bulk, then replays a nightly update (a
+``--changed`` fraction of SKUs get a new price or stock level, the rest are
+resent unchanged) twice: as one bulk CSV upload, and as the PUT
+/api/supplier/products/{id} calls a client needs without it. Reports wall
+time and the audit rows / catalog version bumps each approach writes.
+
+Usage::
+
+    python -m benchmarks.product_upsert --skus 5000
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_upsert.db"
+
+
+def price_list(skus: int, rng: random.Random) -> list:
+    return [
+        {
+            "sku": f"SKU-{n:06d}", "name": f"Product {n}", "unit": rng.choice(["kg", "l", "pack", "pcs"]),
+            "price": f"{rng.randint(100, 10000) / 100:.2f}", "stock_quantity": rng.randint(0, 1000),
+        }
+        for n in range(skus)
+    ]
+
+
+def nightly_update(rows: list, changed: float, rng: random.Random) -> list:
+    update = []
+    for row in rows:
+        row = {"sku": row["sku"], "price": row["price"], "stock_quantity": row["stock_quantity"]}
+        if rng.random() < changed:
+            row["price"] = f"{rng.randint(100, 10000) / 100:.2f}"
+            row["stock_quantity"] = rng.randint(0, 1000)
+        update.append(row)
+    return update
+
+
+def to_csv(rows: list) -> str:
+    columns = list(rows[0])
+    return "\n".join([",".join(columns)] + [",".join(str(row[c]) for c in columns) for row in rows]) + "\n"
+
+
+def counters() -> dict:
+    from sqlalchemy import func, select
+    from app.db.session import SessionLocal
+    from app.models.models import AuditLog, Supplier
+
+    with SessionLocal() as db:
+        return {
+            "audit_rows": db.scalar(select(func.count()).select_from(AuditLog).where(AuditLog.entity_type == "PRODUCT")),
+            "catalog_version": db.scalar(select(func.max(Supplier.catalog_version))),
+        }
+
+
+def delta(before: dict, after: dict) -> dict:
+    return {key: after[key] - before[key] for key in before}
+
+
+def run(args) -> dict:
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=1, consumers=0, links_per_consumer=0, products_per_supplier=0,
+        orders_per_link=0, messages_per_link=0,
+    ))
+    headers = {"Authorization": f"Bearer {next(iter(fx.owners.values()))['token']}"}
+    rng = random.Random(42)
+    rows = price_list(args.skus, rng)
+    update = nightly_update(rows, args.changed, rng)
+    results = {"skus": args.skus, "changed": args.changed}
+
+    with TestClient(app) as client:
+        before = counters()
+        t0 = time.perf_counter()
+        response = client.post("/api/supplier/products/bulk", json=rows, headers=headers)
+        response.raise_for_status()
+        results["initial_bulk_json"] = {
+            "seconds": round(time.perf_counter() - t0, 2), "counts": response.json(), **delta(before, counters())
+        }
+
+        before = counters()
+        t0 = time.perf_counter()
+        response = client.post(
+            "/api/supplier/products/bulk", content=to_csv(update), headers={**headers, "Content-Type": "text/csv"}
+        )
+        response.raise_for_status()
+        counts = response.json()
+        results["nightly_bulk_csv"] = {
+            "seconds": round(time.perf_counter() - t0, 2),
+            "counts": {key: counts[key] for key in ("created", "updated", "unchanged", "rows_rejected")},
+            **delta(before, counters()),
+        }
+
+        ids, cursor = {}, None
+        while True:
+            params = {"fields": "sku", "limit": 200, **({"cursor": cursor} if cursor else {})}
+            response = client.get("/api/supplier/products", params=params, headers=headers)
+            ids.update((product["sku"], product["id"]) for product in response.json())
+            cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+        before = counters()
+        t0 = time.perf_counter()
+        for row in update:
+            client.put(
+                f"/api/supplier/products/{ids[row['sku']]}",
+                json={"price": row["price"], "stock_quantity": row["stock_quantity"]}, headers=headers,
+            ).raise_for_status()
+        results["nightly_put_per_sku"] = {
+            "seconds": round(time.perf_counter() - t0, 2), "requests": len(update), **delta(before, counters())
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skus", type=int, default=5000)
+    parser.add_argument("--changed", type=float, default=0.2, help="fraction of SKUs changed in the nightly update")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
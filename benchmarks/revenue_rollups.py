@@ -0,0 +1,140 @@
+"""Check: incremental revenue rollups match a rebuild, and read fast.
+
+Seeds a year of orders, drives ``--transitions`` random status changes
+through the single and bulk status endpoints, then compares the rollup
+rows against ``rebuild()`` of the same data; exits non-zero on any
+difference. Also reports p50 latency of ``GET /api/analytics/revenue`` over
+the year next to the equivalent aggregate over ``orders``/``order_items``.
+
+Usage::
+
+    python -m benchmarks.revenue_rollups --orders-per-link 200 --transitions 300
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_rollups.db"
+
+
+def snapshot(db) -> dict:
+    from sqlalchemy import select
+    from app.db.rollups import ROLLUPS
+
+    rows = {}
+    for model in ROLLUPS:
+        keys = [column.name for column in model.__table__.primary_key]
+        for row in db.execute(select(model.__table__)).mappings():
+            if row["order_count"]:
+                rows[(model.__tablename__,) + tuple(row[key] for key in keys)] = (
+                    row["quantity"], Decimal(row["revenue"]).quantize(Decimal("0.01")), row["order_count"]
+                )
+    return rows
+
+
+def p50_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def run(args) -> dict:
+    from fastapi.testclient import TestClient
+    from sqlalchemy import func, select
+    from app.db.rollups import rebuild
+    from app.db.session import SessionLocal
+    from app.main import app
+    from app.models.models import Order, OrderItem, OrderStatus
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=args.suppliers, consumers=args.consumers, links_per_consumer=1,
+        products_per_supplier=100, orders_per_link=args.orders_per_link, messages_per_link=0,
+    ))
+    rng = random.Random(42)
+    supplier_id, owner = next(iter(fx.owners.items()))
+    headers = {"Authorization": f"Bearer {owner['token']}"}
+    orders = [order for order in fx.orders if order["supplier_id"] == supplier_id]
+    targets = [OrderStatus.ACCEPTED.value, OrderStatus.REJECTED.value, OrderStatus.COMPLETED.value]
+    year = {"from": (date.today() - timedelta(days=365)).isoformat(), "to": date.today().isoformat()}
+
+    statuses = {}
+    with TestClient(app) as client:
+        for n in range(args.transitions):
+            target = rng.choice(targets)
+            if n % 2:
+                response = client.put(
+                    f"/api/orders/{rng.choice(orders)['id']}", headers=headers, json={"status": target}
+                )
+            else:
+                response = client.post("/api/orders/bulk-status", headers=headers, json={
+                    "order_ids": [order["id"] for order in rng.sample(orders, 10)], "status": target,
+                })
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        latencies = {
+            f"rollup.{group_by}": p50_ms(lambda: client.get(
+                "/api/analytics/revenue", headers=headers, params=dict(year, group_by=group_by)
+            ).raise_for_status(), args.repeat)
+            for group_by in ("day", "product", "consumer")
+        }
+
+    with SessionLocal() as db:
+        raw = (
+            select(OrderItem.product_id, func.sum(OrderItem.quantity), func.sum(OrderItem.subtotal))
+            .join(Order, Order.id == OrderItem.order_id)
+            .where(
+                Order.supplier_id == supplier_id,
+                Order.status.in_([OrderStatus.ACCEPTED, OrderStatus.COMPLETED]),
+                Order.created_at >= year["from"],
+            )
+            .group_by(OrderItem.product_id)
+        )
+        latencies["raw.product"] = p50_ms(lambda: db.execute(raw).all(), args.repeat)
+
+        incremental = snapshot(db)
+        rebuild(db)
+        rebuilt = snapshot(db)
+        db.rollback()
+
+    mismatches = sorted(
+        str(key) for key in incremental.keys() | rebuilt.keys() if incremental.get(key) != rebuilt.get(key)
+    )
+    return {
+        "orders": len(fx.orders),
+        "transition_responses": statuses,
+        "p50_ms": latencies,
+        "rollup_rows": len(rebuilt),
+        "mismatches": mismatches[:20],
+        "consistent": not mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suppliers", type=int, default=2)
+    parser.add_argument("--consumers", type=int, default=50)
+    parser.add_argument("--orders-per-link", type=int, default=200)
+    parser.add_argument("--transitions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    report = run(args)
+    print(json.dumps(report, indent=2))
+    if not report["consistent"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Endpoint load benchmark over a seeded dataset.
+
+Seeds the database at ``--database-url`` (DROPPED and recreated; defaults
+to a local SQLite file), then drives every router in ``app/api/routes/``
+in-process through httpx's ASGI transport -- no network involved. Each
+scenario runs ``--requests`` requests with ``--concurrency`` concurrent
+clients and reports p50/p95/p99 latency, throughput and DB queries per
+request (from ``X-DB-Queries``) as JSON.
+
+Usage::
+
+    python -m benchmarks.run --requests 200 --concurrency 20 --output baseline.json
+    python -m benchmarks.run --database-url postgresql://postgres:pw@localhost/bench --only orders.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import fields
+from typing import Callable, Dict, NamedTuple, Optional
+
+from benchmarks.seed import BENCHMARK_PASSWORD, DatasetConfig, Fixtures, seed
+
+ADMIN_TOKEN = "benchmark-admin-token"
+
+
+class Call(NamedTuple):
+    method: str
+    path: str
+    token: Optional[str] = None
+    json: Optional[dict] = None
+    headers: Optional[dict] = None
+
+
+def _link(fx: Fixtures, rng: random.Random) -> dict:
+    return rng.choice(fx.links)
+
+
+def _order(fx: Fixtures, rng: random.Random) -> dict:
+    return rng.choice(fx.orders)
+
+
+def _consumer_token(fx: Fixtures, consumer_id: int) -> str:
+    return fx.consumers[consumer_id]["token"]
+
+
+def _owner_token(fx: Fixtures, supplier_id: int) -> str:
+    return fx.owners[supplier_id]["token"]
+
+
+def _create_order(fx, rng):
+    link = _link(fx, rng)
+    products = rng.sample(fx.products[link["supplier_id"]], 3)
+    return Call("POST", "/api/orders", _consumer_token(fx, link["consumer_id"]), {
+        "supplier_id": link["supplier_id"],
+        "items": [{"product_id": product_id, "quantity": 1} for product_id in products],
+    })
+
+
+def _update_order(fx, rng):
+    order = rng.choice([o for o in fx.orders if o["status"] in ("PENDING", "ACCEPTED")])
+    return Call("PUT", f"/api/orders/{order['id']}", _owner_token(fx, order["supplier_id"]),
+                {"status": rng.choice(["ACCEPTED", "REJECTED"])})
+
+
+def _bulk_update_orders(fx, rng):
+    supplier_id = rng.choice(list(fx.owners))
+    open_orders = [o["id"] for o in fx.orders
+                   if o["supplier_id"] == supplier_id and o["status"] in ("PENDING", "ACCEPTED")]
+    return Call("POST", "/api/orders/bulk-status", _owner_token(fx, supplier_id), {
+        "order_ids": rng.sample(open_orders, min(20, len(open_orders))),
+        "status": rng.choice(["ACCEPTED", "REJECTED"]),
+    })
+
+
+def _create_product(fx, rng):
+    supplier_id = rng.choice(list(fx.owners))
+    return Call("POST", "/api/supplier/products", _owner_token(fx, supplier_id), {
+        "name": f"Bench {rng.random()}", "unit": "kg", "price": "9.99", "stock_quantity": 100,
+    })
+
+
+def _update_product(fx, rng):
+    supplier_id = rng.choice(list(fx.owners))
+    product_id = rng.choice(fx.products[supplier_id])
+    return Call("PUT", f"/api/supplier/products/{product_id}", _owner_token(fx, supplier_id),
+                {"price": f"{rng.randint(100, 9999) / 100:.2f}"})
+
+
+def _update_complaint(fx, rng):
+    complaint = rng.choice(fx.complaints)
+    order = next(o for o in fx.orders if o["id"] == complaint["order_id"])
+    return Call("PUT", f"/api/complaints/{complaint['id']}", _owner_token(fx, order["supplier_id"]),
+                {"assigned_to_user_id": fx.owners[order["supplier_id"]]["user_id"]})
+
+
+SCENARIOS: Dict[str, Callable[[Fixtures, random.Random], Call]] = {
+    "health": lambda fx, rng: Call("GET", "/health"),
+    "auth.login": lambda fx, rng: Call("POST", "/api/auth/login", json={
+        "email": fx.consumers[rng.choice(list(fx.consumers))]["email"], "password": BENCHMARK_PASSWORD,
+    }),
+    "auth.me": lambda fx, rng: Call("GET", "/api/auth/me", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "suppliers.list": lambda fx, rng: Call(
+        "GET", "/api/suppliers", _consumer_token(fx, rng.choice(list(fx.consumers)))),
+    "links.me.consumer": lambda fx, rng: Call(
+        "GET", "/api/links/me", _consumer_token(fx, rng.choice(list(fx.consumers)))),
+    "links.me.supplier": lambda fx, rng: Call(
+        "GET", "/api/links/me", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "links.pending": lambda fx, rng: Call(
+        "GET", "/api/links/pending", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "products.supplier_list": lambda fx, rng: Call(
+        "GET", "/api/supplier/products", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "products.consumer_catalog": lambda fx, rng: (lambda link: Call(
+        "GET", f"/api/suppliers/{link['supplier_id']}/products",
+        _consumer_token(fx, link["consumer_id"])))(_link(fx, rng)),
+    "products.create": _create_product,
+    "products.update": _update_product,
+    "orders.list.consumer": lambda fx, rng: Call(
+        "GET", "/api/orders", _consumer_token(fx, rng.choice(list(fx.consumers)))),
+    "orders.list.supplier": lambda fx, rng: Call(
+        "GET", "/api/orders", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "orders.get": lambda fx, rng: (lambda order: Call(
+        "GET", f"/api/orders/{order['id']}", _consumer_token(fx, order["consumer_id"])))(_order(fx, rng)),
+    "orders.create": _create_order,
+    "orders.update_status": _update_order,
+    "orders.bulk_status": _bulk_update_orders,
+    "orders.pick_list": lambda fx, rng: Call(
+        "GET", "/api/orders/pick-list", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "messages.list": lambda fx, rng: (lambda link: Call(
+        "GET", f"/api/messages/{link['id']}", _consumer_token(fx, link["consumer_id"])))(_link(fx, rng)),
+    "messages.send": lambda fx, rng: (lambda link: Call(
+        "POST", f"/api/messages/{link['id']}", _consumer_token(fx, link["consumer_id"]),
+        {"content": "benchmark"}))(_link(fx, rng)),
+    "complaints.list.supplier": lambda fx, rng: Call(
+        "GET", "/api/complaints", _owner_token(fx, rng.choice(list(fx.owners)))),
+    "complaints.update": _update_complaint,
+    "admin.metrics": lambda fx, rng: Call("GET", "/api/admin/metrics", headers={"X-Admin-Token": ADMIN_TOKEN}),
+}
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_scenario(client, name: str, fx: Fixtures, requests: int, concurrency: int, seed_value: int) -> dict:
+    rng = random.Random(f"{seed_value}:{name}")
+    calls = [SCENARIOS[name](fx, rng) for _ in range(requests)]
+    latencies, queries, errors = [], [], 0
+    queue = asyncio.Queue()
+    for call in calls:
+        queue.put_nowait(call)
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            call = queue.get_nowait()
+            headers = dict(call.headers or {})
+            if call.token:
+                headers["Authorization"] = f"Bearer {call.token}"
+            started = time.perf_counter()
+            response = await client.request(call.method, call.path, headers=headers, json=call.json)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+            if "x-db-queries" in response.headers:
+                queries.append(int(response.headers["x-db-queries"]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "db_queries_per_request": round(statistics.mean(queries), 2) if queries else None,
+    }
+
+
+async def run(args, config: DatasetConfig) -> dict:
+    import httpx
+    from app.main import app
+
+    started = time.perf_counter()
+    fx = seed(config)
+    seed_seconds = time.perf_counter() - started
+
+    names = [name for name in SCENARIOS if not args.only or any(name.startswith(p) for p in args.only)]
+    results = {}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=300
+    ) as client:
+        for name in names:
+            requests = args.login_requests if name == "auth.login" else args.requests
+            results[name] = await run_scenario(client, name, fx, requests, args.concurrency, config.seed)
+            print(f"{name}: {results[name]}", file=sys.stderr)
+
+    return {
+        "dataset": fx.config,
+        "seed_seconds": round(seed_seconds, 2),
+        "database": os.environ["DATABASE_URL"].split("@")[-1],
+        "db_async": os.environ.get("DB_ASYNC", "true"),
+        "concurrency": args.concurrency,
+        "endpoints": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL", "sqlite:///./benchmark.db"))
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=20, help="requests for auth.login (bcrypt bound)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--only", nargs="*", help="scenario name prefixes to run")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    for f in fields(DatasetConfig):
+        parser.add_argument(f"--{f.name.replace('_', '-')}", type=type(f.default), default=f.default)
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ["ADMIN_API_TOKEN"] = ADMIN_TOKEN
+    config = DatasetConfig(**{f.name: getattr(args, f.name) for f in fields(DatasetConfig)})
+
+    report = json.dumps(asyncio.run(run(args, config)), indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
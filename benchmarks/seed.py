@@ -0,0 +1,198 @@
+"""Reproducible benchmark dataset.
+
+``seed()`` drops and recreates every table at ``DATABASE_URL`` and fills it
+with a deterministic dataset (same ``--seed``, same rows). It returns the
+fixture ids and pre-issued access tokens the benchmark scenarios need.
+"""
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+
+@dataclass
+class DatasetConfig:
+    suppliers: int = 5
+    consumers: int = 50
+    links_per_consumer: int = 3
+    products_per_supplier: int = 200
+    orders_per_link: int = 10
+    items_per_order: int = 5
+    messages_per_link: int = 10
+    complaint_rate: float = 0.1
+    seed: int = 42
+
+
+@dataclass
+class Fixtures:
+    """Ids and tokens the scenarios sample from."""
+    config: dict
+    owners: Dict[int, dict] = field(default_factory=dict)
+    consumers: Dict[int, dict] = field(default_factory=dict)
+    links: List[dict] = field(default_factory=list)
+    products: Dict[int, List[int]] = field(default_factory=dict)  # active only
+    orders: List[dict] = field(default_factory=list)
+    complaints: List[dict] = field(default_factory=list)
+
+
+def _insert(db, model, rows: List[dict]) -> List[int]:
+    """Bulk insert ``rows`` and return their generated ids in input order."""
+    from sqlalchemy import insert
+
+    if not rows:
+        return []
+    result = db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+    return [row.id for row in result]
+
+
+def seed(config: DatasetConfig) -> Fixtures:
+    from app.core.security import create_access_token, get_password_hash
+    from app.db.rollups import rebuild
+    from app.db.session import Base, SessionLocal, engine
+    from app.models.models import (
+        AuditLog, Complaint, ComplaintStatus, Link, LinkStatus, Message,
+        Order, OrderItem, OrderStatus, Product, Supplier, User, UserRole
+    )
+
+    rng = random.Random(config.seed)
+    now = datetime.utcnow()
+    password_hash = get_password_hash(BENCHMARK_PASSWORD)
+    fixtures = Fixtures(config=asdict(config))
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        supplier_ids = _insert(db, Supplier, [
+            {"company_name": f"Supplier {i}", "is_active": True, "created_at": now, "updated_at": now}
+            for i in range(config.suppliers)
+        ])
+        owner_ids = _insert(db, User, [
+            {
+                "email": f"owner{i}@bench.example.com", "password_hash": password_hash,
+                "full_name": f"Owner {i}", "role": UserRole.OWNER, "supplier_id": supplier_id,
+                "created_at": now, "updated_at": now,
+            }
+            for i, supplier_id in enumerate(supplier_ids)
+        ])
+        for i, (supplier_id, owner_id) in enumerate(zip(supplier_ids, owner_ids)):
+            fixtures.owners[supplier_id] = {
+                "user_id": owner_id,
+                "email": f"owner{i}@bench.example.com",
+                "token": create_access_token({
+                    "sub": str(owner_id), "role": UserRole.OWNER.value, "supplier_id": supplier_id
+                }),
+            }
+
+        consumer_ids = _insert(db, User, [
+            {
+                "email": f"consumer{i}@bench.example.com", "password_hash": password_hash,
+                "full_name": f"Consumer {i}", "role": UserRole.CONSUMER,
+                "restaurant_name": f"Restaurant {i}", "created_at": now, "updated_at": now,
+            }
+            for i in range(config.consumers)
+        ])
+        for i, consumer_id in enumerate(consumer_ids):
+            fixtures.consumers[consumer_id] = {
+                "email": f"consumer{i}@bench.example.com",
+                "token": create_access_token({"sub": str(consumer_id), "role": UserRole.CONSUMER.value}),
+            }
+
+        product_rows = []
+        for supplier_id in supplier_ids:
+            for i in range(config.products_per_supplier):
+                product_rows.append({
+                    "supplier_id": supplier_id, "name": f"Product {supplier_id}-{i}",
+                    "description": f"Benchmark product {i} from supplier {supplier_id}",
+                    "unit": rng.choice(["kg", "l", "pack", "pcs"]),
+                    "price": Decimal(rng.randint(100, 10000)) / 100,
+                    "stock_quantity": rng.randint(1000, 100000), "min_order_quantity": 1,
+                    "is_active": rng.random() > 0.05, "created_at": now, "updated_at": now,
+                })
+        for row, product_id in zip(product_rows, _insert(db, Product, product_rows)):
+            row["id"] = product_id
+            if row["is_active"]:
+                fixtures.products.setdefault(row["supplier_id"], []).append(product_id)
+        prices = {row["id"]: row["price"] for row in product_rows}
+
+        link_pairs = []
+        for consumer_id in consumer_ids:
+            for supplier_id in rng.sample(supplier_ids, min(config.links_per_consumer, len(supplier_ids))):
+                link_pairs.append((supplier_id, consumer_id))
+        link_ids = _insert(db, Link, [
+            {
+                "supplier_id": supplier_id, "consumer_id": consumer_id,
+                "status": LinkStatus.APPROVED, "created_at": now, "updated_at": now,
+            }
+            for supplier_id, consumer_id in link_pairs
+        ])
+        for link_id, (supplier_id, consumer_id) in zip(link_ids, link_pairs):
+            fixtures.links.append({"id": link_id, "supplier_id": supplier_id, "consumer_id": consumer_id})
+
+        message_rows = []
+        for link in fixtures.links:
+            for i in range(config.messages_per_link):
+                sender_id = link["consumer_id"] if i % 2 == 0 else fixtures.owners[link["supplier_id"]]["user_id"]
+                message_rows.append({
+                    "link_id": link["id"], "sender_id": sender_id,
+                    "content": f"Message {i}", "created_at": now - timedelta(minutes=i),
+                })
+        _insert(db, Message, message_rows)
+
+        statuses = [OrderStatus.PENDING, OrderStatus.ACCEPTED, OrderStatus.COMPLETED, OrderStatus.REJECTED]
+        order_rows, order_items = [], []
+        for link in fixtures.links:
+            for _ in range(config.orders_per_link):
+                created_at = now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+                order_rows.append({
+                    "supplier_id": link["supplier_id"], "consumer_id": link["consumer_id"],
+                    "created_by_user_id": link["consumer_id"], "status": rng.choice(statuses),
+                    "created_at": created_at, "updated_at": created_at,
+                })
+                product_ids = fixtures.products[link["supplier_id"]]
+                chosen = rng.sample(product_ids, min(config.items_per_order, len(product_ids)))
+                items = [(product_id, rng.randint(1, 20)) for product_id in chosen]
+                order_items.append(items)
+                order_rows[-1].update(
+                    total_amount=sum(prices[product_id] * quantity for product_id, quantity in items),
+                    item_count=len(items),
+                )
+        order_ids = _insert(db, Order, order_rows)
+
+        item_rows = []
+        for order_id, items in zip(order_ids, order_items):
+            for product_id, quantity in items:
+                item_rows.append({
+                    "order_id": order_id, "product_id": product_id, "quantity": quantity,
+                    "unit_price": prices[product_id], "subtotal": prices[product_id] * quantity,
+                })
+        _insert(db, OrderItem, item_rows)
+
+        complaint_rows = []
+        for order_id, row in zip(order_ids, order_rows):
+            fixtures.orders.append({
+                "id": order_id, "supplier_id": row["supplier_id"],
+                "consumer_id": row["consumer_id"], "status": row["status"].value,
+            })
+            if rng.random() < config.complaint_rate:
+                complaint_rows.append({
+                    "order_id": order_id, "raised_by_user_id": row["consumer_id"],
+                    "status": ComplaintStatus.OPEN, "description": "Benchmark complaint",
+                    "created_at": now, "updated_at": now,
+                })
+        for complaint_id, row in zip(_insert(db, Complaint, complaint_rows), complaint_rows):
+            fixtures.complaints.append({"id": complaint_id, "order_id": row["order_id"]})
+
+        _insert(db, AuditLog, [
+            {"user_id": owner_id, "action": "SUPPLIER_REGISTERED", "entity_type": "SUPPLIER",
+             "entity_id": supplier_id, "created_at": now}
+            for supplier_id, owner_id in zip(supplier_ids, owner_ids)
+        ])
+        rebuild(db)
+        db.commit()
+    finally:
+        db.close()
+    return fixtures
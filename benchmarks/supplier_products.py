@@ -0,0 +1,104 @@
+"""Benchmark: GET /api/supplier/products page latency and size vs catalog size.
+
+Seeds one supplier with ``--products`` products (each with a ~1 KB
+description) and walks the first ``--pages`` pages for each sort key,
+full rows and with ``fields=name,price,stock_quantity``. Reports p50/p95
+page latency and bytes per page; both should stay flat as the catalog
+grows.
+
+Usage::
+
+    python -m benchmarks.supplier_products --products 200000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+DEFAULT_DATABASE = "sqlite:///./benchmark_supplier_products.db"
+CHUNK = 10000
+SORTS = ["id", "name", "-price", "stock_quantity", "-updated_at"]
+
+
+def seed_products(products: int) -> dict:
+    from sqlalchemy import insert
+    from app.db.session import engine
+    from app.models.models import Product
+    from benchmarks.seed import DatasetConfig, seed
+
+    fx = seed(DatasetConfig(
+        suppliers=1, consumers=0, links_per_consumer=0, products_per_supplier=0,
+        orders_per_link=0, messages_per_link=0,
+    ))
+    supplier_id = next(iter(fx.owners))
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        for start in range(0, products, CHUNK):
+            connection.execute(insert(Product), [
+                {
+                    "supplier_id": supplier_id, "sku": f"SKU-{n}", "name": f"product {rng.randint(0, products)}",
+                    "description": "lorem ipsum " * 85, "unit": "kg",
+                    "price": Decimal(rng.randint(100, 10000)) / 100, "stock_quantity": rng.randint(0, 1000),
+                    "min_order_quantity": 1, "is_active": True, "created_at": now,
+                    "updated_at": now - timedelta(seconds=rng.randint(0, 10 ** 7)),
+                }
+                for n in range(start, min(start + CHUNK, products))
+            ])
+    return {"token": fx.owners[supplier_id]["token"]}
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(args) -> dict:
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    fx = seed_products(args.products)
+    headers = {"Authorization": f"Bearer {fx['token']}"}
+    results = {}
+    with TestClient(app) as client:
+        for fields in (None, "name,price,stock_quantity"):
+            for sort in SORTS:
+                latencies, sizes, cursor = [], [], None
+                for _ in range(args.pages):
+                    params = {"sort": sort, "limit": args.limit}
+                    if fields:
+                        params["fields"] = fields
+                    if cursor:
+                        params["cursor"] = cursor
+                    t0 = time.perf_counter()
+                    response = client.get("/api/supplier/products", params=params, headers=headers)
+                    latencies.append(time.perf_counter() - t0)
+                    response.raise_for_status()
+                    sizes.append(len(response.content))
+                    cursor = response.headers["x-next-cursor"]
+                results[f"{sort} fields={fields or 'all'}"] = {
+                    "p50_ms": round(statistics.median(latencies) * 1000, 2),
+                    "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                    "bytes_per_page": int(statistics.mean(sizes)),
+                }
+    return {"products": args.products, "limit": args.limit, "pages": args.pages, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", DEFAULT_DATABASE)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
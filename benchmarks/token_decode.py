@@ -0,0 +1,57 @@
+"""Micro-benchmark: cold vs warm ``decode_access_token`` throughput.
+
+Usage::
+
+    python -m benchmarks.token_decode --tokens 1000 --rounds 20
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+
+from app.core.security import create_access_token, decode_access_token, token_cache  # noqa: E402
+
+
+def run(tokens: int, rounds: int) -> dict:
+    issued = [
+        create_access_token({"sub": str(i), "role": "CONSUMER"})
+        for i in range(tokens)
+    ]
+    
+    token_cache.clear()
+    started = time.perf_counter()
+    for token in issued:
+        decode_access_token(token)
+    cold_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for token in issued:
+            decode_access_token(token)
+    warm_seconds = time.perf_counter() - started
+    
+    cold_rate = tokens / cold_seconds
+    warm_rate = tokens * rounds / warm_seconds
+    return {
+        "tokens": tokens,
+        "rounds": rounds,
+        "cold_decodes_per_second": round(cold_rate),
+        "warm_decodes_per_second": round(warm_rate),
+        "speedup": round(warm_rate / cold_rate, 1),
+        "cache": token_cache.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.tokens, args.rounds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,65 @@
 // src/pages/catalog/CatalogPage.jsx
-import React, { useEffect, useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
 import api from "../../api/client.js";
 import { useAuth } from "../../context/AuthContext.jsx";
 
+const PAGE_SIZE = 50;
+
+// Consumer catalog kept across visits, per supplier: { id, name, etag, products, complete }.
+// Suppliers loaded to the end are revalidated with If-None-Match instead of refetched.
+const catalogCache = { userId: null, suppliers: {}, ifNoneMatch: null };
+
+function cachedCatalogProducts() {
+    return Object.values(catalogCache.suppliers).flatMap((supplier) =>
+        supplier.products.map((p) => ({
+            ...p,
+            supplier: { id: supplier.id, company_name: supplier.name },
+        }))
+    );
+}
+
+// One /api/catalog page into the cache; a page without a cursor starts a (re)load.
+async function fetchCatalogPage(cursor) {
+    if (!cursor) {
+        const complete = Object.values(catalogCache.suppliers).filter((supplier) => supplier.complete);
+        catalogCache.ifNoneMatch = complete.map((supplier) => supplier.etag).join(", ") || null;
+    }
+    const res = await api.get("/api/catalog", {
+        params: { limit: PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+        headers: catalogCache.ifNoneMatch ? { "If-None-Match": catalogCache.ifNoneMatch } : {},
+    });
+    const groups = Array.isArray(res.data) ? res.data : [];
+    const next = res.headers["x-next-cursor"] || null;
+
+    // The first page lists every linked supplier, so it also drops unlinked ones.
+    const held = catalogCache.suppliers;
+    const suppliers = cursor ? { ...held } : {};
+    groups.forEach((group) => {
+        const previous = held[group.supplier_id];
+        if (group.not_modified && previous) {
+            suppliers[group.supplier_id] = previous;
+            return;
+        }
+        suppliers[group.supplier_id] = {
+            id: group.supplier_id,
+            name: group.supplier_name,
+            etag: group.etag,
+            products: cursor && previous ? [...previous.products, ...group.products] : group.products,
+            complete: false,
+        };
+    });
+    // Products come ordered by supplier: every supplier before the last one on the page is done.
+    const withProducts = groups.filter((group) => group.products.length > 0);
+    const lastSupplierId = withProducts.length ? withProducts[withProducts.length - 1].supplier_id : null;
+    Object.values(suppliers).forEach((supplier) => {
+        if (!next || (lastSupplierId !== null && supplier.id < lastSupplierId)) {
+            supplier.complete = true;
+        }
+    });
+    catalogCache.suppliers = suppliers;
+    return next;
+}
+
 export default function CatalogPage() {
     const { user } = useAuth();
     const canEdit = user && ["OWNER", "MANAGER"].includes(user.role);
@@ -11,43 +68,28 @@ export default function CatalogPage() {
     const [loading, setLoading] = useState(true);
     const [modalOpen, setModalOpen] = useState(false);
     const [editingProduct, setEditingProduct] = useState(null);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const sentinelRef = useRef(null);
 
     async function loadProducts() {
         setLoading(true);
         try {
             if (canEdit) {
-                // Supplier: load own products
-                const res = await api.get("/api/supplier/products");
+                // Supplier: load own products, first page (sorted by name)
+                const res = await api.get("/api/supplier/products", {
+                    params: { limit: PAGE_SIZE, sort: "name" },
+                });
                 setProducts(Array.isArray(res.data) ? res.data : []);
+                setNextCursor(res.headers["x-next-cursor"] || null);
             } else {
-                // Consumer: load products from all linked suppliers
-                // 1. Get my links
-                const linksRes = await api.get("/api/links/me");
-                const links = Array.isArray(linksRes.data) ? linksRes.data : [];
-                
-                // 2. Filter approved links
-                const approvedLinks = links.filter(l => l.status === "APPROVED");
-                
-                // 3. Fetch products for each supplier
-                const productPromises = approvedLinks.map(async (link) => {
-                    try {
-                        const pRes = await api.get(`/api/suppliers/${link.supplier_id}/products`);
-                        const products = Array.isArray(pRes.data) ? pRes.data : [];
-                        // Attach supplier info to each product for display
-                        return products.map(p => ({
-                            ...p,
-                            supplier: link.supplier // link.supplier comes from LinkWithSupplierResponse
-                        }));
-                    } catch (err) {
-                        console.warn(`Failed to load products for supplier ${link.supplier_id}`, err);
-                        return [];
-                    }
-                });
-                
-                const results = await Promise.all(productPromises);
-                // Flatten array
-                const allProducts = results.flat();
-                setProducts(allProducts);
+                // Consumer: first page only; the rest loads on scroll
+                if (catalogCache.userId !== user.id) {
+                    Object.assign(catalogCache, { userId: user.id, suppliers: {}, ifNoneMatch: null });
+                }
+                const next = await fetchCatalogPage(null);
+                setProducts(cachedCatalogProducts());
+                setNextCursor(next);
             }
         } catch (err) {
             console.error("Failed to load products", err);
@@ -57,10 +99,46 @@ export default function CatalogPage() {
     }
 
 
+    // ---------- INFINITE SCROLL (keyset cursor from X-Next-Cursor) ----------
+    async function loadMoreProducts() {
+        if (!nextCursor || loadingMore) return;
+        setLoadingMore(true);
+        try {
+            if (canEdit) {
+                const res = await api.get("/api/supplier/products", {
+                    params: { limit: PAGE_SIZE, sort: "name", cursor: nextCursor },
+                });
+                const page = Array.isArray(res.data) ? res.data : [];
+                setProducts((prev) => [...prev, ...page]);
+                setNextCursor(res.headers["x-next-cursor"] || null);
+            } else {
+                const next = await fetchCatalogPage(nextCursor);
+                setProducts(cachedCatalogProducts());
+                setNextCursor(next);
+            }
+        } catch (err) {
+            console.error("Failed to load more products", err);
+        } finally {
+            setLoadingMore(false);
+        }
+    }
+
     useEffect(() => {
         loadProducts();
     }, []);
 
+    useEffect(() => {
+        const sentinel = sentinelRef.current;
+        if (!sentinel || !nextCursor) return undefined;
+        const observer = new IntersectionObserver((entries) => {
+            if (entries[0].isIntersecting) {
+                loadMoreProducts();
+            }
+        });
+        observer.observe(sentinel);
+        return () => observer.disconnect();
+    }, [nextCursor, loadingMore]);
+
     const openCreate = () => {
         setEditingProduct(null);
         setModalOpen(true);
@@ -103,6 +181,15 @@ export default function CatalogPage() {
             <div className="flex justify-between items-center">
                 <h1 className="text-2xl font-bold">Product Catalog</h1>
 
+                {!canEdit && (
+                    <button
+                        onClick={loadProducts}
+                        className="px-4 py-2 text-sm font-medium rounded-lg text-gray-600 hover:bg-gray-100 transition-colors"
+                    >
+                        Refresh
+                    </button>
+                )}
+
                 {canEdit && (
                     <button
                         onClick={openCreate}
@@ -182,6 +269,11 @@ export default function CatalogPage() {
                             ))}
                         </tbody>
                     </table>
+                    {nextCursor && (
+                        <div ref={sentinelRef} className="px-6 py-4 text-center text-sm text-gray-500">
+                            {loadingMore ? "Loading more products..." : ""}
+                        </div>
+                    )}
                 </div>
             )}
 
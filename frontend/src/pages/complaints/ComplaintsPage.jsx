@@ -2,6 +2,8 @@ import React, { useEffect, useState } from "react";
 import api from "../../api/client.js";
 import { useAuth } from "../../context/AuthContext.jsx";
 
+const ORDER_PAGE_SIZE = 50;
+
 export default function ComplaintsPage() {
     const { user } = useAuth();
     const isConsumer = user?.role === "CONSUMER";
@@ -205,28 +207,36 @@ function CreateComplaintModal({ onClose, onCreated }) {
     const [saving, setSaving] = useState(false);
     const [orders, setOrders] = useState([]);
     const [loadingOrders, setLoadingOrders] = useState(true);
+    const [olderCursor, setOlderCursor] = useState(null);
+    const [loadingOlder, setLoadingOlder] = useState(false);
+
+    // /api/orders is paginated (newest first): show one page, older ones on request
+    const fetchOrders = async (before) => {
+        const res = await api.get("/api/orders", {
+            params: before ? { limit: ORDER_PAGE_SIZE, before } : { limit: ORDER_PAGE_SIZE },
+        });
+        const page = Array.isArray(res.data) ? res.data : [];
+        setOrders((prev) => (before ? [...prev, ...page] : page));
+        setOlderCursor(res.headers["x-next-cursor"] || null);
+    };
 
     useEffect(() => {
-        const fetchOrders = async () => {
-            try {
-                const res = await api.get("/api/orders");
-                if (Array.isArray(res.data)) {
-                    // Filter out orders that already have complaints? 
-                    // For now, let's show all, or maybe only those without complaints if the backend restricts it.
-                    // Assuming we want to let them choose from any order.
-                    // Sorting by date descending is usually better.
-                    const sorted = res.data.sort((a, b) => new Date(b.created_at) - new Date(a.created_at));
-                    setOrders(sorted);
-                }
-            } catch (err) {
-                console.error("Failed to load orders", err);
-            } finally {
-                setLoadingOrders(false);
-            }
-        };
-        fetchOrders();
+        fetchOrders(null)
+            .catch((err) => console.error("Failed to load orders", err))
+            .finally(() => setLoadingOrders(false));
     }, []);
 
+    const loadOlderOrders = async () => {
+        setLoadingOlder(true);
+        try {
+            await fetchOrders(olderCursor);
+        } catch (err) {
+            console.error("Failed to load older orders", err);
+        } finally {
+            setLoadingOlder(false);
+        }
+    };
+
     const canSave = orderId && description.trim().length > 0;
 
     const submit = async () => {
@@ -273,6 +283,16 @@ function CreateComplaintModal({ onClose, onCreated }) {
                                 ))}
                             </select>
                         )}
+                        {olderCursor && (
+                            <button
+                                type="button"
+                                className="text-xs font-medium text-primary-700 hover:underline disabled:opacity-50"
+                                onClick={loadOlderOrders}
+                                disabled={loadingOlder}
+                            >
+                                {loadingOlder ? "Loading..." : "Load older orders"}
+                            </button>
+                        )}
                     </div>
 
                     <div className="space-y-1">
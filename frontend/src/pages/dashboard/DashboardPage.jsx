@@ -9,27 +9,32 @@ export default function DashboardPage() {
 
   const [data, setData] = useState({
     orders: [],
+    orderCounts: { total: 0, by_status: {} },
     links: [],
     complaints: [],
-    products: [],
+    productCounts: { total: 0, active: 0 },
   });
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const loadData = async () => {
       try {
-        const [ordersRes, linksRes, complaintsRes, productsRes] = await Promise.allSettled([
-          api.get("/api/orders"),
+        const [ordersRes, orderCountsRes, linksRes, complaintsRes, productCountsRes] = await Promise.allSettled([
+          // /api/orders is paginated: fetch the recent few, and the counts separately
+          api.get("/api/orders", { params: { limit: 5 } }),
+          api.get("/api/orders/summary"),
           isSupplier ? api.get("/api/links/me") : api.get("/api/links/me"), // Adjust endpoint if needed
           api.get("/api/complaints"),
-          isSupplier ? api.get("/api/supplier/products") : Promise.resolve({ data: [] }),
+          // /api/supplier/products is paginated too
+          isSupplier ? api.get("/api/supplier/products/summary") : Promise.resolve({ data: { total: 0, active: 0 } }),
         ]);
 
         setData({
           orders: ordersRes.status === "fulfilled" && Array.isArray(ordersRes.value.data) ? ordersRes.value.data : [],
+          orderCounts: orderCountsRes.status === "fulfilled" ? orderCountsRes.value.data : { total: 0, by_status: {} },
           links: linksRes.status === "fulfilled" && Array.isArray(linksRes.value.data) ? linksRes.value.data : [],
           complaints: complaintsRes.status === "fulfilled" && Array.isArray(complaintsRes.value.data) ? complaintsRes.value.data : [],
-          products: productsRes.status === "fulfilled" && Array.isArray(productsRes.value.data) ? productsRes.value.data : [],
+          productCounts: productCountsRes.status === "fulfilled" ? productCountsRes.value.data : { total: 0, active: 0 },
         });
       } catch (err) {
         console.error("Failed to load dashboard data", err);
@@ -52,10 +57,10 @@ export default function DashboardPage() {
   // --- Derived Stats ---
 
   // Orders
-  const totalOrders = data.orders.length;
-  const newOrdersCount = data.orders.filter(o => o.status === "PENDING").length;
-  const inProgressOrdersCount = data.orders.filter(o => o.status === "ACCEPTED").length;
-  const recentOrders = [...data.orders].sort((a, b) => new Date(b.created_at) - new Date(a.created_at)).slice(0, 5);
+  const totalOrders = data.orderCounts.total;
+  const newOrdersCount = data.orderCounts.by_status.PENDING || 0;
+  const inProgressOrdersCount = data.orderCounts.by_status.ACCEPTED || 0;
+  const recentOrders = data.orders; // newest first
 
   // Links
   const totalLinks = data.links.length;
@@ -67,7 +72,8 @@ export default function DashboardPage() {
   const openComplaintsCount = data.complaints.filter(c => c.status === "OPEN").length;
 
   // Products
-  const totalProducts = data.products.length;
+  const totalProducts = data.productCounts.total;
+  const activeProductsCount = data.productCounts.active;
 
   return (
     <div className="p-8 space-y-8 bg-gray-50/50 min-h-screen">
@@ -103,7 +109,7 @@ export default function DashboardPage() {
           <SummaryCard
             title="Catalog products"
             value={totalProducts}
-            subtext="Active in catalog"
+            subtext={`${activeProductsCount} active in catalog`}
             linkTo="/catalog"
             linkText="Manage catalog →"
           />
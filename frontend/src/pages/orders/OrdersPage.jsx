@@ -1,14 +1,19 @@
 // frontend/src/pages/orders/OrdersPage.jsx
-import React, { useEffect, useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import api from "../../api/client.js";
 import { useAuth } from "../../context/AuthContext.jsx";
 
+const PAGE_SIZE = 50;
+
 export default function OrdersPage() {
     const { user } = useAuth();
     const navigate = useNavigate();
     const [orders, setOrders] = useState([]);
     const [loading, setLoading] = useState(true);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const sentinelRef = useRef(null);
 
     // --- simple create-order form state (CONSUMER only) ---
     const [supplierId, setSupplierId] = useState("");
@@ -24,10 +29,11 @@ export default function OrdersPage() {
         setLoading(true);
         try {
             const res = await api.get("/api/orders", {
-                // if you want only PENDING, uncomment:
-                // params: { status: "PENDING" },
+                params: { limit: PAGE_SIZE },
+                // if you want only PENDING, add: status: "PENDING"
             });
             setOrders(Array.isArray(res.data) ? res.data : []);
+            setNextCursor(res.headers["x-next-cursor"] || null);
         } catch (err) {
             console.error("Failed to load orders:", err.response?.data || err);
         } finally {
@@ -35,6 +41,36 @@ export default function OrdersPage() {
         }
     }
 
+    // ---------- INFINITE SCROLL (keyset cursor from X-Next-Cursor) ----------
+    async function loadMoreOrders() {
+        if (!nextCursor || loadingMore) return;
+        setLoadingMore(true);
+        try {
+            const res = await api.get("/api/orders", {
+                params: { limit: PAGE_SIZE, before: nextCursor },
+            });
+            const page = Array.isArray(res.data) ? res.data : [];
+            setOrders((prev) => [...prev, ...page]);
+            setNextCursor(res.headers["x-next-cursor"] || null);
+        } catch (err) {
+            console.error("Failed to load more orders:", err.response?.data || err);
+        } finally {
+            setLoadingMore(false);
+        }
+    }
+
+    useEffect(() => {
+        const sentinel = sentinelRef.current;
+        if (!sentinel || !nextCursor) return undefined;
+        const observer = new IntersectionObserver((entries) => {
+            if (entries[0].isIntersecting) {
+                loadMoreOrders();
+            }
+        });
+        observer.observe(sentinel);
+        return () => observer.disconnect();
+    }, [nextCursor, loadingMore]);
+
     async function loadSuppliers() {
         try {
             // Only load suppliers we have an APPROVED link with
@@ -231,7 +267,7 @@ export default function OrdersPage() {
                         </thead>
                         <tbody className="divide-y divide-gray-50">
                             {orders.map((o) => {
-                                const total = o.items?.reduce((acc, item) => acc + (Number(item.subtotal) || 0), 0) || 0;
+                                const total = Number(o.total_amount) || 0;
                                 return (
                                     <tr key={o.id} className="hover:bg-gray-50/50 transition-colors">
                                         <td className="px-6 py-4 font-medium text-gray-900">{o.id}</td>
@@ -271,6 +307,11 @@ export default function OrdersPage() {
                             })}
                         </tbody>
                     </table>
+                    {nextCursor && (
+                        <div ref={sentinelRef} className="px-6 py-4 text-center text-sm text-gray-500">
+                            {loadingMore ? "Loading more orders..." : ""}
+                        </div>
+                    )}
                 </div>
             )}
         </div>